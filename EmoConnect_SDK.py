@@ -1,17 +1,15 @@
 import asyncio
-import time
 import requests
-import re
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication, QMainWindow, QPushButton, QLabel, QListWidget, QVBoxLayout, QHBoxLayout, QWidget, QMessageBox
 from qasync import QEventLoop, asyncSlot
-from bleak import BleakScanner, BleakClient
-from scipy.interpolate import interp1d
-import numpy as np
 import emoconnect_pro as ep
 import license_pro as lp
-import emoconnect_utils as eu
+import emoconnect_session as es
+from emoconnect_transport import EmulatedTransport
+from emoconnect_worker import ProcessingWorker
+from emoconnect_qt import SessionSignals
 import csv
 
 class BleController(QMainWindow):
@@ -28,18 +26,18 @@ class BleController(QMainWindow):
         self.data_queue = []
         self.address = ''
         self.device_id = ''
-        self.client = None
-
-        # 데이터 및 타이밍을 위한 버퍼
-        self.ppg_buffer = []
-        self.acc_buffer = []
-        self.gyro_buffer = []
-        self.mag_buffer = []
-        self.last_timestamp = time.time()
+        # BLE 연결, 데이터 수신 및 1초 주기 처리는 SensorSession이 담당
+        self.session = None
+        # 신호 처리는 작업 스레드에서 수행하고 결과는 Qt 시그널로 UI 스레드에 전달
+        self.worker = ProcessingWorker(maxsize=4, policy='coalesce').start()
+        self.signals = SessionSignals(self.worker)
+        self.signals.result_ready.connect(self.on_session_result)
+        self.signals.metrics_updated.connect(self.on_worker_metrics)
 
         # 타이머 설정
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.generate_test_data)
+        self.test_emulator = EmulatedTransport()
 
         # UI 구성
         self.device_list = QListWidget()
@@ -99,11 +97,9 @@ class BleController(QMainWindow):
             QMessageBox.critical(self, "스캔 오류", "장치 스캔 중 오류가 발생했습니다.")
 
     async def scan_devices(self):
-        devices = await BleakScanner.discover()
-        for device in devices:
-            if device.name and (device.name.startswith("VitalTrack") or device.name.startswith("EmoConnect")):
-                # 예: "EmoConnect v1.0(A107) - AA:BB:CC:DD:EE:FF"
-                self.device_list.addItem(f"{device.name} - {device.address}")
+        for name, address in await es.scan_devices():
+            # 예: "EmoConnect v1.0(A107) - AA:BB:CC:DD:EE:FF"
+            self.device_list.addItem(f"{name} - {address}")
 
     @asyncSlot()
     async def connect_to_device(self):
@@ -111,12 +107,8 @@ class BleController(QMainWindow):
         if selected_item:
             # 선택된 항목에서 device 문자열과 address 분리
             full_device_str, self.address = selected_item.text().split(" - ")
-            # 정규식을 사용하여 괄호 안의 내용을 추출 (예: "A107")
-            match = re.search(r'\((.*?)\)', full_device_str)
-            if match:
-                self.device_id = match.group(1)
-            else:
-                self.device_id = full_device_str
+            # 괄호 안의 내용을 장치 ID로 사용 (예: "A107")
+            self.device_id = es.parse_device_id(full_device_str)
 
             try:
                 await self.connect_and_receive_data(self.address)
@@ -129,6 +121,8 @@ class BleController(QMainWindow):
                 else:
                     self.hr_analyzer = None
                     print("Pro 기능 미활성화, 기본 기능만 사용됩니다.")
+                if self.session:
+                    self.session.hr_analyzer = self.hr_analyzer
             except Exception as e:
                 print(f"Error connecting to device: {e}")
                 QMessageBox.critical(self, "연결 오류", "장치 연결 중 오류가 발생했습니다.")
@@ -137,19 +131,19 @@ class BleController(QMainWindow):
 
     async def connect_and_receive_data(self, address):
         try:
-            self.client = BleakClient(address)
-            await self.client.connect()
+            self.session = es.SensorSession(address, device_id=self.device_id, worker=self.worker)
+            self.signals.attach(self.session)
+            await self.session.connect()
             QMessageBox.information(self, "연결 성공", f"{address}에 성공적으로 연결되었습니다.")
             self.disable_button_state(False)
             self.device_label.setText(f'연결된 장비: {self.device_id} {self.address}')
-            await self.client.start_notify(eu.UUIDs().get_READ_PPG_CHAR(), self.notification_handler)
         except Exception as e:
             print(f"Error connecting to {address}: {e}")
 
     @asyncSlot()
     async def disconnect_from_device(self):
-        if self.client and self.client.is_connected:
-            await self.client.disconnect()
+        if self.session and self.session.is_connected:
+            await self.session.disconnect()
             self.device_label.setText('연결된 장비: 없음')
             self.disable_button_state(True)
             self.result_list.clear()
@@ -158,95 +152,23 @@ class BleController(QMainWindow):
         else:
             QMessageBox.warning(self, "연결 해제 오류", "현재 연결된 장치가 없습니다.")
 
-    def notification_handler(self, sender, data):
-        parser = eu.DataParser()
-        try:
-            parsed_data = parser.parse_data(bytes(data))
-        except Exception as e:
-            print(f"Error parsing data: {e}")
-            return
-
-        for item in parsed_data:
-            if not all(key in item for key in ['ppg', 'acc', 'gyro', 'mag']):
-                continue
-
-            self.ppg_buffer.append(item['ppg'])
-            self.acc_buffer.append(item['acc'])
-            self.gyro_buffer.append(item['gyro'])
-            self.mag_buffer.append(item['mag'])
-
-        current_timestamp = time.time()
-        if current_timestamp - self.last_timestamp >= 1.0:
-            self.process_and_print_data()
-            self.last_timestamp = current_timestamp
-
-    def process_and_print_data(self):
-        def interpolate_data(buffer, num_points=50):
-            buffer = np.array(buffer)
-            if len(buffer) < 2:
-                shape = (num_points,) + buffer.shape[1:] if buffer.ndim > 1 else (num_points,)
-                result = np.tile(buffer[0], shape) if len(buffer) > 0 else np.zeros(shape)
-                return np.round(result, decimals=3)
-            x = np.linspace(0, len(buffer) - 1, num=len(buffer))
-            f = interp1d(x, buffer, kind='linear', axis=0, fill_value="extrapolate")
-            x_new = np.linspace(0, len(buffer) - 1, num=num_points)
-            result = f(x_new)
-            return np.round(result, decimals=3)
-
-        if len(self.ppg_buffer) >= 10:
-            try:
-                ppg_interp = interpolate_data(self.ppg_buffer, 50).tolist()
-            except Exception as e:
-                print(f"PPG interpolation error: {e}")
-                ppg_interp = [0] * 50
-
-            try:
-                acc_interp = interpolate_data(self.acc_buffer, 50).tolist()
-            except Exception as e:
-                print(f"ACC interpolation error: {e}")
-                acc_interp = [[0, 0, 0]] * 50
-
-            try:
-                gyro_interp = interpolate_data(self.gyro_buffer, 50).tolist()
-            except Exception as e:
-                print(f"Gyro interpolation error: {e}")
-                gyro_interp = [[0, 0, 0]] * 50
-
-            try:
-                mag_interp = interpolate_data(self.mag_buffer, 50).tolist()
-            except Exception as e:
-                print(f"Mag interpolation error: {e}")
-                mag_interp = [[0, 0, 0]] * 50
-        else:
-            ppg_interp = [0] * 50
-            acc_interp = [[0, 0, 0]] * 50
-            gyro_interp = [[0, 0, 0]] * 50
-            mag_interp = [[0, 0, 0]] * 50
-
-        result = {
-            "ppg": ppg_interp,
-            "acc": acc_interp,
-            "gyro": gyro_interp,
-            "mag": mag_interp
-        }
-
-        if self.hr_analyzer:
-            # 심박수 값과 필터 리스트 업데이트
-            hr_value, filter_list = self.hr_analyzer.update_hr(ppg_interp, acc_interp)
-            print(f"Heart Rate: {hr_value:.2f}")
-            print(f"Filter List: {filter_list}")
+    def on_session_result(self, result):
+        """SensorSession의 1초 주기 처리 결과를 출력합니다."""
+        if result['hr'] is not None:
+            print(f"Heart Rate: {result['hr']:.2f}")
+            print(f"Filter List: {result['filtered_ppg']}")
             self.update_data_display("데이터 수집 완료. 터미널을 확인해주세요. 현재 Pro기능이 활성화 되었습니다. ")
-
-
         else:
             self.update_data_display("데이터 수집 완료. 터미널을 확인해주세요.")
 
-        self.ppg_buffer.clear()
-        self.acc_buffer.clear()
-        self.gyro_buffer.clear()
-        self.mag_buffer.clear()
+        print({name: result[name] for name in ('ppg', 'acc', 'gyro', 'mag')})
 
-        print(result)
+    def on_worker_metrics(self, metrics):
+        """작업 스레드 백프레셔 지표를 주기적으로 출력합니다."""
+        print(f"[Worker] processed={metrics['processed']} dropped={metrics['dropped']} "
+              f"coalesced={metrics['coalesced']} queue={metrics['queue_depth']}/{self.worker.maxsize} "
+              f"wait_p95={metrics['queue_wait_p95'] * 1000:.1f}ms "
+              f"handler_p95={metrics.get('handler_p95', 0.0) * 1000:.2f}ms")
 
     def disable_button_state(self, trigger):
         self.start_button.setDisabled(trigger)
@@ -258,22 +180,15 @@ class BleController(QMainWindow):
             self.result_list.takeItem(0)
 
     def generate_test_data(self):
-        import struct
-        import random
-        random_float = random.uniform(0.0, 100.0)
-        packed_data = struct.pack('f', random_float)
-        self.notification_handler(None, packed_data)
+        # 테스트 데이터: 에뮬레이터가 만든 유효한 20바이트 프레임을 세션에 직접 전달
+        if self.session:
+            self.session.notification_handler(None, self.test_emulator.next_notification())
 
     @asyncSlot()
     async def start_measure(self):
-        if self.client and self.client.is_connected:
+        if self.session and self.session.is_connected:
             try:
-                await self.client.write_gatt_char(eu.UUIDs().get_WRITE_UART_CHAR(), b"\nset POWER_1V8 1\n")
-                await asyncio.sleep(0.1)
-                await self.client.write_gatt_char(eu.UUIDs().get_WRITE_UART_CHAR(), b"\nset ppg_enable 1\n")
-                await asyncio.sleep(0.1)
-                await self.client.write_gatt_char(eu.UUIDs().get_WRITE_UART_CHAR(), b"\nsetup ppg\n")
-                await asyncio.sleep(0.1)
+                await self.session.start_measure()
                 print("Message sent to device.")
             except Exception as e:
                 print(f"Failed to send message: {e}")
@@ -282,17 +197,16 @@ class BleController(QMainWindow):
 
     @asyncSlot()
     async def stop_measure(self):
-        if self.client and self.client.is_connected:
-            await self.client.write_gatt_char(eu.UUIDs().get_WRITE_UART_CHAR(), b"\nset ppg_enable 0\n")
-            await asyncio.sleep(0.1)
-            await self.client.write_gatt_char(eu.UUIDs().get_WRITE_UART_CHAR(), b"\nsetup ppg\n")
+        if self.session and self.session.is_connected:
+            await self.session.stop_measure()
             self.timer.stop()
         else:
             print("Connect device first.")
 
     def closeEvent(self, event):
-        if self.client and self.client.is_connected:
-            asyncio.run(self.client.disconnect())
+        if self.session and self.session.is_connected:
+            asyncio.run(self.session.disconnect())
+        self.worker.stop(timeout=1.0)
         event.accept()
 
 if __name__ == "__main__":
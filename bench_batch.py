@@ -0,0 +1,37 @@
+# bench_batch.py
+# 에뮬레이터로 만든 세션 기록들을 프로세스 수를 바꿔 가며 일괄 분석하여 처리량(세션/분)과 확장성을 측정합니다.
+import os
+import sys
+import tempfile
+
+from emoconnect_batch import analyze_sessions
+from emoconnect_recorder import SessionRecorder
+from emoconnect_transport import EmulatedTransport
+
+
+def make_sessions(directory, count, minutes):
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"session_{i:03d}.emorec")
+        emulator = EmulatedTransport(heart_rate=60.0 + i % 60, motion=(i % 5) * 0.1, seed=i)
+        with SessionRecorder(path) as recorder:
+            for n, payload in enumerate(emulator.generate(int(minutes * 600))):
+                recorder.record(payload, timestamp=recorder.start_monotonic + n * 0.1)
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    minutes = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_sessions(directory, count, minutes)
+        print(f"{count} sessions x {minutes:.0f} min")
+        baseline = None
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            _, sessions_per_minute = analyze_sessions(paths, workers=workers)
+            baseline = baseline or sessions_per_minute
+            print(f"workers={workers:3d}  {sessions_per_minute:8.1f} sessions/min  "
+                  f"speedup {sessions_per_minute / baseline:5.2f}x")
+            workers *= 2
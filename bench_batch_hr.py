@@ -0,0 +1,37 @@
+# bench_batch_hr.py
+# 장치 N대의 1초 주기 HR 분석: 장치별 HeartRateAnalyzer.update() 반복과 BatchHeartRateAnalyzer 일괄 처리 비교
+import time
+
+from emoconnect_pro import BatchHeartRateAnalyzer, HeartRateAnalyzer
+from test_emoconnect_pro import make_stream
+
+SECONDS = 20
+
+
+def run_single(streams):
+    analyzers = [HeartRateAnalyzer(cal_hr_time=1) for _ in streams]
+    started = time.perf_counter()
+    for second in range(SECONDS):
+        for analyzer, stream in zip(analyzers, streams):
+            analyzer.update(*stream[second])
+    return time.perf_counter() - started
+
+
+def run_batch(streams):
+    analyzers = [HeartRateAnalyzer(cal_hr_time=1) for _ in streams]
+    batch = BatchHeartRateAnalyzer()
+    started = time.perf_counter()
+    for second in range(SECONDS):
+        windows = [stream[second] for stream in streams]
+        batch.update(analyzers, [w[0] for w in windows], [w[1] for w in windows])
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    print(f"{'devices':>7s} {'single us/dev':>14s} {'batch us/dev':>13s} {'speedup':>8s} {'devices/core':>13s}")
+    for devices in (1, 16, 64, 256, 512):
+        streams = [make_stream(seed, seconds=SECONDS) for seed in range(devices)]
+        single = run_single(streams) / (SECONDS * devices)
+        batch = run_batch(streams) / (SECONDS * devices)
+        # 1초 주기 기준 코어 하나가 감당할 수 있는 장치 수 (분석만)
+        print(f"{devices:7d} {single * 1e6:14.1f} {batch * 1e6:13.1f} {single / batch:7.2f}x {1 / batch:13.0f}")
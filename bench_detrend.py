@@ -0,0 +1,17 @@
+# bench_detrend.py
+# 기존 정규방정식 기반 추세 제거와 DetrendEngine(캐시된 연산자 행렬-벡터 곱)의 처리 시간 비교
+import timeit
+
+from emoconnect_pro import DetrendEngine, PolynomialDetrendProcessor
+from test_emoconnect_pro import legacy_detrend, make_ppg
+
+if __name__ == "__main__":
+    ppg = make_ppg(0)
+    for order in (2, 5, 7, 25):
+        number = 500
+        legacy = timeit.timeit(lambda: legacy_detrend(ppg, 100, order), number=number) / number
+        processor = timeit.timeit(lambda: PolynomialDetrendProcessor(ppg, 100, 10, order).process(),
+                                  number=number) / number
+        engine = timeit.timeit(lambda: DetrendEngine.detrend(ppg, order), number=number) / number
+        print(f"order={order:2d}  legacy={legacy * 1e6:8.1f}us  process()={processor * 1e6:6.1f}us "
+              f"({legacy / processor:5.1f}x)  DetrendEngine.detrend={engine * 1e6:6.1f}us ({legacy / engine:5.1f}x)")
@@ -0,0 +1,87 @@
+# bench_estimators.py
+# 심박수 추정 백엔드 비교: 피크 간격(peak) / Welch 스펙트럼(spectral) / 가속도 스펙트럼 차감(spectral-acc)
+# 기록 파일을 인수로 주면 그 세션들을, 없으면 정답 심박수를 아는 합성 세션을 기록하여 재분석합니다.
+#   python bench_estimators.py                    # 합성 세션 (안정 / 주기적 움직임), 정답 대비 평균 절대 오차
+#   python bench_estimators.py recordings/*.emorec  # 기록 세션, peak 백엔드 대비 평균 절대 차이
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from emoconnect_batch import analyze_session
+from emoconnect_recorder import SessionRecorder
+from emoconnect_transport import EmulatedTransport, Recording
+
+SECONDS = 90
+HEART_RATE = 130.0
+MOTION_START = 20  # 이 시점(초)부터 주기적인 움직임 (cal_hr_time 안정화 이후)
+# (이름, estimator, analyze_session 인자)
+BACKENDS = [
+    ("peak", "peak", dict(window_size=100)),
+    ("peak (8s)", "peak", dict(window_size=400)),
+    ("spectral (8s)", "spectral", dict(window_size=400)),
+    ("spectral-acc (8s)", "spectral-acc", dict(window_size=400)),
+]
+
+
+def synthetic_recording(seed, cadence, artifact):
+    """심박 HEART_RATE bpm PPG에 MOTION_START초부터 cadence(Hz) 주기의 움직임 잡음과 같은 주기의 가속도를 더한 기록"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(SECONDS * 50) / 50
+    moving = t >= MOTION_START
+    swing = np.sin(2 * np.pi * cadence * t) * moving
+    ppg = (30000 + 1500 * np.sin(2 * np.pi * HEART_RATE / 60 * t) + 300 * np.sin(2 * np.pi * 0.25 * t)
+           + artifact * swing + rng.normal(0, 30, len(t)))
+    acc = rng.normal(0, 1, (len(t), 3)) * np.where(moving, 1.0, 0.05)[:, None]
+    acc[:, 0] += 6.0 * swing
+    acc[:, 2] += 9.81
+    return Recording(ppg, acc)
+
+
+def record(path, recording):
+    emulator = EmulatedTransport(recording=recording, battery_interval=None)
+    with SessionRecorder(path) as recorder:
+        for i, payload in enumerate(emulator.generate(SECONDS * 10)):
+            recorder.record(payload, timestamp=recorder.start_monotonic + i * 0.1)
+    return path
+
+
+def run(paths, reference=None):
+    """
+    백엔드별 (평균 절대 오차, 장치 1대 신호 1초당 분석 CPU us)를 출력합니다.
+    reference: (세션 인덱스, 결과 시각 배열) -> 정답 HR 배열 (0은 평가 제외), 생략 시 peak 백엔드 결과
+    """
+    if reference is None:
+        baseline = [np.array([row[1] for row in analyze_session(path, cal_hr_time=5)['rows']]) for path in paths]
+
+        def reference(index, times):
+            return baseline[index]
+    for name, estimator, kwargs in BACKENDS:
+        errors, cpu, seconds = [], 0.0, 0.0
+        for index, path in enumerate(paths):
+            summary = analyze_session(path, cal_hr_time=5, estimator=estimator, **kwargs)
+            times = np.array([row[0] for row in summary['rows']])
+            hr = np.array([row[1] for row in summary['rows']])
+            target = reference(index, times)[:len(hr)]
+            valid = (hr[:len(target)] > 0) & (target > 0)
+            errors.append(np.abs(hr[:len(target)][valid] - target[valid]))
+            cpu += summary['analysis_cpu']
+            seconds += summary['seconds']
+        error = np.concatenate(errors)
+        print(f"{name:>18s} {error.mean() if error.size else float('nan'):10.1f} {cpu / seconds * 1e6:14.1f}")
+
+
+if __name__ == "__main__":
+    label = "MAE vs peak" if sys.argv[1:] else "MAE vs truth"
+    print(f"{'backend':>18s} {label:>10s} {'cpu us/dev/s':>14s}")
+    if sys.argv[1:]:
+        run(sys.argv[1:])
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            for title, cadence, artifact in (("motion only", 1.8, 0.0), ("motion + PPG artifact", 1.8, 2500.0)):
+                print(f"-- {title}")
+                paths = [record(os.path.join(directory, f"{int(artifact)}_{seed}.emorec"),
+                                synthetic_recording(seed, cadence, artifact)) for seed in range(4)]
+                # 움직임 잡음 이후 구간만 평가 (안정화 전 0 제외)
+                run(paths, reference=lambda index, times: np.where(times >= MOTION_START + 5, HEART_RATE, 0.0))
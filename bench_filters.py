@@ -0,0 +1,35 @@
+# bench_filters.py
+# update_hr의 표시용 필터 체인(정규화 + SMA(9) → WMA(7) → SMA(5), 50샘플)을 기존 리스트 방식과 비교
+import timeit
+
+import numpy as np
+
+from emoconnect_pro import (FilterChain, MovingAverageFilter, WeightedMovingAverageFilter,
+                            normalize_to_minus_one_to_one)
+from test_emoconnect_filters import legacy_sma, legacy_wma
+
+if __name__ == "__main__":
+    detrended = np.random.default_rng(0).normal(0, 200, 100).tolist()
+    window = normalize_to_minus_one_to_one(detrended)[:50]
+    number = 500
+
+    legacy = timeit.timeit(lambda: legacy_sma(legacy_wma(legacy_sma(window, 9), 7), 5), number=number) / number
+
+    sma9, wma7, sma5 = MovingAverageFilter(9), WeightedMovingAverageFilter(7), MovingAverageFilter(5)
+    scalar = timeit.timeit(lambda: [sma5.filter(c) for c in [wma7.filter(b) for b in
+                                   [sma9.filter(a) for a in window]]], number=number) / number
+    block = timeit.timeit(lambda: sma5.filter_block(wma7.filter_block(sma9.filter_block(window))),
+                          number=number) / number
+
+    chain = FilterChain.ppg_display()
+    fused = timeit.timeit(lambda: chain.process(detrended, 50).tolist(), number=number) / number
+    listed = timeit.timeit(lambda: [sma5.filter(c) for c in [wma7.filter(b) for b in
+                                   [sma9.filter(a) for a in normalize_to_minus_one_to_one(detrended)[:50]]]],
+                           number=number) / number
+
+    print(f"legacy  {legacy * 1e6:8.1f}us / 50 samples")
+    print(f"filter  {scalar * 1e6:8.1f}us ({legacy / scalar:5.1f}x)")
+    print(f"block   {block * 1e6:8.1f}us ({legacy / block:5.1f}x)")
+    print("normalize + chain (update_hr 표시 경로)")
+    print(f"lists   {listed * 1e6:8.1f}us")
+    print(f"fused   {fused * 1e6:8.1f}us ({listed / fused:5.1f}x)")
@@ -0,0 +1,20 @@
+# bench_float16.py
+# float16 → float32 변환 마이크로 벤치마크: 기존 struct 왕복 / 테이블 조회 / NumPy half 일괄 변환
+import timeit
+
+import numpy as np
+
+from bench_parser import legacy_float16_to_float32
+from emoconnect_utils import float16_to_float32
+
+if __name__ == "__main__":
+    # 기존 구현은 서브노멀 입력에서 struct.error가 발생하므로 정규수 범위만 사용
+    values = np.random.randint(0x0400, 0x7C00, size=10000).tolist()
+    raw = np.array(values, dtype='<u2').tobytes()
+
+    legacy = timeit.timeit(lambda: [legacy_float16_to_float32(v) for v in values], number=20) / 20
+    table = timeit.timeit(lambda: [float16_to_float32(v) for v in values], number=20) / 20
+    vector = timeit.timeit(lambda: np.frombuffer(raw, dtype='<f2').astype(np.float32), number=200) / 200
+
+    for name, elapsed in (("struct (legacy)", legacy), ("table lookup", table), ("numpy half", vector)):
+        print(f"{name:16s} {elapsed / len(values) * 1e9:8.2f} ns/value  ({legacy / elapsed:7.1f}x)")
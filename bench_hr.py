@@ -0,0 +1,28 @@
+# bench_hr.py
+# HeartRateAnalyzer 1초 주기 처리 비용 비교: 기존 리스트 구현 / update_hr(리스트 API) / update(배열 API)
+import time
+
+from emoconnect_pro import HeartRateAnalyzer
+from test_emoconnect_pro import LegacyHeartRateAnalyzer, make_stream
+
+
+def run(analyzer, windows, method):
+    started = time.perf_counter()
+    for ppg, acc in windows:
+        method(analyzer, ppg, acc)
+    return (time.perf_counter() - started) / len(windows)
+
+
+if __name__ == "__main__":
+    arrays = make_stream(0, seconds=600)
+    lists = [(ppg.tolist(), acc.tolist()) for ppg, acc in arrays]
+    cases = (
+        ("legacy list", LegacyHeartRateAnalyzer, lists, lambda a, ppg, acc: a.update_hr(ppg, acc)),
+        ("update_hr (list)", HeartRateAnalyzer, lists, lambda a, ppg, acc: a.update_hr(ppg, acc)),
+        ("update (array)", HeartRateAnalyzer, arrays, lambda a, ppg, acc: a.update(ppg, acc)),
+    )
+    baseline = None
+    for label, factory, windows, method in cases:
+        per_window = run(factory(), windows, method)
+        baseline = baseline or per_window
+        print(f"{label:18s} {per_window * 1e6:8.1f}us/window  ({baseline / per_window:5.2f}x)")
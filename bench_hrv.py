@@ -0,0 +1,42 @@
+# bench_hrv.py
+# 박동당 HRV 지표 갱신 비용: RRIntervalStream 누적 갱신(O(1)) / 박동마다 평가 구간 전체를 다시 계산하는 방식
+import time
+
+import numpy as np
+
+from emoconnect_hrv import RRIntervalStream
+
+BEATS = 20000
+
+
+def recompute(rr, times, window_seconds):
+    """박동마다 평가 구간을 잘라 RMSSD/SDNN/pNN50을 다시 계산"""
+    started = time.perf_counter()
+    for end in range(1, len(rr) + 1):
+        start = np.searchsorted(times[:end], times[end - 1] - window_seconds, side='right')
+        window = rr[start:end]
+        diffs = np.diff(window)
+        if len(diffs):
+            window.std(ddof=1), np.sqrt(np.mean(diffs ** 2)), np.mean(np.abs(diffs) > 50)
+    return (time.perf_counter() - started) / len(rr)
+
+
+def streaming(positions, window_seconds):
+    stream = RRIntervalStream(window_seconds=window_seconds)
+    started = time.perf_counter()
+    for position in positions.tolist():
+        stream.add_peaks((position,))
+        stream.rmssd, stream.sdnn, stream.pnn50
+    return (time.perf_counter() - started) / len(positions)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    positions = np.cumsum(rng.integers(30, 55, BEATS))
+    rr = np.diff(positions) * 20.0
+    times = positions[1:] / 50
+    print(f"{'window s':>9s} {'recompute us/beat':>18s} {'streaming us/beat':>18s} {'speedup':>8s}")
+    for window_seconds in (30.0, 60.0, 300.0):
+        full = recompute(rr, times, window_seconds)
+        incremental = streaming(positions, window_seconds)
+        print(f"{window_seconds:9.0f} {full * 1e6:18.1f} {incremental * 1e6:18.1f} {full / incremental:7.1f}x")
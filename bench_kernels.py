@@ -0,0 +1,60 @@
+# bench_kernels.py
+# emoconnect_kernels 컴파일 확장(Cython)과 순수 Python(NumPy) 구현의 커널별 / update() 전체 처리 시간 비교
+# 컴파일 확장 빌드: python setup.py build_ext --inplace
+import struct
+import sys
+import timeit
+
+import numpy as np
+
+import emoconnect_kernels
+import emoconnect_pro as ep
+from test_emoconnect_kernels import PYTHON
+from test_emoconnect_pro import make_stream
+
+
+def kernel_cases():
+    rng = np.random.default_rng(0)
+    notification = b"".join(struct.pack('<H9e', int(rng.integers(0, 65536)), *rng.uniform(-100, 100, 9))
+                            for _ in range(12))
+    bits = rng.integers(0, 65536, 1000).astype(np.uint16)
+    window = rng.normal(30000, 1000, 100)
+    matrix = rng.normal(30000, 1000, (64, 100))
+    operator = ep.DetrendEngine.operator(100, 7)
+    detrended = ep.DetrendEngine.detrend(window, 2)
+    block = rng.normal(0, 1, 50)
+    out = np.empty(50)
+    return (
+        ("parse_frames (12 frames)", lambda k: k.parse_frames(notification, 12)),
+        ("decode_float16 (1000)", lambda k: k.decode_float16(bits)),
+        ("detrend (100)", lambda k: k.detrend(operator, window)),
+        ("detrend_rows (64x100)", lambda k: k.detrend_rows(operator, matrix)),
+        ("find_peaks (100)", lambda k: k.find_peaks(detrended, 0.0, 12, 8)),
+        ("sma_block (50)", lambda k: k.sma_block(np.zeros(9), 0, 0, 0.0, block, out)),
+        ("wma_block (50)", lambda k: k.wma_block(np.zeros(7), 0, 0, 0.0, 0.0, block, out)),
+    )
+
+
+def time_update(kernels, windows):
+    ep.ek = kernels
+    analyzer = ep.HeartRateAnalyzer(cal_hr_time=1)
+    started = timeit.default_timer()
+    for ppg, acc in windows:
+        analyzer.update(ppg, acc)
+    return (timeit.default_timer() - started) / len(windows)
+
+
+if __name__ == "__main__":
+    if not emoconnect_kernels.COMPILED:
+        sys.exit("compiled extension not found: run `python setup.py build_ext --inplace` first")
+    print(f"{'kernel':26s} {'python us':>10s} {'compiled us':>12s} {'speedup':>8s}")
+    for label, call in kernel_cases():
+        number = 2000
+        python = timeit.timeit(lambda: call(PYTHON), number=number) / number
+        compiled = timeit.timeit(lambda: call(emoconnect_kernels), number=number) / number
+        print(f"{label:26s} {python * 1e6:10.2f} {compiled * 1e6:12.2f} {python / compiled:7.1f}x")
+
+    windows = make_stream(0, seconds=600)
+    python = time_update(PYTHON, windows)
+    compiled = time_update(emoconnect_kernels, windows)
+    print(f"{'HeartRateAnalyzer.update':26s} {python * 1e6:10.2f} {compiled * 1e6:12.2f} {python / compiled:7.1f}x")
@@ -0,0 +1,57 @@
+# bench_manager.py
+# 에뮬레이터 장치 N대를 하나의 이벤트 루프에서 SessionManager로 처리할 때의
+# 장치당 CPU 사용률과 결과 전달 지연(예정 시각 대비)을 측정합니다.
+import asyncio
+import random
+import sys
+import time
+
+import numpy as np
+
+import emoconnect_pro as ep
+from emoconnect_manager import SessionManager
+from emoconnect_transport import EmulatedTransport
+
+
+def make_transport(address):
+    """장치마다 심박수와 움직임이 다른 에뮬레이터 (알림 간격 지터 5ms, 패킷 손실 1%)"""
+    return EmulatedTransport(address, heart_rate=random.uniform(60.0, 120.0), motion=random.uniform(0.0, 0.5),
+                             jitter=0.005, packet_loss=0.01)
+
+
+async def run_load(num_devices, duration):
+    manager = SessionManager(analyzer_factory=lambda: ep.HeartRateAnalyzer(cal_hr_time=5),
+                             transport_factory=make_transport)
+    for i in range(num_devices):
+        manager.add_device(f"SIM:{i:04d}")
+    await manager.connect_all()
+    await manager.start_all()
+
+    scheduler = asyncio.ensure_future(manager.run())
+    cpu_start = time.process_time()
+    await asyncio.sleep(duration)
+    cpu = time.process_time() - cpu_start
+    manager.stop()
+    await scheduler
+    await manager.disconnect_all()
+
+    latencies = np.concatenate([np.array(s['latency']) for s in manager.stats.values()])
+    processed = sum(s['processed'] for s in manager.stats.values())
+    process_cpu = sum(s['cpu_time'] for s in manager.stats.values())
+    return {
+        'cpu_per_device': cpu / duration / num_devices * 100,
+        'process_ms': process_cpu / max(processed, 1) * 1000,
+        'p50_ms': np.percentile(latencies, 50) * 1000 if len(latencies) else float('nan'),
+        'p95_ms': np.percentile(latencies, 95) * 1000 if len(latencies) else float('nan'),
+        'max_ms': latencies.max() * 1000 if len(latencies) else float('nan'),
+        'processed': processed,
+    }
+
+
+if __name__ == "__main__":
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 8.0
+    print(f"{'devices':>7s} {'cpu/dev %':>10s} {'cycle ms':>9s} {'p50 ms':>8s} {'p95 ms':>8s} {'max ms':>8s} {'cycles':>7s}")
+    for num_devices in (1, 8, 16, 32, 64, 128):
+        r = asyncio.run(run_load(num_devices, duration))
+        print(f"{num_devices:7d} {r['cpu_per_device']:10.2f} {r['process_ms']:9.2f} {r['p50_ms']:8.1f} "
+              f"{r['p95_ms']:8.1f} {r['max_ms']:8.1f} {r['processed']:7d}")
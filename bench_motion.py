@@ -0,0 +1,39 @@
+# bench_motion.py
+# update_hr의 가속도 노이즈 계산(제너레이터 6회 순회)과 MotionNoiseEstimator 갱신 비용 비교
+import math
+import timeit
+
+import numpy as np
+
+from emoconnect_utils import MotionNoiseEstimator
+
+
+def legacy_noise(interpolated_acc):
+    data_size = len(interpolated_acc)
+    x_mean = sum(entry[0] for entry in interpolated_acc) / data_size
+    y_mean = sum(entry[1] for entry in interpolated_acc) / data_size
+    z_mean = sum(entry[2] for entry in interpolated_acc) / data_size
+    x_variance = sum((entry[0] - x_mean) ** 2 for entry in interpolated_acc) / data_size
+    y_variance = sum((entry[1] - y_mean) ** 2 for entry in interpolated_acc) / data_size
+    z_variance = sum((entry[2] - z_mean) ** 2 for entry in interpolated_acc) / data_size
+    return math.sqrt(x_variance) + math.sqrt(y_variance) + math.sqrt(z_variance)
+
+
+if __name__ == "__main__":
+    acc = np.random.default_rng(0).normal(0, 1, (50, 3))
+    acc_list = acc.tolist()
+    number = 2000
+    estimator = MotionNoiseEstimator()
+    assert abs(estimator.update(acc_list) - legacy_noise(acc_list)) < 1e-9
+
+    legacy = timeit.timeit(lambda: legacy_noise(acc_list), number=number) / number
+    window = timeit.timeit(lambda: estimator.update(acc_list), number=number) / number
+    # 알림 단위(5샘플) 갱신: 1초에 10회
+    chunks = [acc[i:i + 5] for i in range(0, 50, 5)]
+    streaming = timeit.timeit(lambda: [estimator.update(chunk) for chunk in chunks], number=number) / number
+    query = timeit.timeit(lambda: estimator.noise_threshold, number=number) / number
+
+    print(f"legacy (1초 창 재스캔)        {legacy * 1e6:7.1f}us")
+    print(f"update(50 샘플)              {window * 1e6:7.1f}us ({legacy / window:4.1f}x)")
+    print(f"update(5 샘플) x10 (스트리밍) {streaming * 1e6:7.1f}us")
+    print(f"noise_threshold 조회          {query * 1e6:7.1f}us")
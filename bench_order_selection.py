@@ -0,0 +1,55 @@
+# bench_order_selection.py
+# 피크 간격 백엔드의 창 1개 처리 비용: 차수 2로 먼저 처리한 뒤 노이즈 구간이면 다시 처리하던 2단계 방식과
+# 노이즈로 차수를 먼저 정해 추세 제거/피크 검출을 한 번만 하는 현재 방식 비교 (움직임 세기별)
+import time
+
+import numpy as np
+
+from emoconnect_pro import DetrendEngine, HeartRateAnalyzer, PeakDetector, PeakIntervalEstimator
+
+SECONDS = 300
+
+
+class TwoPassEstimator(PeakIntervalEstimator):
+    """이전 방식: 차수 2 결과를 먼저 계산하고, 노이즈 구간이면 선택한 차수로 전체를 다시 계산"""
+    def _pass(self, analyzer, window, order):
+        detrend_value = np.round(DetrendEngine.detrend(window, order), 4)
+        mean_val = np.mean(detrend_value)
+        threshold_height = mean_val + 0.5 * np.sqrt(np.mean((detrend_value - mean_val) ** 2))
+        peak_indices = PeakDetector.find_peaks(detrend_value, height=threshold_height, distance=12,
+                                               max_num=analyzer.max_peaks)
+        return detrend_value, self.peak_intervals(peak_indices, order)
+
+    def estimate(self, analyzer, window, noise):
+        detrend_value, peak_intervals = self._pass(analyzer, window, 2)
+        order = self.detrend_order(analyzer, noise)
+        if order != 2:
+            detrend_value, peak_intervals = self._pass(analyzer, window, order)
+        return (60 / np.mean(peak_intervals) if peak_intervals.size else None), detrend_value
+
+
+def make_windows(motion, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(SECONDS * 50) / 50
+    ppg = 30000 + 1500 * np.sin(2 * np.pi * 1.5 * t) + 200 * np.sin(0.3 * t) + rng.normal(0, 30, len(t))
+    acc = rng.normal(0, motion, (len(t), 3))
+    return [(ppg[i:i + 50], acc[i:i + 50]) for i in range(0, len(t), 50)]
+
+
+def run(estimator, windows):
+    # 움직임 노이즈가 있어도 처음부터 분석하도록 안정화 시간 0
+    analyzer = HeartRateAnalyzer(cal_hr_time=0, estimator=estimator)
+    started = time.perf_counter()
+    hrs = [analyzer.update(ppg, acc).hr for ppg, acc in windows]
+    return (time.perf_counter() - started) / len(windows), hrs
+
+
+if __name__ == "__main__":
+    print(f"{'motion':>8s} {'order':>6s} {'two-pass us':>12s} {'single us':>10s} {'speedup':>8s} {'same':>5s}")
+    for motion, label in ((0.5, 2), (2.5, 5), (5.0, 7)):
+        windows = make_windows(motion)
+        run(PeakIntervalEstimator(), windows)  # 연산자 캐시 준비
+        two_pass, expected = run(TwoPassEstimator(), windows)
+        single, hrs = run(PeakIntervalEstimator(), windows)
+        print(f"{motion:8.1f} {label:6d} {two_pass * 1e6:12.1f} {single * 1e6:10.1f} {two_pass / single:7.2f}x "
+              f"{str(hrs == expected):>5s}")
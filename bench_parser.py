@@ -0,0 +1,58 @@
+# bench_parser.py
+# DataParser.parse_frames(일괄 디코딩)와 기존 바이트 단위 파싱 루프의 처리 속도를 비교합니다.
+import random
+import struct
+import timeit
+
+from emoconnect_utils import DataParser
+
+
+def legacy_float16_to_float32(value):
+    """기존 float16 변환 (struct pack/unpack 왕복, 서브노멀 처리 오류 포함)"""
+    sign = (value >> 15) & 0x1
+    exponent = (value >> 10) & 0x1F
+    fraction = value & 0x3FF
+    if exponent == 0:
+        exponent = 0x1F
+        fraction = fraction * 8192
+    else:
+        exponent -= 15
+        exponent += 127
+    result = (sign << 31) | (exponent << 23) | (fraction << 13)
+    return struct.unpack('f', struct.pack('I', result))[0]
+
+
+def legacy_parse_data(data):
+    """기존 parse_data 구현 (청크마다 바이트를 직접 조합하여 딕셔너리 생성)"""
+    parsed_data = []
+    for i in range(len(data) // 20):
+        base = 20 * i
+        ppg = ((data[base + 1] << 8) | data[base + 0])
+        values = [legacy_float16_to_float32((data[base + k + 1] << 8) | data[base + k])
+                  for k in range(2, 20, 2)]
+        parsed_data.append({
+            'ppg': ppg,
+            'acc': values[0:3],
+            'gyro': values[3:6],
+            'mag': values[6:9]
+        })
+    return parsed_data
+
+
+def make_notification(num_chunks):
+    return b"".join(struct.pack('<H9e', random.randint(0, 65535),
+                                *[random.uniform(-100.0, 100.0) for _ in range(9)])
+                    for _ in range(num_chunks))
+
+
+if __name__ == "__main__":
+    parser = DataParser()
+    for num_chunks in (1, 10, 100, 1000):
+        data = make_notification(num_chunks)
+        number = max(10, 20000 // num_chunks)
+        legacy = timeit.timeit(lambda: legacy_parse_data(data), number=number) / number
+        frames = timeit.timeit(lambda: parser.parse_frames(data), number=number) / number
+        compat = timeit.timeit(lambda: parser.parse_data(data), number=number) / number
+        print(f"chunks={num_chunks:5d}  legacy={legacy * 1e6:9.1f}us  "
+              f"parse_frames={frames * 1e6:8.1f}us ({legacy / frames:6.1f}x)  "
+              f"parse_data={compat * 1e6:8.1f}us ({legacy / compat:5.1f}x)")
@@ -0,0 +1,28 @@
+# bench_peaks.py
+# 기존 PeakDetector.find_peaks(후보 루프 + O(k²) 거리 검사)와 벡터화 구현의 처리 시간 비교
+import timeit
+
+import numpy as np
+
+from emoconnect_pro import PeakDetector
+from test_emoconnect_pro import legacy_find_peaks
+
+
+def make_signal(size, seed=0):
+    """50Hz 맥파 형태 + 잡음 (update_hr과 같은 추세 제거 후 스케일)"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(size) / 50
+    return (100 * np.sin(2 * np.pi * 1.3 * t) + rng.normal(0, 20, size)).tolist()
+
+
+if __name__ == "__main__":
+    # max_num=0: 개수 제한 없이 모든 피크 (기존 구현의 O(k²) 최악 경우)
+    for size, max_num, number in ((100, 10, 2000), (1000, 10, 200), (1000, 0, 200),
+                                  (100000, 10, 3), (100000, 0, 3)):
+        data = make_signal(size)
+        assert PeakDetector.find_peaks(data, 0, 12, max_num) == legacy_find_peaks(data, 0, 12, max_num)
+        legacy = timeit.timeit(lambda: legacy_find_peaks(data, 0, 12, max_num), number=number) / number
+        vectorized = timeit.timeit(lambda: PeakDetector.find_peaks(data, 0, 12, max_num), number=number) / number
+        label = str(max_num) if max_num else "all"
+        print(f"n={size:6d} max_num={label:>3}  legacy={legacy * 1e3:9.3f}ms  "
+              f"vectorized={vectorized * 1e3:8.3f}ms  ({legacy / vectorized:6.1f}x)")
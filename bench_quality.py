@@ -0,0 +1,62 @@
+# bench_quality.py
+# 게이트웨이 분석 CPU: 손목에서 떨어진(맥동 없는 주변광 신호) 장치 비율별로
+# 기존 착용 판단(창의 합이 0) / 품질 추정기(SignalQualityEstimator)로 미착용 창의 분석을 건너뛰는 경우 비교
+# (품질 추정기는 착용 장치에 누적 통계와 박동 템플릿 상관 비용을 더하고, 미착용 장치의 추세 제거/피크 검출을 없앰)
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from emoconnect_pro import BatchHeartRateAnalyzer, HeartRateAnalyzer
+from emoconnect_quality import SignalQualityEstimator
+from test_emoconnect_hrv import make_beat_stream
+
+DEVICES = 32
+SECONDS = 60
+REPEAT = 5
+
+
+def make_gateway(seed, off_wrist):
+    """장치별 초 단위 (ppg, acc) 목록 (앞의 off_wrist 비율 장치는 주변광 잡음만)"""
+    rng = np.random.default_rng(seed)
+    streams = []
+    for device in range(DEVICES):
+        _, chunks = make_beat_stream(seed + device, seconds=SECONDS)
+        if device < off_wrist * DEVICES:
+            chunks = [(200 + rng.normal(0, 2, 50), acc) for _, acc in chunks]
+        streams.append(chunks)
+    return streams
+
+
+def run(streams, quality, batch):
+    """quality: None(기존 판단) 또는 SignalQualityEstimator 인자 딕셔너리"""
+    analyzers = [HeartRateAnalyzer(quality=None if quality is None else SignalQualityEstimator(**quality))
+                 for _ in streams]
+    batch_analyzer = BatchHeartRateAnalyzer()
+    worn = 0
+    started = time.process_time()
+    for second in range(SECONDS):
+        chunks = [stream[second] for stream in streams]
+        if batch:
+            results = batch_analyzer.update(analyzers, [c[0] for c in chunks], [c[1] for c in chunks])
+        else:
+            results = [analyzer.update(*chunk) for analyzer, chunk in zip(analyzers, chunks)]
+        worn += sum(result.is_wearing for result in results)
+    return (time.process_time() - started) / (DEVICES * SECONDS), worn / SECONDS
+
+
+if __name__ == "__main__":
+    configs = {'sum == 0': None, 'sqi': {}, 'sqi no tmpl': {'beat_template': False}}
+    print(f"{'mode':>6s} {'off-wrist':>9s}" + "".join(f" {name + ' us':>15s}" for name in configs)
+          + f" {'worn (sum/sqi)':>15s}")
+    for batch in (False, True):
+        for off_wrist in (0.0, 0.25, 0.5, 0.75):
+            streams = make_gateway(0, off_wrist)
+            timings = {}
+            with contextlib.redirect_stdout(io.StringIO()):  # 미착용 메시지 생략
+                for name, config in configs.items():
+                    timings[name] = min(run(streams, config, batch) for _ in range(REPEAT))
+            print(f"{'batch' if batch else 'single':>6s} {off_wrist:9.0%}"
+                  + "".join(f" {cpu * 1e6:15.1f}" for cpu, _ in timings.values())
+                  + f" {timings['sum == 0'][1]:7.1f}/{timings['sqi'][1]:<7.1f}")
@@ -0,0 +1,49 @@
+# bench_recorder.py
+# 여러 시간 분량의 세션 기록을 메모리 매핑으로 여는 시간과 텍스트(CSV) 파싱 시간을 비교합니다.
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from emoconnect_recorder import SessionReader, SessionRecorder
+from emoconnect_transport import EmulatedTransport
+
+if __name__ == "__main__":
+    hours = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    emulator = EmulatedTransport(samples_per_notification=50, battery_interval=None, seed=0)
+    notifications = int(hours * 3600)  # 알림당 50샘플 = 1초
+
+    with tempfile.TemporaryDirectory() as directory:
+        record_path = os.path.join(directory, "session.emorec")
+        csv_path = os.path.join(directory, "session.csv")
+
+        start = time.perf_counter()
+        with SessionRecorder(record_path) as recorder, open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            for i in range(notifications):
+                payload = emulator.next_notification()
+                recorder.record(payload, timestamp=float(i))
+                if i % 600 == 0:
+                    print(f"\rwriting {i / notifications * 100:5.1f}%", end="", file=sys.stderr)
+                frames = np.frombuffer(payload, dtype='<u2').reshape(-1, 10)
+                writer.writerows(frames.tolist())
+        print(f"\rwrote {hours:.1f} h ({notifications * 50} samples) in {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        reader = SessionReader(record_path)
+        ppg_mean = float(np.mean(reader.channels()['ppg']))
+        mmap_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(csv_path, newline="") as f:
+            rows = [[int(v) for v in row] for row in csv.reader(f)]
+        csv_ppg_mean = float(np.mean([row[0] for row in rows]))
+        csv_time = time.perf_counter() - start
+
+        assert abs(ppg_mean - csv_ppg_mean) < 1e-6
+        print(f"binary: {os.path.getsize(record_path) / 1e6:8.1f} MB  open+scan {mmap_time * 1000:9.1f} ms")
+        print(f"csv:    {os.path.getsize(csv_path) / 1e6:8.1f} MB  parse+scan {csv_time * 1000:9.1f} ms"
+              f"  ({csv_time / mmap_time:.0f}x slower)")
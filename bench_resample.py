@@ -0,0 +1,35 @@
+# bench_resample.py
+# 기존 방식(채널별 interp1d 생성 + 반올림 + tolist)과 Resampler(10채널 일괄 보간, 격자 캐시) 비교
+import timeit
+
+import numpy as np
+from scipy.interpolate import interp1d
+
+from emoconnect_utils import Resampler
+
+
+def legacy_interpolate(buffer, num_points=50):
+    x = np.linspace(0, len(buffer) - 1, num=len(buffer))
+    f = interp1d(x, buffer, kind='linear', axis=0, fill_value="extrapolate")
+    return np.round(f(np.linspace(0, len(buffer) - 1, num=num_points)), decimals=3)
+
+
+def legacy_window(samples):
+    return {name: legacy_interpolate(np.asarray(samples[name], dtype=np.float64)).tolist()
+            for name in ('ppg', 'acc', 'gyro', 'mag')}
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    resampler = Resampler(num_points=50)
+    for length in (45, 50, 55):
+        samples = {'ppg': rng.normal(30000, 500, length).astype(np.uint16),
+                   'acc': rng.normal(0, 1, (length, 3)).astype(np.float32),
+                   'gyro': rng.normal(0, 1, (length, 3)).astype(np.float32),
+                   'mag': rng.normal(0, 1, (length, 3)).astype(np.float32)}
+        result = resampler.resample(samples)
+        assert all(np.array_equal(result[name], legacy_window(samples)[name]) for name in result)
+        number = 1000
+        legacy = timeit.timeit(lambda: legacy_window(samples), number=number) / number
+        fast = timeit.timeit(lambda: resampler.resample(samples), number=number) / number
+        print(f"n={length}  legacy={legacy * 1e6:7.1f}us  Resampler={fast * 1e6:6.1f}us  ({legacy / fast:4.1f}x)")
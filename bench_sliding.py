@@ -0,0 +1,52 @@
+# bench_sliding.py
+# 슬라이딩 창 HR 분석: hop_size별 장치당 CPU 사용량과 심박수 계단 변화(70 → 130 bpm) 추종 지연 비교
+import time
+
+import numpy as np
+
+from emoconnect_pro import BatchHeartRateAnalyzer, HeartRateAnalyzer
+
+SECONDS = 40
+STEP_SECOND = 20  # 심박수가 바뀌는 시점
+CHUNK = 5  # 스트림 전달 단위 (100ms)
+
+
+def make_step_stream(seed):
+    """움직임 없는 상태에서 STEP_SECOND초에 70 → 130 bpm으로 바뀌는 PPG/가속도 스트림 (CHUNK 샘플 단위)"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(SECONDS * 50) / 50
+    bpm = np.where(t < STEP_SECOND, 70.0, 130.0)
+    ppg = 30000 + 1500 * np.sin(2 * np.pi * np.cumsum(bpm / 60) / 50) + 200 * np.sin(0.3 * t) + rng.normal(0, 30, len(t))
+    acc = rng.normal(0, 0.05, (len(t), 3))
+    return [(ppg[i:i + CHUNK], acc[i:i + CHUNK]) for i in range(0, len(t), CHUNK)]
+
+
+def step_latency(stream, hop_size):
+    """계단 변화 후 출력 심박수가 중간값(100 bpm)을 넘기까지 걸린 시간 (초)"""
+    analyzer = HeartRateAnalyzer(cal_hr_time=2, hop_size=hop_size)
+    for index, chunk in enumerate(stream):
+        result = analyzer.update(*chunk)
+        elapsed = (index + 1) * CHUNK / 50 - STEP_SECOND
+        if elapsed > 0 and result.hr > 100:
+            return elapsed
+    return float('nan')
+
+
+def cpu_per_device(streams, hop_size):
+    """BatchHeartRateAnalyzer로 전체 장치를 처리했을 때 장치 1대, 신호 1초당 CPU 시간 (초)"""
+    analyzers = [HeartRateAnalyzer(cal_hr_time=2, hop_size=hop_size) for _ in streams]
+    batch = BatchHeartRateAnalyzer()
+    started = time.process_time()
+    for index in range(len(streams[0])):
+        chunks = [stream[index] for stream in streams]
+        batch.update(analyzers, [c[0] for c in chunks], [c[1] for c in chunks])
+    return (time.process_time() - started) / (SECONDS * len(streams))
+
+
+if __name__ == "__main__":
+    streams = [make_step_stream(seed) for seed in range(64)]
+    print(f"{'hop':>4s} {'update ms':>10s} {'latency s':>10s} {'cpu us/dev/s':>13s} {'devices/core':>13s}")
+    for hop_size in (50, 25, 10, 5):
+        latency = np.median([step_latency(stream, hop_size) for stream in streams[:16]])
+        cpu = cpu_per_device(streams, hop_size)
+        print(f"{hop_size:4d} {hop_size * 20:10d} {latency:10.2f} {cpu * 1e6:13.1f} {1 / cpu:13.0f}")
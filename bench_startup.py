@@ -0,0 +1,24 @@
+# bench_startup.py
+# python -X importtime으로 헤드리스 분석 경로의 import 비용을 측정합니다. (예산은 test_emoconnect_startup.py에서 검사)
+import sys
+
+from test_emoconnect_startup import HEAVY_PACKAGES, IMPORT_BUDGET_MS, import_times, own_time_ms
+
+STATEMENTS = (
+    "import emoconnect_pro",
+    "import newert_pro",
+    "import emoconnect_batch, emoconnect_session, emoconnect_manager",
+)
+
+if __name__ == "__main__":
+    statements = sys.argv[1:] or STATEMENTS
+    for statement in statements:
+        times = import_times(statement)
+        total = sum(self_us for self_us, _ in times.values()) / 1000
+        numpy = times.get("numpy", (0, 0))[1] / 1000
+        heavy = sorted({name.split(".")[0] for name in times} & set(HEAVY_PACKAGES))
+        print(f"{statement}")
+        print(f"    total={total:7.1f}ms  numpy={numpy:7.1f}ms  emoconnect_*={own_time_ms(times):6.1f}ms "
+              f"(budget {IMPORT_BUDGET_MS:.0f}ms)  heavy={heavy or '-'}")
+        slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:5]
+        print("    slowest self: " + ", ".join(f"{name} {self_us / 1000:.1f}ms" for name, (self_us, _) in slowest))
@@ -0,0 +1,63 @@
+# bench_stream.py
+# 캡처된 알림 스트림을 재생하여 SensorStream과 기존 리스트 버퍼 방식의 처리량/메모리 할당을 비교합니다.
+import time
+import tracemalloc
+
+from bench_parser import make_notification
+from emoconnect_utils import DataParser, SensorStream
+
+NOTIFICATIONS = 3000
+CHUNKS_PER_NOTIFICATION = 5
+NOTIFICATIONS_PER_SECOND = 10  # 50Hz / 알림당 5샘플
+
+
+def legacy_replay(notifications):
+    """기존 BleController 방식: 알림마다 DataParser 생성, 리스트 추가, 1초마다 clear()"""
+    ppg_buffer, acc_buffer, gyro_buffer, mag_buffer = [], [], [], []
+    for i, data in enumerate(notifications):
+        parser = DataParser()
+        for item in parser.parse_data(bytes(data)):
+            ppg_buffer.append(item['ppg'])
+            acc_buffer.append(item['acc'])
+            gyro_buffer.append(item['gyro'])
+            mag_buffer.append(item['mag'])
+        if i % NOTIFICATIONS_PER_SECOND == NOTIFICATIONS_PER_SECOND - 1:
+            ppg_buffer.clear()
+            acc_buffer.clear()
+            gyro_buffer.clear()
+            mag_buffer.clear()
+
+
+def stream_replay(notifications, stream):
+    for i, data in enumerate(notifications):
+        stream.ingest(data)
+        if i % NOTIFICATIONS_PER_SECOND == NOTIFICATIONS_PER_SECOND - 1:
+            stream.drain()
+
+
+def measure(name, replay, notifications):
+    start = time.perf_counter()
+    replay(notifications)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    replay(notifications)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    total_allocs = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, 'lineno'))
+
+    samples = len(notifications) * CHUNKS_PER_NOTIFICATION
+    print(f"{name:14s} {len(notifications) / elapsed:10.0f} notif/s  {samples / elapsed:10.0f} samples/s  "
+          f"peak={peak / 1024:8.1f} KiB  retained={retained:8d} B  live blocks +{total_allocs}")
+
+
+if __name__ == "__main__":
+    notifications = [bytearray(make_notification(CHUNKS_PER_NOTIFICATION)) for _ in range(NOTIFICATIONS)]
+    stream = SensorStream()
+    stream_replay(notifications, stream)  # 워밍업 (링 버퍼가 한 바퀴 이상 채워진 정상 상태)
+
+    measure("legacy lists", legacy_replay, notifications)
+    measure("SensorStream", lambda n: stream_replay(n, stream), notifications)
@@ -0,0 +1,72 @@
+# bench_worker.py
+# 에뮬레이터 장치 N대가 실시간(50Hz)으로 알림을 보내는 동안, 처리 창을 알림 핸들러 안에서 바로 처리할 때(inline)와
+# ProcessingWorker로 넘길 때(worker)의 알림 처리 지연과 이벤트 루프 지연(UI 반응성 대용 지표)을 비교합니다.
+import asyncio
+import sys
+import time
+
+import numpy as np
+
+import emoconnect_pro as ep
+from emoconnect_session import SensorSession
+from emoconnect_transport import EmulatedTransport
+from emoconnect_worker import ProcessingWorker
+
+
+class LoadedAnalyzer(ep.HeartRateAnalyzer):
+    """처리 창마다 load_ms만큼 추가 연산(LAPACK, GIL 해제)을 하는 분석기: 느린 창을 모사"""
+    def __init__(self, load_ms):
+        super().__init__(cal_hr_time=2)
+        self.load_ms = load_ms
+        self.matrix = np.random.default_rng(0).normal(size=(200, 200))
+
+    def update_hr(self, interpolated_ppg, interpolated_acc):
+        deadline = time.perf_counter() + self.load_ms / 1000
+        while time.perf_counter() < deadline:
+            np.linalg.svd(self.matrix, compute_uv=False)
+        return super().update_hr(interpolated_ppg, interpolated_acc)
+
+
+async def loop_lag(samples, period=0.01):
+    """period마다 깨어나 예정보다 늦은 시간을 기록"""
+    while True:
+        expected = time.perf_counter() + period
+        await asyncio.sleep(period)
+        samples.append(time.perf_counter() - expected)
+
+
+async def run(mode, num_devices, load_ms, duration):
+    worker = ProcessingWorker(maxsize=2 * num_devices, policy='coalesce').start() if mode == 'worker' else None
+    sessions = [SensorSession(f"SIM:{i}", hr_analyzer=LoadedAnalyzer(load_ms), worker=worker,
+                              transport=EmulatedTransport(f"SIM:{i}", heart_rate=70.0 + i, seed=i))
+                for i in range(num_devices)]
+    for session in sessions:
+        await session.connect()
+        await session.start_measure()
+    lag = []
+    ticker = asyncio.ensure_future(loop_lag(lag))
+    await asyncio.sleep(duration)
+    ticker.cancel()
+    for session in sessions:
+        await session.disconnect()
+    handler = np.concatenate([np.array(session.handler_latency) for session in sessions])
+    metrics = worker.metrics() if worker is not None else None
+    if worker is not None:
+        worker.stop(timeout=5)
+    return handler, np.array(lag), metrics
+
+
+if __name__ == "__main__":
+    num_devices = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    load_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 40.0
+    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 6.0
+    print(f"{num_devices} devices, +{load_ms:.0f} ms per window, {duration:.0f} s")
+    for mode in ('inline', 'worker'):
+        handler, lag, metrics = asyncio.run(run(mode, num_devices, load_ms, duration))
+        print(f"{mode:6s}  handler p50={np.percentile(handler, 50) * 1e3:6.2f}ms "
+              f"p99={np.percentile(handler, 99) * 1e3:7.2f}ms max={handler.max() * 1e3:7.2f}ms  "
+              f"loop lag p99={np.percentile(lag, 99) * 1e3:7.2f}ms max={lag.max() * 1e3:7.2f}ms")
+        if metrics:
+            print(f"        worker processed={metrics['processed']} dropped={metrics['dropped']} "
+                  f"coalesced={metrics['coalesced']} max_queue={metrics['max_queue_depth']} "
+                  f"wait p95={metrics['queue_wait_p95'] * 1e3:.1f}ms processing p95={metrics['processing_p95'] * 1e3:.1f}ms")
@@ -0,0 +1,132 @@
+# emoconnect_batch.py
+# 기록된 세션 파일들을 여러 프로세스에서 일괄 재분석하여 초 단위 HR/노이즈/착용 결과를 저장합니다.
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import emoconnect_pro as ep
+import emoconnect_utils as eu
+from emoconnect_recorder import SessionReader
+from emoconnect_session import process_window
+
+RESULT_FIELDS = ('time', 'hr', 'noise', 'is_wearing', 'is_moving_noise', 'is_fitting')
+
+
+def analyze_session(path, output_dir=None, interval=1.0, num_points=50, timebase='arrival', estimator='peak',
+                    **analyzer_kwargs):
+    """
+    세션 기록 하나를 실시간 세션과 같은 방식으로 재생하여 주기마다 HR을 계산합니다.
+    처리 시점과 샘플 시간축은 기록된 수신 시각(timestamp)으로 결정되므로 결과는 항상 동일합니다.
+
+    timebase: 'arrival' (수신 시각 기반 50Hz 격자 보간) 또는 'count' (기존 샘플 수 기준 보간)
+    estimator: 심박수 추정 백엔드 이름 (ep.HR_ESTIMATORS의 키: 'peak', 'spectral', 'spectral-acc')
+    analyzer_kwargs: HeartRateAnalyzer 인자 (cal_hr_time, threshold1, threshold2, threshold3, window_size, hop_size)
+                     hop_size를 바꾸면 interval(초)과 num_points도 hop_size / 50Hz, hop_size로 맞춰야 함
+    반환: {'path', 'output', 'windows', 'seconds', 'elapsed', 'analysis_cpu', 'rows'}
+          (analysis_cpu: 보간과 HR 분석에 사용한 CPU 시간, 초)
+          (output_dir를 지정하지 않으면 rows에 결과 행 리스트를 담음)
+    """
+    start = time.perf_counter()
+    reader = SessionReader(path)
+    analyzer = ep.HeartRateAnalyzer(estimator=ep.HR_ESTIMATORS[estimator](), **analyzer_kwargs)
+    stream = eu.SensorStream()
+    resampler = eu.TimelineResampler() if timebase == 'arrival' else None
+    rows = []
+    last_timestamp = None
+    analysis_cpu = 0.0
+    for timestamp, payload in reader.notifications():
+        if last_timestamp is None:
+            last_timestamp = timestamp
+        stream.ingest(payload, timestamp)
+        if timestamp - last_timestamp >= interval:
+            cpu_start = time.process_time()
+            result = process_window(stream.drain(), analyzer, num_points, resampler)
+            analysis_cpu += time.process_time() - cpu_start
+            rows.append((round(timestamp - reader.start_monotonic, 3), result['hr'],
+                         analyzer.global_noise_threshold, int(analyzer.is_wearing),
+                         int(analyzer.is_moving_noise), int(analyzer.is_fitting)))
+            last_timestamp = timestamp
+
+    summary = {
+        'path': path,
+        'output': None,
+        'windows': len(rows),
+        'seconds': reader.duration,
+        'elapsed': time.perf_counter() - start,
+        'analysis_cpu': analysis_cpu,
+        'rows': None,
+    }
+    if output_dir:
+        name = os.path.splitext(os.path.basename(path))[0]
+        summary['output'] = os.path.join(output_dir, f"{name}.hr.csv")
+        with open(summary['output'], "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(RESULT_FIELDS)
+            writer.writerows(rows)
+    else:
+        summary['rows'] = rows
+    return summary
+
+
+def _analyze(args):
+    path, output_dir, kwargs = args
+    return analyze_session(path, output_dir, **kwargs)
+
+
+def analyze_sessions(paths, output_dir=None, workers=None, **kwargs):
+    """
+    여러 세션 기록을 ProcessPoolExecutor로 나누어 분석합니다.
+    큰 파일부터 작업을 배정하여 마지막에 한 프로세스만 남는 상황을 줄입니다.
+
+    workers: 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 실행)
+    반환: (입력 순서의 세션별 요약 리스트, 처리량(세션/분))
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    order = sorted(range(len(paths)), key=lambda i: os.path.getsize(paths[i]), reverse=True)
+    jobs = [(paths[i], output_dir, kwargs) for i in order]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [_analyze(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_analyze, jobs))
+    elapsed = time.perf_counter() - start
+
+    summaries = [None] * len(paths)
+    for i, result in zip(order, results):
+        summaries[i] = result
+    sessions_per_minute = len(paths) / elapsed * 60 if elapsed > 0 else 0.0
+    return summaries, sessions_per_minute
+
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="기록된 세션의 일괄 HR 재분석")
+    arg_parser.add_argument("paths", nargs="+", help="세션 기록 파일 (.emorec)")
+    arg_parser.add_argument("-o", "--output-dir", default="hr_results", help="결과 CSV 저장 폴더")
+    arg_parser.add_argument("-j", "--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 코어 수)")
+    arg_parser.add_argument("--timebase", choices=("arrival", "count"), default="arrival",
+                            help="샘플 시간축: 수신 시각 기반(arrival) 또는 샘플 수 기준(count)")
+    arg_parser.add_argument("--cal-hr-time", type=int, default=5)
+    arg_parser.add_argument("--threshold1", type=float, default=5.0)
+    arg_parser.add_argument("--threshold2", type=float, default=10.0)
+    arg_parser.add_argument("--threshold3", type=float, default=15.0)
+    arg_parser.add_argument("--window", type=int, default=100, help="HR 분석 창 길이 (샘플, 50Hz)")
+    arg_parser.add_argument("--hop", type=int, default=50, help="HR 갱신 간격 (샘플, 예: 10 = 200ms)")
+    arg_parser.add_argument("--estimator", choices=tuple(ep.HR_ESTIMATORS), default="peak",
+                            help="심박수 추정 백엔드 (spectral 계열은 --window 400 권장)")
+    args = arg_parser.parse_args()
+
+    summaries, sessions_per_minute = analyze_sessions(
+        args.paths, args.output_dir, args.workers, interval=args.hop / 50, num_points=args.hop,
+        timebase=args.timebase, cal_hr_time=args.cal_hr_time, threshold1=args.threshold1,
+        threshold2=args.threshold2, threshold3=args.threshold3, window_size=args.window, hop_size=args.hop,
+        estimator=args.estimator)
+    for summary in summaries:
+        print(f"{summary['path']}: {summary['windows']} windows ({summary['seconds']:.0f} s) "
+              f"in {summary['elapsed']:.2f} s (analysis CPU {summary['analysis_cpu']:.2f} s) -> {summary['output']}")
+    print(f"{len(summaries)} sessions, {sessions_per_minute:.1f} sessions/min")
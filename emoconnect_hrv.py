@@ -0,0 +1,178 @@
+# emoconnect_hrv.py
+# 박동 간격(RR) 스트림과 HRV 지표
+# HeartRateAnalyzer가 분석 창마다 검출한 피크를 창 중첩 구간에서 중복 없이 이어 붙여 연속 RR 간격 시계열을 만들고,
+# 최근 window_seconds초 구간의 RMSSD / SDNN / pNN50을 박동마다 O(1)로 갱신합니다. (피크 검출을 다시 하지 않음)
+import math
+from collections import deque
+from typing import NamedTuple
+
+import numpy as np
+
+
+class HrvMetrics(NamedTuple):
+    """
+    RRIntervalStream.collect() 결과
+    rr: 마지막 collect() 이후 새로 확정된 RR 간격 (ms, float64 배열)
+    rr_time: rr 각 간격이 끝나는 박동 시각 (스트림 시작 기준 초, float64 배열)
+    count: 평가 구간(최근 window_seconds초)의 RR 간격 수
+    mean_rr, sdnn, rmssd: 평가 구간의 평균 RR, RR 표준편차(ddof=1), 연속 RR 차이의 제곱 평균 제곱근 (ms)
+    pnn50: 평가 구간에서 연속 RR 차이가 50ms를 넘는 비율 (0 ~ 1)
+    (간격이 부족하면 nan: mean_rr는 1개, sdnn은 2개, rmssd/pnn50은 연속 차이 1개 이상 필요)
+    """
+    rr: np.ndarray
+    rr_time: np.ndarray
+    count: int
+    mean_rr: float
+    sdnn: float
+    rmssd: float
+    pnn50: float
+
+
+class RRIntervalStream:
+    """
+    연속 RR 간격 스트림
+    피크 위치는 스트림 시작부터 센 절대 샘플 인덱스로 받습니다. 창이 겹치므로 같은 박동이 여러 창에서
+    (추세 제거 차이로 1~2 샘플 어긋나게) 다시 검출되는데, 마지막으로 채택한 피크에서 dedupe_distance 샘플 이내의
+    피크는 같은 박동으로 보고 버립니다. 유효 범위(min_rr ~ max_rr)를 벗어난 간격은 시계열을 끊어
+    (누락/잡음 박동) 다음 간격과의 연속 차이를 계산하지 않습니다.
+
+    평가 구간 통계는 박동마다 누적 합을 더하고 구간을 벗어난 박동을 빼서 갱신하며,
+    누적 오차가 쌓이지 않도록 resync_interval 박동마다 보관 중인 박동으로부터 다시 계산합니다. (분할 상환 O(1))
+    """
+    def __init__(self, sample_rate=50, window_seconds=60.0, min_rr=0.25, max_rr=1.5, dedupe_distance=12,
+                 edge_guard=6, resync_interval=256):
+        """
+        sample_rate: 피크 인덱스의 샘플링 주파수 (Hz)
+        window_seconds: HRV 지표 평가 구간 (초, 박동 시각 기준)
+        min_rr, max_rr: 유효 RR 간격 범위 (초, 피크 간격 필터와 같은 기준)
+        dedupe_distance: 같은 박동으로 볼 피크 위치 차이 (샘플, 피크 검출 최소 거리와 같음)
+        edge_guard: 창 끝에서 이 샘플 수 안쪽의 피크는 다음 창에서 확정 (창 끝의 피크는 위치가 부정확함)
+        resync_interval: 누적 합을 다시 계산하는 박동 간격
+        """
+        self.sample_rate = sample_rate
+        self.window_seconds = window_seconds
+        self.min_rr = min_rr
+        self.max_rr = max_rr
+        self.dedupe_distance = dedupe_distance
+        self.edge_guard = edge_guard
+        self.resync_interval = resync_interval
+        self._beats = deque()  # (박동 시각 초, RR ms, 직전 RR과의 차이 ms 또는 None)
+        self.reset()
+
+    def __len__(self):
+        return len(self._beats)
+
+    def reset(self):
+        """시계열을 비웁니다. (미착용 등으로 박동 연속성이 끊긴 경우)"""
+        self._beats.clear()
+        self._last_peak = None
+        self._last_rr = None
+        self._new_rr = []
+        self._new_time = []
+        self._shift = 0.0
+        self._sum = 0.0  # Σ(rr - shift)
+        self._sum_sq = 0.0  # Σ(rr - shift)²
+        self._diff_count = 0
+        self._diff_sq = 0.0  # Σ(연속 차이)²
+        self._nn50 = 0
+        self._since_sync = 0
+
+    def add_peaks(self, positions, settled_until=None):
+        """
+        positions: 오름차순 피크 위치 (절대 샘플 인덱스)
+        settled_until: 이 위치 이상인 피크는 아직 확정하지 않음 (다음 창에서 다시 검출됨)
+        반환: 새로 확정된 RR 간격 수
+        """
+        added = 0
+        for position in positions:
+            if settled_until is not None and position >= settled_until:
+                break
+            if position < 0:
+                continue
+            last = self._last_peak
+            if last is not None and position <= last + self.dedupe_distance:
+                continue  # 이전 창에서 이미 채택한 박동 (또는 너무 가까운 잡음 피크)
+            self._last_peak = position
+            if last is None:
+                continue
+            rr = (position - last) / self.sample_rate
+            if not self.min_rr < rr < self.max_rr:
+                self._last_rr = None  # 시계열 끊김: 다음 간격은 연속 차이 없이 시작
+                continue
+            self._add_beat(position / self.sample_rate, rr * 1000.0)
+            added += 1
+        return added
+
+    def _add_beat(self, time, rr):
+        diff = None if self._last_rr is None else rr - self._last_rr
+        self._last_rr = rr
+        self._beats.append((time, rr, diff))
+        self._new_rr.append(rr)
+        self._new_time.append(time)
+        if len(self._beats) == 1:
+            self._shift = rr
+        centered = rr - self._shift
+        self._sum += centered
+        self._sum_sq += centered * centered
+        if diff is not None:
+            self._diff_count += 1
+            self._diff_sq += diff * diff
+            self._nn50 += abs(diff) > 50.0
+        # 평가 구간을 벗어난 박동 제거 (구간의 첫 박동은 직전 박동이 구간 밖이므로 연속 차이에서도 제외)
+        while self._beats[0][0] <= time - self.window_seconds:
+            old_rr = self._beats.popleft()[1]
+            centered = old_rr - self._shift
+            self._sum -= centered
+            self._sum_sq -= centered * centered
+            first_time, first_rr, first_diff = self._beats[0]
+            if first_diff is not None:
+                self._diff_count -= 1
+                self._diff_sq -= first_diff * first_diff
+                self._nn50 -= abs(first_diff) > 50.0
+                self._beats[0] = (first_time, first_rr, None)
+        self._since_sync += 1
+        if self._since_sync >= self.resync_interval:
+            self._resync()
+
+    def _resync(self):
+        rr = np.array([beat[1] for beat in self._beats])
+        diffs = np.array([beat[2] for beat in self._beats if beat[2] is not None])
+        self._shift = float(rr.mean())
+        centered = rr - self._shift
+        self._sum = float(centered.sum())
+        self._sum_sq = float((centered * centered).sum())
+        self._diff_sq = float((diffs * diffs).sum())
+        self._since_sync = 0
+
+    @property
+    def mean_rr(self):
+        count = len(self._beats)
+        return self._shift + self._sum / count if count else math.nan
+
+    @property
+    def sdnn(self):
+        count = len(self._beats)
+        if count < 2:
+            return math.nan
+        return math.sqrt(max(self._sum_sq - self._sum * self._sum / count, 0.0) / (count - 1))
+
+    @property
+    def rmssd(self):
+        return math.sqrt(max(self._diff_sq, 0.0) / self._diff_count) if self._diff_count else math.nan
+
+    @property
+    def pnn50(self):
+        return self._nn50 / self._diff_count if self._diff_count else math.nan
+
+    def rr_series(self):
+        """평가 구간의 (박동 시각 초, RR ms) float64 배열 쌍"""
+        beats = np.array([beat[:2] for beat in self._beats], dtype=np.float64).reshape(-1, 2)
+        return beats[:, 0], beats[:, 1]
+
+    def collect(self) -> HrvMetrics:
+        """마지막 collect() 이후 확정된 RR 간격과 현재 평가 구간의 HRV 지표를 반환합니다."""
+        metrics = HrvMetrics(np.array(self._new_rr, dtype=np.float64), np.array(self._new_time, dtype=np.float64),
+                             len(self._beats), self.mean_rr, self.sdnn, self.rmssd, self.pnn50)
+        self._new_rr = []
+        self._new_time = []
+        return metrics
@@ -0,0 +1,159 @@
+# emoconnect_kernels.py
+# 신호 처리 핫 패스 커널 (파싱, float16 디코딩, 추세 제거 연산자 적용, 피크 검출, 이동 평균 필터, 표시용 필터 체인)
+# 순수 Python(NumPy) 구현입니다. `python setup.py build_ext --inplace`로 emoconnect_kernels.pyx를 빌드하면
+# 같은 이름의 컴파일된 확장 모듈이 이 파일보다 먼저 로드됩니다. (COMPILED로 확인)
+import math
+
+import numpy as np
+
+COMPILED = False
+
+# 센서 데이터 청크(20바이트): ppg(uint16) + acc/gyro/mag 9개 float16 (리틀 엔디안)
+_FRAME_DTYPE = np.dtype([('ppg', '<u2'), ('imu', '<f2', (9,))])
+
+
+def float16_to_float32(bits):
+    """16비트 정수 비트 패턴(0 ~ 0xFFFF)을 float 값으로 변환합니다."""
+    return float(np.uint16(bits).view(np.float16))
+
+
+def decode_float16(bits):
+    """float16 비트 패턴 배열을 float32 배열로 변환합니다."""
+    return np.ascontiguousarray(bits, dtype=np.uint16).view(np.float16).astype(np.float32)
+
+
+def parse_frames(data, count):
+    """
+    data의 앞 count개 20바이트 청크를 디코딩합니다.
+    반환: (ppg (count,) uint16, imu (count, 9) float32 - acc, gyro, mag 순서)
+    """
+    records = np.frombuffer(data, dtype=_FRAME_DTYPE, count=count)
+    return records['ppg'].copy(), records['imu'].astype(np.float32)
+
+
+def detrend(operator, values):
+    """
+    추세 제거 연산자(대칭 행렬) operator를 values에 적용합니다. (operator @ values)
+    values: 길이 window_size의 float64 배열
+    """
+    return operator @ values
+
+
+def detrend_rows(operator, matrix):
+    """(N, window_size) 행렬의 각 행에 detrend()를 적용합니다. (행마다 detrend()와 같은 결과)"""
+    return (operator @ matrix[:, :, None])[:, :, 0]
+
+
+def find_peaks(values, height, distance, max_num):
+    """
+    values: float64 배열
+    양쪽 이웃보다 크고 height를 넘는 피크를 값이 큰 순으로 distance 이상 떨어지게 최대 max_num개 선택합니다.
+    (max_num이 0 이하이면 개수 제한 없음)
+    반환: 오름차순 정렬된 피크 인덱스 리스트
+    """
+    if values.size < 3:
+        return []
+    # 모든 피크 후보 (양쪽 이웃보다 큰 값) 중 height 초과
+    center = values[1:-1]
+    mask = (center > values[:-2]) & (center > values[2:]) & (center > height)
+    candidate_indices = np.flatnonzero(mask) + 1
+    # 값이 큰 순으로 정렬 (안정 정렬: 같은 값은 앞선 인덱스 우선), 이후 distance 기준 필터링
+    candidate_indices = candidate_indices[np.argsort(-values[candidate_indices], kind='stable')]
+    # 채택된 피크로부터 distance 미만 거리의 인덱스를 표시하는 점유 배열
+    reach = max(math.ceil(distance) - 1, 0)
+    occupied = np.zeros(values.size, dtype=bool)
+    peak_indices = []
+    for idx in candidate_indices.tolist():
+        if occupied[idx]:
+            continue
+        peak_indices.append(idx)
+        if len(peak_indices) == max_num:
+            break
+        occupied[max(idx - reach, 0):idx + reach + 1] = True
+    return sorted(peak_indices)
+
+
+def sma_block(ring, head, count, total, values, out):
+    """
+    단순 이동 평균(SMA) 필터를 values의 모든 샘플에 차례로 적용합니다.
+    ring: 길이 window_size의 float64 링 버퍼 (제자리에서 갱신), head: 다음 기록 위치,
+    count: 창에 들어 있는 샘플 수, total: 창 합계
+    out: 결과를 기록할 float64 배열 (values와 같은 배열이어도 됨)
+    반환: 갱신된 (head, count, total)
+    """
+    window_size = len(ring)
+    size = len(values)
+    # 과거 창(오래된 순, 미충전 칸은 0) + 새 샘플: i번째 샘플이 밀어내는 값은 extended[i]
+    extended = np.concatenate((ring[head:], ring[:head], values))
+    if count == window_size:
+        counts = window_size
+    else:
+        counts = np.minimum(count + np.arange(1, size + 1), window_size)
+    # 누적 합 갱신을 샘플 단위 계산과 같은 순서로 더함: sum_i = sum_(i-1) + (x_i - old_i)
+    sums = values - extended[:size]
+    sums[0] += total
+    np.cumsum(sums, out=sums)
+    ring[:] = extended[-window_size:]
+    np.divide(sums, counts, out=out)
+    return 0, min(count + size, window_size), float(sums[-1])
+
+
+def wma_block(ring, head, count, total, weighted, values, out):
+    """
+    가중 이동 평균(WMA, 가중치 1 ~ window_size) 필터를 values의 모든 샘플에 차례로 적용합니다.
+    인수는 sma_block()과 같고, weighted는 창의 가중 합입니다.
+    반환: 갱신된 (head, count, total, weighted)
+    """
+    window_size = len(ring)
+    size = len(values)
+    extended = np.concatenate((ring[head:], ring[:head], values))
+    # sums[i]: i번째 샘플 입력 직전의 창 합계 (샘플 단위 계산과 같은 순서로 누적)
+    sums = np.empty(size + 1)
+    sums[0] = total
+    np.subtract(values, extended[:size], out=sums[1:])
+    np.cumsum(sums, out=sums)
+    if count == window_size:
+        counts = window_size
+        removed = sums[:-1]
+    else:
+        seen = count + np.arange(size)  # 각 샘플 입력 직전의 창 샘플 수
+        counts = np.minimum(seen + 1, window_size)
+        removed = np.where(seen >= window_size, sums[:-1], 0.0)
+    weighted_sums = counts * values - removed
+    weighted_sums[0] += weighted
+    np.cumsum(weighted_sums, out=weighted_sums)
+    ring[:] = extended[-window_size:]
+    np.divide(weighted_sums, counts * (counts + 1) // 2, out=out)
+    return 0, min(count + size, window_size), float(sums[-1]), float(weighted_sums[-1])
+
+
+def display_chain(values, size, normalize, ring1, state1, ring2, state2, ring3, state3, out):
+    """
+    표시용 필터 체인: (normalize이면) -1 ~ 1 정규화 후 SMA → WMA → SMA를 values의 앞 size개 샘플에 적용합니다.
+    values: float64 배열 (정규화 범위는 values 전체 기준, 값이 모두 같으면 0으로 정규화)
+    ring1, ring3 / state1, state3: 두 SMA의 링 버퍼와 (head, count, total)
+    ring2 / state2: WMA의 링 버퍼와 (head, count, total, weighted)
+    out: 결과를 기록할 float64 배열 (values와 같은 버퍼여도 됨)
+    반환: 갱신된 (state1, state2, state3)
+    컴파일 버전은 샘플마다 세 단계를 한 번에 통과시키는 단일 루프이고, 이 Python 구현은 블록 커널을
+    out 위에서 차례로 적용합니다. (결과는 비트 단위로 같음)
+    """
+    buffer = out[:size]
+    buffer[:] = values[:size]
+    if normalize and size:
+        min_val = values.min()
+        span = values.max() - min_val
+        if span == 0:
+            buffer.fill(0.0)
+        else:
+            # normalize_to_minus_one_to_one()과 같은 연산 순서: (2 * (x - min) / span) - 1
+            buffer -= min_val
+            buffer *= 2
+            buffer /= span
+            buffer -= 1
+    if not size:
+        return state1, state2, state3
+    state1 = sma_block(ring1, *state1, buffer, buffer)
+    state2 = wma_block(ring2, *state2, buffer, buffer)
+    state3 = sma_block(ring3, *state3, buffer, buffer)
+    return state1, state2, state3
@@ -0,0 +1,319 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True, initializedcheck=False
+# emoconnect_kernels.pyx
+# emoconnect_kernels.py의 컴파일 버전 (타입 지정 메모리뷰, GIL 해제 루프)
+# 빌드: python setup.py build_ext --inplace  →  같은 이름의 .py보다 먼저 로드됩니다.
+# 함수 시그니처와 결과는 emoconnect_kernels.py와 같습니다. (detrend는 합산 순서 차이로 마지막 비트만 다를 수 있음)
+from libc.math cimport ceil
+from libc.stdlib cimport calloc, free, malloc, qsort
+from libc.string cimport memcpy
+
+import numpy as np
+
+COMPILED = True
+
+
+cdef float _convert_half(unsigned int half) noexcept nogil:
+    # IEEE-754 binary16 → binary32 비트 변환 (서브노멀 정규화, inf/NaN 페이로드 유지)
+    cdef unsigned int sign = (half & 0x8000) << 16
+    cdef unsigned int exponent = (half >> 10) & 0x1F
+    cdef unsigned int fraction = half & 0x3FF
+    cdef unsigned int bits
+    cdef float value
+    if exponent == 0x1F:
+        bits = sign | 0x7F800000 | (fraction << 13)
+    elif exponent != 0:
+        bits = sign | ((exponent + 112) << 23) | (fraction << 13)
+    elif fraction == 0:
+        bits = sign
+    else:
+        exponent = 113
+        while not fraction & 0x400:
+            fraction <<= 1
+            exponent -= 1
+        bits = sign | (exponent << 23) | ((fraction & 0x3FF) << 13)
+    memcpy(&value, &bits, 4)
+    return value
+
+
+# 65,536개 비트 패턴 전체의 변환 테이블 (모듈 로드 시 한 번 계산)
+cdef float _HALF_TABLE[65536]
+cdef unsigned int _pattern
+for _pattern in range(65536):
+    _HALF_TABLE[_pattern] = _convert_half(_pattern)
+
+
+cdef inline float _half_to_float(unsigned int half) noexcept nogil:
+    return _HALF_TABLE[half]
+
+
+def float16_to_float32(unsigned int bits):
+    """16비트 정수 비트 패턴(0 ~ 0xFFFF)을 float 값으로 변환합니다."""
+    return _half_to_float(bits & 0xFFFF)
+
+
+def decode_float16(bits):
+    """float16 비트 패턴 배열을 float32 배열로 변환합니다."""
+    cdef const unsigned short[::1] source = np.ascontiguousarray(bits, dtype=np.uint16).ravel()
+    result = np.empty(source.shape[0], dtype=np.float32)
+    cdef float[::1] out = result
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(source.shape[0]):
+            out[i] = _half_to_float(source[i])
+    return result.reshape(np.shape(bits))
+
+
+def parse_frames(const unsigned char[::1] data, Py_ssize_t count):
+    """
+    data의 앞 count개 20바이트 청크를 디코딩합니다.
+    반환: (ppg (count,) uint16, imu (count, 9) float32 - acc, gyro, mag 순서)
+    """
+    if count * 20 > data.shape[0]:
+        raise ValueError("data is shorter than count frames")
+    ppg = np.empty(count, dtype=np.uint16)
+    imu = np.empty((count, 9), dtype=np.float32)
+    cdef unsigned short[::1] ppg_out = ppg
+    cdef float[:, ::1] imu_out = imu
+    cdef Py_ssize_t i, k, base
+    with nogil:
+        for i in range(count):
+            base = 20 * i
+            ppg_out[i] = data[base] | (data[base + 1] << 8)
+            for k in range(9):
+                imu_out[i, k] = _half_to_float(data[base + 2 + 2 * k] | (data[base + 3 + 2 * k] << 8))
+    return ppg, imu
+
+
+cdef void _apply(const double[:, ::1] operator, const double[::1] values, double[::1] out) noexcept nogil:
+    # out = operator @ values
+    # operator가 대칭이므로 행 단위 연속 접근으로 누적 (out += operator[j] * values[j], j 순서대로 더함)
+    # 4행씩 묶어 out 읽기/쓰기를 줄이되 덧셈 순서는 한 행씩 누적하는 것과 같음
+    cdef Py_ssize_t size = operator.shape[0]
+    cdef Py_ssize_t i, j = 0
+    cdef double v0, v1, v2, v3
+    cdef double* result = &out[0]
+    cdef const double* r0
+    cdef const double* r1
+    cdef const double* r2
+    cdef const double* r3
+    for i in range(size):
+        result[i] = 0.0
+    while j + 4 <= size:
+        v0, v1, v2, v3 = values[j], values[j + 1], values[j + 2], values[j + 3]
+        r0, r1, r2, r3 = &operator[j, 0], &operator[j + 1, 0], &operator[j + 2, 0], &operator[j + 3, 0]
+        for i in range(size):
+            result[i] = (((result[i] + r0[i] * v0) + r1[i] * v1) + r2[i] * v2) + r3[i] * v3
+        j += 4
+    while j < size:
+        v0 = values[j]
+        r0 = &operator[j, 0]
+        for i in range(size):
+            result[i] = result[i] + r0[i] * v0
+        j += 1
+
+
+def detrend(const double[:, ::1] operator, const double[::1] values):
+    """
+    추세 제거 연산자(대칭 행렬) operator를 values에 적용합니다. (operator @ values)
+    values: 길이 window_size의 float64 배열
+    """
+    if values.shape[0] != operator.shape[0]:
+        raise ValueError("values length does not match operator")
+    result = np.empty(operator.shape[0])
+    cdef double[::1] out = result
+    with nogil:
+        _apply(operator, values, out)
+    return result
+
+
+def detrend_rows(const double[:, ::1] operator, const double[:, ::1] matrix):
+    """(N, window_size) 행렬의 각 행에 detrend()를 적용합니다. (행마다 detrend()와 같은 결과)"""
+    if matrix.shape[1] != operator.shape[0]:
+        raise ValueError("matrix width does not match operator")
+    result = np.empty((matrix.shape[0], matrix.shape[1]))
+    cdef double[:, ::1] out = result
+    cdef Py_ssize_t row
+    with nogil:
+        for row in range(matrix.shape[0]):
+            _apply(operator, matrix[row], out[row])
+    return result
+
+
+cdef struct _Candidate:
+    double value
+    Py_ssize_t index
+
+
+cdef int _compare_candidates(const void* a, const void* b) noexcept nogil:
+    # 값이 큰 순, 같은 값은 앞선 인덱스 우선 (NumPy 안정 정렬과 같은 순서)
+    cdef const _Candidate* left = <const _Candidate*> a
+    cdef const _Candidate* right = <const _Candidate*> b
+    if left.value > right.value:
+        return -1
+    if left.value < right.value:
+        return 1
+    return (left.index > right.index) - (left.index < right.index)
+
+
+def find_peaks(const double[::1] values, double height, double distance, Py_ssize_t max_num):
+    """
+    values: float64 배열
+    양쪽 이웃보다 크고 height를 넘는 피크를 값이 큰 순으로 distance 이상 떨어지게 최대 max_num개 선택합니다.
+    (max_num이 0 이하이면 개수 제한 없음)
+    반환: 오름차순 정렬된 피크 인덱스 리스트
+    """
+    cdef Py_ssize_t size = values.shape[0]
+    if size < 3:
+        return []
+    cdef _Candidate* candidates = <_Candidate*> malloc(size * sizeof(_Candidate))
+    cdef char* occupied = <char*> calloc(size, 1)
+    cdef Py_ssize_t* selected = <Py_ssize_t*> malloc(size * sizeof(Py_ssize_t))
+    if candidates == NULL or occupied == NULL or selected == NULL:
+        free(candidates)
+        free(occupied)
+        free(selected)
+        raise MemoryError()
+    cdef Py_ssize_t reach = <Py_ssize_t> ceil(distance) - 1
+    if reach < 0:
+        reach = 0
+    cdef Py_ssize_t num_candidates = 0, num_selected = 0
+    cdef Py_ssize_t i, idx, start, stop
+    cdef double value
+    with nogil:
+        for i in range(1, size - 1):
+            value = values[i]
+            if value > values[i - 1] and value > values[i + 1] and value > height:
+                candidates[num_candidates].value = value
+                candidates[num_candidates].index = i
+                num_candidates += 1
+        qsort(candidates, num_candidates, sizeof(_Candidate), _compare_candidates)
+        for i in range(num_candidates):
+            idx = candidates[i].index
+            if occupied[idx]:
+                continue
+            selected[num_selected] = idx
+            num_selected += 1
+            if num_selected == max_num:
+                break
+            start = idx - reach if idx > reach else 0
+            stop = idx + reach + 1 if idx + reach + 1 < size else size
+            while start < stop:
+                occupied[start] = 1
+                start += 1
+    peak_indices = sorted([selected[i] for i in range(num_selected)])
+    free(candidates)
+    free(occupied)
+    free(selected)
+    return peak_indices
+
+
+cdef inline double _sma_step(double* ring, Py_ssize_t window_size, Py_ssize_t* head, Py_ssize_t* count,
+                             double* total, double new_value) noexcept nogil:
+    # SMA 샘플 하나: 링 버퍼 갱신 후 창 평균 반환 (sma_block과 같은 연산 순서)
+    cdef double old_value = ring[head[0]]
+    ring[head[0]] = new_value
+    head[0] += 1
+    if head[0] == window_size:
+        head[0] = 0
+    if count[0] < window_size:
+        count[0] += 1
+    total[0] += new_value - old_value
+    return total[0] / count[0]
+
+
+cdef inline double _wma_step(double* ring, Py_ssize_t window_size, Py_ssize_t* head, Py_ssize_t* count,
+                             double* total, double* weighted, double new_value) noexcept nogil:
+    # WMA 샘플 하나 (wma_block과 같은 연산 순서)
+    cdef double old_value = ring[head[0]]
+    ring[head[0]] = new_value
+    head[0] += 1
+    if head[0] == window_size:
+        head[0] = 0
+    if count[0] < window_size:
+        # 창이 차는 동안에는 기존 샘플의 가중치가 그대로 유지됨
+        count[0] += 1
+        weighted[0] += count[0] * new_value
+    else:
+        # 창이 가득 차면 모든 샘플의 가중치가 1씩 줄어듦
+        weighted[0] += window_size * new_value - total[0]
+    total[0] += new_value - old_value
+    return weighted[0] / (count[0] * (count[0] + 1) // 2)
+
+
+def sma_block(double[::1] ring, Py_ssize_t head, Py_ssize_t count, double total,
+              const double[::1] values, double[::1] out):
+    """
+    단순 이동 평균(SMA) 필터를 values의 모든 샘플에 차례로 적용합니다.
+    ring: 길이 window_size의 float64 링 버퍼 (제자리에서 갱신), head: 다음 기록 위치,
+    count: 창에 들어 있는 샘플 수, total: 창 합계
+    out: 결과를 기록할 float64 배열 (values와 같은 배열이어도 됨)
+    반환: 갱신된 (head, count, total)
+    """
+    if out.shape[0] < values.shape[0]:
+        raise ValueError("out is shorter than values")
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(values.shape[0]):
+            out[i] = _sma_step(&ring[0], ring.shape[0], &head, &count, &total, values[i])
+    return head, count, total
+
+
+def wma_block(double[::1] ring, Py_ssize_t head, Py_ssize_t count, double total, double weighted,
+              const double[::1] values, double[::1] out):
+    """
+    가중 이동 평균(WMA, 가중치 1 ~ window_size) 필터를 values의 모든 샘플에 차례로 적용합니다.
+    인수는 sma_block()과 같고, weighted는 창의 가중 합입니다.
+    반환: 갱신된 (head, count, total, weighted)
+    """
+    if out.shape[0] < values.shape[0]:
+        raise ValueError("out is shorter than values")
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(values.shape[0]):
+            out[i] = _wma_step(&ring[0], ring.shape[0], &head, &count, &total, &weighted, values[i])
+    return head, count, total, weighted
+
+
+def display_chain(const double[::1] values, Py_ssize_t size, bint normalize,
+                  double[::1] ring1, tuple state1, double[::1] ring2, tuple state2,
+                  double[::1] ring3, tuple state3, double[::1] out):
+    """
+    표시용 필터 체인: (normalize이면) -1 ~ 1 정규화 후 SMA → WMA → SMA를 values의 앞 size개 샘플에 적용합니다.
+    인수와 반환은 emoconnect_kernels.py와 같습니다. 샘플마다 정규화와 세 필터를 한 번에 통과시키는 단일 루프
+    (중간 배열 없음, values와 out이 같은 버퍼여도 됨)
+    """
+    if size > values.shape[0] or size > out.shape[0]:
+        raise ValueError("size exceeds values or out")
+    cdef Py_ssize_t head1 = state1[0], count1 = state1[1]
+    cdef double total1 = state1[2]
+    cdef Py_ssize_t head2 = state2[0], count2 = state2[1]
+    cdef double total2 = state2[2], weighted2 = state2[3]
+    cdef Py_ssize_t head3 = state3[0], count3 = state3[1]
+    cdef double total3 = state3[2]
+    cdef Py_ssize_t i
+    cdef double min_val = 0.0, max_val = 0.0, span = 0.0, value
+    if size == 0:
+        return state1, state2, state3
+    with nogil:
+        if normalize:
+            min_val = values[0]
+            max_val = values[0]
+            for i in range(1, values.shape[0]):
+                if values[i] < min_val:
+                    min_val = values[i]
+                if values[i] > max_val:
+                    max_val = values[i]
+            span = max_val - min_val
+        for i in range(size):
+            value = values[i]
+            if normalize:
+                if span == 0:
+                    value = 0.0
+                else:
+                    # normalize_to_minus_one_to_one()과 같은 연산 순서: (2 * (x - min) / span) - 1
+                    value = (value - min_val) * 2
+                    value = value / span - 1
+            value = _sma_step(&ring1[0], ring1.shape[0], &head1, &count1, &total1, value)
+            value = _wma_step(&ring2[0], ring2.shape[0], &head2, &count2, &total2, &weighted2, value)
+            out[i] = _sma_step(&ring3[0], ring3.shape[0], &head3, &count3, &total3, value)
+    return (head1, count1, total1), (head2, count2, total2, weighted2), (head3, count3, total3)
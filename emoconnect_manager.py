@@ -0,0 +1,183 @@
+# emoconnect_manager.py
+# 하나의 asyncio 루프에서 여러 장치(EmoConnect/VitalTrack 밴드)를 동시에 관리하는 세션 매니저
+import asyncio
+import time
+from collections import deque
+
+from emoconnect_session import SensorSession, analyze_window, resample_window
+
+
+class SessionManager:
+    """
+    다중 장치 세션 매니저
+    장치마다 독립된 SensorSession(수신 버퍼, 분석기 상태)을 만들고, 연결을 동시에 수행하며,
+    1초 주기 처리 작업을 공정하게 스케줄링합니다.
+
+    스케줄링: 처리 시각이 된 장치를 예정 시각이 가장 이른 순서로 하나씩 처리하고,
+    장치 사이마다 이벤트 루프에 양보하여 다른 장치의 알림 수신이 밀리지 않도록 합니다.
+    batch_analyzer를 지정하면 처리 시각이 된 장치들을 각각 보간한 뒤 HR 분석은 한 번에 일괄 수행합니다.
+    """
+    def __init__(self, analyzer_factory=None, on_result=None, interval=1.0,
+                 max_concurrent_connects=8, transport_factory=None, batch_analyzer=None):
+        """
+        analyzer_factory: 장치마다 새 HR 분석기를 만드는 함수 (예: lambda: ep.HeartRateAnalyzer(5))
+        on_result: (session, result)를 받는 콜백
+        interval: 장치별 처리 주기 (초)
+        max_concurrent_connects: 동시에 진행할 최대 연결 시도 수
+        transport_factory: address를 받아 Transport를 만드는 함수 (기본값: BleakTransport)
+        batch_analyzer: 여러 장치의 분석기를 한 번에 갱신하는 일괄 분석기 (예: ep.BatchHeartRateAnalyzer(),
+                        accepts(analyzer)가 False인 분석기는 장치별로 처리)
+        """
+        self.analyzer_factory = analyzer_factory
+        self.on_result = on_result
+        self.interval = interval
+        self.max_concurrent_connects = max_concurrent_connects
+        self.transport_factory = transport_factory
+        self.batch_analyzer = batch_analyzer
+        self.sessions = {}
+        self.stats = {}
+        self._running = False
+
+    def add_device(self, address, device_id=''):
+        """장치를 등록하고 해당 SensorSession을 반환합니다."""
+        analyzer = self.analyzer_factory() if self.analyzer_factory else None
+        transport = self.transport_factory(address) if self.transport_factory else None
+        session = SensorSession(address, device_id=device_id, hr_analyzer=analyzer,
+                                interval=self.interval, transport=transport, auto_process=False)
+        self.sessions[address] = session
+        self.stats[address] = {
+            'processed': 0,
+            'cpu_time': 0.0,
+            'latency': deque(maxlen=1000),  # 예정 시각 대비 결과 전달 지연 (초)
+        }
+        return session
+
+    def remove_device(self, address):
+        self.stats.pop(address, None)
+        return self.sessions.pop(address)
+
+    async def connect_all(self):
+        """
+        등록된 모든 장치에 동시에 연결합니다.
+        반환: {address: 예외 또는 None}
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_connects)
+
+        async def connect(session):
+            async with semaphore:
+                await session.connect()
+
+        sessions = list(self.sessions.values())
+        results = await asyncio.gather(*(connect(s) for s in sessions), return_exceptions=True)
+        errors = {}
+        for session, result in zip(sessions, results):
+            if isinstance(result, Exception):
+                print(f"Error connecting to {session.address}: {result}")
+            errors[session.address] = result
+        return errors
+
+    async def start_all(self):
+        await asyncio.gather(*(s.start_measure() for s in self.sessions.values() if s.is_connected))
+
+    async def stop_all(self):
+        await asyncio.gather(*(s.stop_measure() for s in self.sessions.values() if s.is_connected))
+
+    async def disconnect_all(self):
+        await asyncio.gather(*(s.disconnect() for s in self.sessions.values()))
+
+    def due_sessions(self, now):
+        """처리 시각이 된 세션을 예정 시각이 이른 순서로 반환합니다."""
+        due = [s for s in self.sessions.values() if s.is_connected and s.due_time <= now]
+        due.sort(key=lambda s: s.due_time)
+        return due
+
+    def process_session(self, session):
+        """세션 하나의 주기 처리를 수행하고 통계를 갱신합니다."""
+        deadline = session.due_time
+        cpu_start = time.process_time()
+        try:
+            result = session.process()
+        except Exception as e:
+            print(f"Error processing {session.address}: {e}")
+            result = None
+        self._finish(session, deadline, result, time.process_time() - cpu_start)
+        return result
+
+    def process_batch(self, sessions):
+        """
+        처리 시각이 된 세션들을 각각 보간한 뒤, batch_analyzer가 받는 분석기들의 HR 분석을 한 번에 수행하고
+        세션별로 결과를 전달합니다. (CPU 시간은 세션 수로 나누어 통계에 기록)
+        """
+        deadlines = [session.due_time for session in sessions]
+        cpu_start = time.process_time()
+        results = []
+        for session in sessions:
+            try:
+                results.append(resample_window(session.stream.drain(), session.num_points, session.resampler))
+            except Exception as e:
+                print(f"Error processing {session.address}: {e}")
+                results.append(None)
+        batched = []
+        for session, result in zip(sessions, results):
+            if result is None or session.hr_analyzer is None:
+                continue
+            if self.batch_analyzer.accepts(session.hr_analyzer):
+                batched.append((session, result))
+                continue
+            try:
+                analyze_window(result, session.hr_analyzer)
+            except Exception as e:
+                print(f"Error processing {session.address}: {e}")
+        if batched:
+            try:
+                analyses = self.batch_analyzer.update([session.hr_analyzer for session, _ in batched],
+                                                      [result['ppg'] for _, result in batched],
+                                                      [result['acc'] for _, result in batched])
+                for (_, result), analysis in zip(batched, analyses):
+                    result['hr'] = analysis.hr
+                    result['filtered_ppg'] = analysis.filtered_ppg
+                    result['hrv'] = analysis.hrv
+                    result['quality'] = analysis.quality
+            except Exception as e:
+                print(f"Error in batch analysis: {e}")
+        for session, result in zip(sessions, results):
+            if result is not None:
+                result['timestamp'] = time.time()
+                session.publish(result)
+        cpu_time = (time.process_time() - cpu_start) / max(len(sessions), 1)
+        for session, deadline, result in zip(sessions, deadlines, results):
+            self._finish(session, deadline, result, cpu_time)
+        return results
+
+    def _finish(self, session, deadline, result, cpu_time):
+        now = time.time()
+        stats = self.stats[session.address]
+        stats['processed'] += 1
+        stats['cpu_time'] += cpu_time
+        stats['latency'].append(now - deadline)
+        # 한 주기 이상 밀리지 않았다면 고정 간격을 유지, 밀렸다면 현재 시각부터 다시 시작
+        session.last_timestamp = deadline if now - deadline < session.interval else now
+        if result is not None and self.on_result:
+            self.on_result(session, result)
+
+    async def run(self):
+        """stop()이 호출될 때까지 장치별 주기 처리를 스케줄링합니다."""
+        self._running = True
+        while self._running:
+            due = self.due_sessions(time.time())
+            if self.batch_analyzer is not None:
+                if due:
+                    self.process_batch(due)
+                    await asyncio.sleep(0)
+            else:
+                for session in due:
+                    self.process_session(session)
+                    await asyncio.sleep(0)
+                    if not self._running:
+                        break
+            next_due = min((s.due_time for s in self.sessions.values() if s.is_connected),
+                           default=time.time() + self.interval)
+            await asyncio.sleep(min(max(0.0, next_due - time.time()), self.interval))
+
+    def stop(self):
+        self._running = False
@@ -1,43 +1,170 @@
 import math
+from abc import ABC, abstractmethod
+from typing import NamedTuple, Optional
+
 import numpy as np
 
+import emoconnect_kernels as ek
+from emoconnect_hrv import HrvMetrics
+from emoconnect_quality import SignalQuality
+from emoconnect_utils import MotionNoiseEstimator
+
 
 #########################################
 # 필터 클래스들 (이전 Flutter에서의 필터와 동일)
 #########################################
 class MovingAverageFilter:
+    """
+    단순 이동 평균(SMA) 필터
+    길이 window_size의 링 버퍼와 누적 합으로 샘플당 O(1)에 계산합니다.
+    """
     def __init__(self, window_size):
         self.window_size = window_size
-        self._values = []
+        self.clear()
 
     def filter(self, new_value):
-        self._values.append(new_value)
-        if len(self._values) > self.window_size:
-            self._values.pop(0)
-        return np.mean(self._values)
+        new_value = float(new_value)
+        old_value = self._ring.item(self._head)
+        self._ring[self._head] = new_value
+        self._head = (self._head + 1) % self.window_size
+        if self._count < self.window_size:
+            self._count += 1
+        self._sum += new_value - old_value
+        return self._sum / self._count
+
+    def filter_block(self, values, out=None):
+        """
+        values의 모든 샘플에 filter()를 차례로 적용한 것과 동일한 결과를 한 번의 벡터 연산으로 계산합니다.
+        out: 결과를 기록할 float64 배열 (values와 같은 배열이어도 됨, 생략 시 새로 할당)
+        반환: float64 배열 (필터 상태도 filter() 반복 호출과 같게 갱신)
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+        if out is None:
+            out = np.empty(len(values))
+        if len(values):
+            self._head, self._count, self._sum = ek.sma_block(self._ring, self._head, self._count, self._sum,
+                                                              values, out)
+        return out
 
     def clear(self):
-        self._values.clear()
+        self._ring = np.zeros(self.window_size)
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
 
 
 class WeightedMovingAverageFilter:
+    """
+    가중 이동 평균(WMA) 필터 (가장 최근 샘플의 가중치가 가장 큼: 1, 2, ..., window_size)
+    링 버퍼, 누적 합, 누적 가중 합으로 샘플당 O(1)에 계산합니다.
+    """
     def __init__(self, window_size):
         self.window_size = window_size
-        self._values = []
-        self._weights = np.arange(1, window_size + 1)
+        self.clear()
 
     def filter(self, new_value):
-        self._values.append(new_value)
-        if len(self._values) > self.window_size:
-            self._values.pop(0)
+        new_value = float(new_value)
+        old_value = self._ring.item(self._head)
+        self._ring[self._head] = new_value
+        self._head = (self._head + 1) % self.window_size
+        if self._count < self.window_size:
+            # 창이 차는 동안에는 기존 샘플의 가중치가 그대로 유지됨
+            self._count += 1
+            self._weighted_sum += self._count * new_value
+        else:
+            # 창이 가득 차면 모든 샘플의 가중치가 1씩 줄어듦 (가장 오래된 샘플은 0이 되어 빠짐)
+            self._weighted_sum += self.window_size * new_value - self._sum
+        self._sum += new_value - old_value
+        return self._weighted_sum / (self._count * (self._count + 1) // 2)
+
+    def filter_block(self, values, out=None):
+        """
+        values의 모든 샘플에 filter()를 차례로 적용한 것과 동일한 결과를 한 번의 벡터 연산으로 계산합니다.
+        out: 결과를 기록할 float64 배열 (values와 같은 배열이어도 됨, 생략 시 새로 할당)
+        반환: float64 배열 (필터 상태도 filter() 반복 호출과 같게 갱신)
+        """
+        values = np.ascontiguousarray(values, dtype=np.float64).ravel()
+        if out is None:
+            out = np.empty(len(values))
+        if len(values):
+            self._head, self._count, self._sum, self._weighted_sum = ek.wma_block(
+                self._ring, self._head, self._count, self._sum, self._weighted_sum, values, out)
+        return out
+
+    def clear(self):
+        self._ring = np.zeros(self.window_size)
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._weighted_sum = 0.0
 
-        total_weight = np.sum(self._weights[:len(self._values)])
-        weighted_sum = np.dot(self._values, self._weights[:len(self._values)])
 
-        return weighted_sum / total_weight
+class FilterChain:
+    """
+    필터 체인: (선택적) -1 ~ 1 정규화 후 filters를 순서대로 적용합니다.
+    모든 단계가 미리 할당한 float64 버퍼 하나를 제자리에서 갱신하므로 단계별 중간 리스트가 생기지 않으며,
+    각 필터의 상태는 호출 사이에 유지됩니다. 채널마다 별도의 FilterChain을 만들어 사용합니다.
+    SMA → WMA → SMA 구성(ppg_display)은 ek.display_chain 커널로 정규화와 세 필터를 샘플마다 한 번에 통과시킵니다.
+    """
+    def __init__(self, *filters, normalize=True, capacity=100):
+        """
+        filters: filter_block(values, out)을 제공하는 필터 (예: MovingAverageFilter(9), WeightedMovingAverageFilter(7))
+        normalize: True이면 normalize_to_minus_one_to_one()과 같은 정규화를 먼저 적용
+        capacity: 미리 할당할 버퍼 길이 (더 긴 입력이 들어오면 늘어남)
+        """
+        self.filters = filters
+        self.normalize = normalize
+        self._buffer = np.zeros(capacity, dtype=np.float64)
+        self._fused = [type(stage) for stage in filters] == [MovingAverageFilter, WeightedMovingAverageFilter,
+                                                             MovingAverageFilter]
+
+    @classmethod
+    def ppg_display(cls):
+        """HeartRateAnalyzer의 PPG 그래프용 체인: 정규화 + SMA(9) + WMA(7) + SMA(5)"""
+        return cls(MovingAverageFilter(9), WeightedMovingAverageFilter(7), MovingAverageFilter(5))
+
+    def process(self, values, size=None):
+        """
+        values: 실수형 리스트 또는 배열
+        size: 필터에 통과시킬 앞쪽 샘플 수 (정규화 범위는 values 전체 기준, 생략 시 전체)
+        반환: 필터링된 size 길이의 float64 배열 (내부 버퍼의 뷰, 다음 호출 시 덮어씀)
+        """
+        total = len(values)
+        size = total if size is None else min(size, total)
+        if total > len(self._buffer):
+            self._buffer = np.zeros(total, dtype=np.float64)
+        self._buffer[:total] = values
+        buffer = self._buffer[:size]
+        if self._fused:
+            first, weighted, last = self.filters
+            states = ek.display_chain(
+                self._buffer[:total], size, self.normalize,
+                first._ring, (first._head, first._count, first._sum),
+                weighted._ring, (weighted._head, weighted._count, weighted._sum, weighted._weighted_sum),
+                last._ring, (last._head, last._count, last._sum), buffer)
+            (first._head, first._count, first._sum), \
+                (weighted._head, weighted._count, weighted._sum, weighted._weighted_sum), \
+                (last._head, last._count, last._sum) = states
+            return buffer
+        if self.normalize and size:
+            min_val = self._buffer[:total].min()
+            span = self._buffer[:total].max() - min_val
+            if span == 0:
+                # 값이 모두 같으면 정규화 구간이 없으므로 0으로 둠
+                buffer.fill(0.0)
+            else:
+                # normalize_to_minus_one_to_one()과 같은 연산 순서: (2 * (x - min) / span) - 1
+                buffer -= min_val
+                buffer *= 2
+                buffer /= span
+                buffer -= 1
+        for stage in self.filters:
+            stage.filter_block(buffer, out=buffer)
+        return buffer
 
     def clear(self):
-        self._values.clear()
+        for stage in self.filters:
+            stage.clear()
 
 
 def normalize_to_minus_one_to_one(data):
@@ -65,27 +192,7 @@ class PeakDetector:
 
         반환: 오름차순 정렬된 피크 인덱스 리스트
         """
-        candidate_indices = []
-        # 모든 피크 후보 (양쪽 이웃보다 큰 값)
-        for i in range(1, len(data) - 1):
-            if data[i] > data[i - 1] and data[i] > data[i + 1]:
-                candidate_indices.append(i)
-        # height 기준 필터링
-        candidate_indices = [idx for idx in candidate_indices if data[idx] > height]
-        # 값이 큰 순으로 정렬 후, distance 기준 필터링
-        candidate_indices.sort(key=lambda idx: data[idx], reverse=True)
-        peak_indices = []
-        for idx in candidate_indices:
-            is_peak = True
-            for existing in peak_indices:
-                if abs(idx - existing) < distance:
-                    is_peak = False
-                    break
-            if is_peak:
-                peak_indices.append(idx)
-                if len(peak_indices) == max_num:
-                    break
-        return sorted(peak_indices)
+        return ek.find_peaks(np.ascontiguousarray(data, dtype=np.float64), height, distance, max_num)
 
     @staticmethod
     def detect_peaks(data):
@@ -105,6 +212,53 @@ class PeakDetector:
         return peak_indices
 
 
+#########################################
+# DetrendEngine 클래스
+#########################################
+class DetrendEngine:
+    """
+    다항식 추세 제거 엔진
+    (window_size, order)마다 추세 제거 연산자 R = I - QQᵀ 를 한 번만 계산하여 캐시하고,
+    이후의 추세 제거는 행렬-벡터 곱(R @ y) 한 번으로 수행합니다.
+    Q는 x를 [-1, 1]로 스케일한 르장드르 다항식 기저를 QR 분해한 직교 기저로,
+    x = 1..100의 단순 거듭제곱 기저와 달리 차수 25에서도 수치적으로 안정적입니다.
+    """
+    _operators = {}
+
+    @classmethod
+    def operator(cls, window_size, order):
+        key = (window_size, order)
+        operator = cls._operators.get(key)
+        if operator is None:
+            x = np.linspace(-1.0, 1.0, window_size)
+            basis, _ = np.linalg.qr(np.polynomial.legendre.legvander(x, order))
+            operator = np.eye(window_size) - basis @ basis.T
+            # 커널은 대칭성을 이용해 행 단위로 접근하므로 비트 단위로 대칭이 되도록 맞춤 (이미 대칭이면 값 변화 없음)
+            operator = (operator + operator.T) / 2
+            operator.setflags(write=False)
+            cls._operators[key] = operator
+        return operator
+
+    @classmethod
+    def detrend(cls, values, order, window_size=None):
+        """
+        values의 앞 window_size개(기본값: 전체)에서 order차 다항식 추세를 제거한 배열을 반환합니다.
+        """
+        y = np.ascontiguousarray(values, dtype=np.float64)
+        if window_size is None:
+            window_size = len(y)
+        return ek.detrend(cls.operator(window_size, order), y[:window_size])
+
+    @classmethod
+    def detrend_rows(cls, matrix, order):
+        """
+        (N, window_size) 행렬의 각 행에서 order차 다항식 추세를 제거합니다. (커널 호출 1회)
+        행마다 detrend()와 비트 단위로 같은 결과를 냅니다. (BLAS 행렬 곱 W @ R.T는 마지막 비트가 달라질 수 있음)
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+        return ek.detrend_rows(cls.operator(matrix.shape[1], order), matrix)
+
+
 #########################################
 # PolynomialDetrendProcessor 클래스
 #########################################
@@ -124,32 +278,266 @@ class PolynomialDetrendProcessor:
     def process(self):
         """
         ppg_array의 앞 window_size 개 데이터를 사용하여 다항식 피팅 후,
-        추세(DC 성분)를 제거한 데이터를 반환.
-        """
-        x_values = np.array([i + 1 for i in range(self.window_size)], dtype=float)
-        y_values = np.array(self.ppg_array[:self.window_size], dtype=float)
-        X = np.vander(x_values, N=self.order + 1, increasing=True)
-        XtX = np.dot(X.T, X)
-        Xty = np.dot(X.T, y_values)
-        coefficients = np.linalg.solve(XtX, Xty)
-        detrended = []
-        for i in range(self.window_size):
-            trend = sum(coefficients[j] * (x_values[i] ** j) for j in range(self.order + 1))
-            detrended_value = y_values[i] - trend
-            detrended.append(round(detrended_value, 4))
-        return detrended
+        추세(DC 성분)를 제거한 데이터를 반환. (DetrendEngine의 캐시된 연산자 사용)
+        """
+        detrended = DetrendEngine.detrend(self.ppg_array, self.order, self.window_size)
+        return np.round(detrended, 4).tolist()
+
+
+#########################################
+# 심박수 추정 백엔드
+#########################################
+class HeartRateEstimator(ABC):
+    """
+    HeartRateAnalyzer의 심박수 추정 백엔드 인터페이스
+    분석기가 창 관리, 착용/노이즈 판단, 안정화, BPM 이력 평균, 표시 필터를 맡고,
+    백엔드는 분석 창 하나에서 BPM 하나를 추정합니다. 장치(분석기)마다 별도의 인스턴스를 사용합니다.
+    피크를 검출하는 백엔드는 마지막 estimate()의 피크 인덱스(창 기준)를 peak_indices에 남깁니다. (RR 간격 스트림용)
+    """
+    peak_indices = ()
+
+    def attach(self, window_size, sample_rate):
+        """분석기 생성 시 한 번 호출 (창 길이, 샘플링 주파수에 맞춰 상태를 할당)"""
+
+    def observe(self, acc):
+        """분석 여부와 관계없이 새 가속도 샘플 ((n, 3) 배열, 비어 있지 않음)마다 호출"""
+
+    @abstractmethod
+    def estimate(self, analyzer, window, noise):
+        """
+        analyzer: 호출한 HeartRateAnalyzer (임계값, 현재 심박수 등 참조)
+        window: 시간 순서의 분석 창 (window_size,) 배열 (분석기 내부 버퍼, 수정 금지)
+        noise: 분석 시점의 움직임 노이즈 (가속도 축별 표준편차 합)
+        반환: (이번 창의 BPM 또는 None, 표시 필터에 넣을 추세 제거된 창)
+        """
+
+
+class PeakIntervalEstimator(HeartRateEstimator):
+    """
+    피크 간격 기반 추정 (기본 백엔드, 기존 Flutter 로직)
+    움직임 노이즈 구간으로 추세 제거 차수(2/5/7/25)를 먼저 정하고, 그 차수로 한 번만 추세 제거하여 피크를 검출한 뒤
+    유효한 피크 간격 평균으로 BPM을 구합니다. (추세 제거 연산자는 DetrendEngine이 (창 길이, 차수)마다 캐시)
+    """
+    @staticmethod
+    def detrend_order(analyzer, noise):
+        """
+        움직임 노이즈에 따른 추세 제거 차수
+        threshold1 미만: 2, threshold1 ~ threshold2: 5,
+        threshold2 이상: 7 (threshold3 이상이고 현재 심박수가 140 이상이면 25)
+        """
+        if analyzer.threshold1 <= noise < analyzer.threshold2:
+            return 5
+        if noise >= analyzer.threshold2:
+            return 25 if noise >= analyzer.threshold3 and analyzer.result_hr >= 140 else 7
+        return 2
+
+    @staticmethod
+    def peak_intervals(peak_indices, order):
+        """
+        peak_indices: 오름차순 피크 인덱스 (50Hz)
+        반환: 인접 피크 간격(초) 중 유효 범위(차수 2: 0.20초 초과, 그 외: 0.25초 초과, 1.5초 미만)의 float64 배열
+        """
+        min_interval = 0.20 if order == 2 else 0.25
+        time_diff = np.diff(peak_indices) * 0.02
+        return time_diff[(time_diff > min_interval) & (time_diff < 1.5)]
+
+    def estimate(self, analyzer, window, noise):
+        order = self.detrend_order(analyzer, noise)
+        detrend_value = np.round(DetrendEngine.detrend(window, order), 4)
+        # 피크 높이 임계값: 평균 + 0.5 * 표준편차
+        mean_val = np.mean(detrend_value)
+        variance = np.mean((detrend_value - mean_val) ** 2)
+        threshold_height = mean_val + 0.5 * math.sqrt(variance)
+        peak_indices = PeakDetector.find_peaks(detrend_value, height=threshold_height, distance=12,
+                                               max_num=analyzer.max_peaks)
+        self.peak_indices = peak_indices
+        peak_intervals = self.peak_intervals(peak_indices, order)
+        bpm = 60 / np.mean(peak_intervals) if peak_intervals.size else None
+        return bpm, detrend_value
+
+
+class SpectralEstimator(HeartRateEstimator):
+    """
+    주파수 영역 추정 (rFFT / Welch)
+    추세 제거한 창을 50% 중첩 Hann 구간으로 나누어 rFFT 파워 스펙트럼을 평균(Welch)하고,
+    심박 대역(min_bpm ~ max_bpm)의 최대 빈을 포물선 보간하여 BPM을 구합니다.
+    motion_subtraction=True이면 같은 구간의 가속도 스펙트럼을 정규화하여 빼므로(움직임 노이즈가 threshold1 이상일 때)
+    걷기/달리기처럼 주기적인 움직임 성분이 심박으로 잡히는 것을 줄입니다.
+
+    Hann 창과 대역 빈 인덱스는 (구간 길이, nfft)마다 한 번만 계산하여 캐시합니다.
+    (rFFT 계획은 NumPy pocketfft가 길이별로 캐시)
+    주파수 분해능이 창 길이에 비례하므로 window_size=400(8초) 정도의 긴 창과 함께 사용하는 것을 권장합니다.
+    """
+    _windows = {}
+    _bands = {}
+
+    def __init__(self, segment_size=None, nfft=1024, min_bpm=40.0, max_bpm=220.0,
+                 motion_subtraction=False, motion_weight=1.0):
+        """
+        segment_size: Welch 구간 길이 (샘플, 기본값: 창 길이와 4초 중 짧은 쪽)
+        nfft: rFFT 길이 (구간 길이보다 길면 0으로 채움)
+        min_bpm, max_bpm: 심박 탐색 대역
+        motion_subtraction: 가속도 스펙트럼 차감 사용 여부
+        motion_weight: 차감할 가속도 스펙트럼 가중치 (둘 다 대역 최댓값 1로 정규화한 뒤 적용)
+        """
+        self.segment_size = segment_size
+        self.nfft = nfft
+        self.min_bpm = min_bpm
+        self.max_bpm = max_bpm
+        self.motion_subtraction = motion_subtraction
+        self.motion_weight = motion_weight
+        self._acc_ring = None
+
+    @classmethod
+    def hann(cls, size):
+        """길이 size의 Hann 창 (캐시, 읽기 전용)"""
+        window = cls._windows.get(size)
+        if window is None:
+            window = np.hanning(size)
+            window.setflags(write=False)
+            cls._windows[size] = window
+        return window
+
+    @classmethod
+    def band(cls, nfft, sample_rate, min_bpm, max_bpm):
+        """rFFT 빈 중 심박 대역에 속하는 빈의 slice (캐시)"""
+        key = (nfft, sample_rate, min_bpm, max_bpm)
+        band = cls._bands.get(key)
+        if band is None:
+            resolution = sample_rate / nfft
+            band = cls._bands[key] = slice(max(math.ceil(min_bpm / 60 / resolution), 1),
+                                           math.floor(max_bpm / 60 / resolution) + 1)
+        return band
+
+    def attach(self, window_size, sample_rate):
+        self.window_size = window_size
+        self.sample_rate = sample_rate
+        size = self.segment_size or min(window_size, 4 * sample_rate)
+        if not 8 <= size <= window_size:
+            raise ValueError(f"segment_size must be between 8 and window_size: {size}")
+        self._size = size
+        self._step = max(size // 2, 1)
+        self._band = self.band(max(self.nfft, size), sample_rate, self.min_bpm, self.max_bpm)
+        if self.motion_subtraction:
+            # 분석 창과 같은 구간의 가속도 (원형 버퍼, 0으로 채운 상태에서 시작)
+            self._acc_ring = np.zeros((window_size, 3))
+            self._acc_head = 0
+
+    def observe(self, acc):
+        if self._acc_ring is None:
+            return
+        acc = np.asarray(acc, dtype=np.float64).reshape(-1, 3)[-self.window_size:]
+        size = len(acc)
+        split = min(size, self.window_size - self._acc_head)
+        self._acc_ring[self._acc_head:self._acc_head + split] = acc[:split]
+        self._acc_ring[:size - split] = acc[split:]
+        self._acc_head = (self._acc_head + size) % self.window_size
+
+    def power_spectrum(self, values):
+        """
+        values: (..., window_size) 배열
+        반환: 마지막 축의 Welch 파워 스펙트럼 중 심박 대역 부분 (..., 대역 빈 수)
+        """
+        segments = np.lib.stride_tricks.sliding_window_view(values, self._size, axis=-1)[..., ::self._step, :]
+        segments = segments - segments.mean(axis=-1, keepdims=True)
+        spectrum = np.fft.rfft(segments * self.hann(self._size), n=max(self.nfft, self._size), axis=-1)
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+        return power[..., self._band].mean(axis=-2)
+
+    def estimate(self, analyzer, window, noise):
+        detrended = np.round(DetrendEngine.detrend(window, 2), 4)
+        power = self.power_spectrum(detrended)
+        peak = power.max()
+        if not peak > 0:
+            return None, detrended
+        if self._acc_ring is not None and noise >= analyzer.threshold1:
+            acc = np.concatenate((self._acc_ring[self._acc_head:], self._acc_ring[:self._acc_head])).T
+            motion = self.power_spectrum(acc).sum(axis=0)
+            motion_peak = motion.max()
+            power = power / peak
+            if motion_peak > 0:
+                power = np.maximum(power - self.motion_weight * (motion / motion_peak), 0.0)
+            peak = power.max()
+            if not peak > 0:
+                return None, detrended
+        k = int(np.argmax(power))
+        offset = 0.0
+        if 0 < k < len(power) - 1:
+            # 최대 빈과 양쪽 빈의 포물선 보간
+            left, center, right = power[k - 1], power[k], power[k + 1]
+            curvature = left - 2 * center + right
+            if curvature < 0:
+                offset = 0.5 * (left - right) / curvature
+        resolution = self.sample_rate / max(self.nfft, self._size)
+        return 60 * (self._band.start + k + offset) * resolution, detrended
+
+
+HR_ESTIMATORS = {
+    'peak': PeakIntervalEstimator,
+    'spectral': SpectralEstimator,
+    'spectral-acc': lambda: SpectralEstimator(motion_subtraction=True),
+}
 
 
 #########################################
 # HeartRateAnalyzer 클래스
 #########################################
+class HeartRateResult(NamedTuple):
+    """
+    HeartRateAnalyzer.update() 결과
+    hr: 현재 심박수 (BPM, 계산 전이면 0.0)
+    filtered_ppg: 표시용 필터 출력 (float64 배열, 분석 창(window_size)의 앞 hop_size샘플)
+                  미착용이면 추세 제거 창 전체, 이번 호출에서 분석하지 않았거나 안정화 중이면 빈 배열
+    noise: 최근 가속도 창의 축별 표준편차 합
+    updated: 이번 호출에서 창 분석을 수행했는지 여부
+    hrv: 분석기에 RR 간격 스트림(hrv)을 지정하고 이번 호출에서 분석했으면 emoconnect_hrv.HrvMetrics, 아니면 None
+    quality: 분석기에 품질 추정기(quality)를 지정하고 이번 호출에서 분석했으면 emoconnect_quality.SignalQuality, 아니면 None
+             (품질 추정기가 있으면 미착용/저품질 창은 추세 제거 없이 filtered_ppg가 빈 배열)
+    """
+    hr: float
+    filtered_ppg: np.ndarray
+    noise: float
+    is_wearing: bool
+    is_moving_noise: bool
+    is_fitting: bool
+    updated: bool
+    hrv: Optional[HrvMetrics] = None
+    quality: Optional[SignalQuality] = None
+
+
 class HeartRateAnalyzer:
-    def __init__(self, cal_hr_time=5, threshold1=5.0, threshold2=10.0, threshold3=15.0):
+    SAMPLE_RATE = 50  # 입력 PPG 샘플링 주파수 (Hz, 보간 격자)
+
+    def __init__(self, cal_hr_time=5, threshold1=5.0, threshold2=10.0, threshold3=15.0,
+                 window_size=100, hop_size=50, estimator=None, hrv=None, quality=None):
         """
-        cal_hr_time: 안정적인 심박수 계산을 위한 최소 분석 주기 횟수 (예: 5번 주기)
+        cal_hr_time: 안정적인 심박수 계산을 위한 최소 안정화 시간 (1초 분석 주기 횟수, 예: 5번 주기)
+                     hop_size가 1초보다 짧으면 같은 시간이 되도록 분석 횟수를 늘림
         threshold1, threshold2, threshold3: 가속도 노이즈 임계값 기준
+        window_size: 분석 창 길이 (샘플, 기본 100 = 2초)
+        hop_size: 분석 간격 (샘플, 기본 50 = 1초). 예: hop_size=10이면 200ms마다 최신 창으로 HR 갱신
+        estimator: 심박수 추정 백엔드 (HeartRateEstimator, 기본값: PeakIntervalEstimator()
+                   예: SpectralEstimator(motion_subtraction=True))
+        hrv: 검출한 피크를 이어 붙일 RR 간격 스트림 (emoconnect_hrv.RRIntervalStream, 장치마다 하나)
+             지정하면 분석할 때마다 결과의 hrv에 새 RR 간격과 RMSSD/SDNN/pNN50을 담음 (피크 간격 백엔드 필요)
+        quality: 신호 품질 추정기 (emoconnect_quality.SignalQualityEstimator, 장치마다 하나, 같은 window_size)
+                 지정하면 착용 판단(기존: 창의 합이 0)을 관류 지수/클리핑 기준으로 바꾸고,
+                 미착용 또는 SQI가 quality.min_sqi 미만인 창은 추세 제거와 심박수 추정을 건너뜀
         """
-        self.ppg_array = [0.0] * 50  # 초기 PPG 버퍼 (첫 50 샘플)
+        if window_size <= 25:
+            raise ValueError(f"window_size must be greater than the maximum detrend order 25: {window_size}")
+        if not 1 <= hop_size <= window_size:
+            raise ValueError(f"hop_size must be between 1 and window_size: {hop_size}")
+        if quality is not None and quality.window_size != window_size:
+            raise ValueError(f"quality window_size {quality.window_size} does not match window_size {window_size}")
+        self.window_size = window_size
+        self.hop_size = hop_size
+        # 최근 window_size 샘플 PPG 원형 버퍼 (0으로 채운 상태에서 시작, 창의 절반이 들어오면 첫 분석)
+        self._ring = np.zeros(window_size)
+        self._head = 0
+        self._pending = hop_size - window_size // 2  # 마지막 분석 이후 들어온 샘플 수
+        self._sample_count = 0  # 지금까지 들어온 전체 샘플 수 (피크의 절대 위치 계산용)
+        self._window = np.empty(window_size)  # 시간 순서로 정렬한 분석 창
         self.check_hr_count = 0
         self.hr_error_count = 0
         self.peak_error_count = 0
@@ -159,191 +547,297 @@ class HeartRateAnalyzer:
         self.global_noise_threshold = 0.0
         self.result_hr = 0.0
         self.peak_bpm_values = []
+        self.bpm_history = max(1, round(16 * self.SAMPLE_RATE / hop_size))  # BPM 이력 길이 (hop과 관계없이 약 16초)
         self.cal_hr_time = cal_hr_time
+        self.calibration_cycles = math.ceil(cal_hr_time * self.SAMPLE_RATE / hop_size)  # 안정화에 필요한 분석 횟수
+        self.max_peaks = max(8, round(8 * window_size / 100))  # 창에서 사용할 최대 피크 수 (2초당 8개)
         self.threshold1 = threshold1
         self.threshold2 = threshold2
         self.threshold3 = threshold3
 
-        self.filter = MovingAverageFilter(9)
-        self.wfilter = WeightedMovingAverageFilter(7)
-        self.filter2 = MovingAverageFilter(5)
+        self.filter_chain = FilterChain.ppg_display()
+        self.filter, self.wfilter, self.filter2 = self.filter_chain.filters
+        self.motion_estimator = MotionNoiseEstimator(window_size=50)
+        self.estimator = PeakIntervalEstimator() if estimator is None else estimator
+        self.estimator.attach(window_size, self.SAMPLE_RATE)
+        self.hrv = hrv
+        self.quality = quality
+        if quality is not None:
+            quality.attach(self.motion_estimator)
+
+    @property
+    def ppg_array(self):
+        """현재 분석 창 (오래된 순, 리스트 복사본)"""
+        return self._ordered_window().tolist()
 
     def calculate_stddev(self, values):
         mean = np.mean(values)
         variance = np.mean((np.array(values) - mean) ** 2)
         return math.sqrt(variance)
 
+    def _push(self, ppg):
+        size = len(ppg)
+        self._pending += size
+        self._sample_count += size
+        if size >= self.window_size:
+            self._ring[:] = ppg[-self.window_size:]
+            self._head = 0
+            return
+        end = self._head + size
+        if end <= self.window_size:
+            self._ring[self._head:end] = ppg
+        else:
+            split = self.window_size - self._head
+            self._ring[self._head:] = ppg[:split]
+            self._ring[:end - self.window_size] = ppg[split:]
+        self._head = end % self.window_size
+
+    def _ordered_window(self, out=None):
+        """원형 버퍼를 오래된 순으로 정렬한 창 (out: 기록할 길이 window_size 배열, 생략 시 내부 버퍼)"""
+        if out is None:
+            out = self._window
+        tail = self.window_size - self._head
+        out[:tail] = self._ring[self._head:]
+        out[tail:] = self._ring[:self._head]
+        return out
+
+    def _advance(self, ppg, acc):
+        """새 샘플을 버퍼에 넣고, 창을 분석할 차례면(hop_size샘플이 모이면) True를 반환합니다."""
+        ppg = np.asarray(ppg, dtype=np.float64)
+        self._push(ppg)
+        if self.quality is not None:
+            self.quality.update(ppg)  # 가속도는 공유하는 motion_estimator에 누적
+        # 가속도는 분석 여부와 관계없이 누적 (분석 시점의 노이즈 = 최근 1초 창)
+        if len(acc) > 0:
+            self.motion_estimator.update(acc)
+            self.estimator.observe(acc)
+        if self._pending < self.hop_size:
+            return False
+        self._pending = 0
+        return True
+
+    def _stabilize(self):
+        # 안정화 대기: check_hr_count가 calibration_cycles 미만이면 안정화 진행
+        if self.check_hr_count < self.calibration_cycles:
+            self.is_fitting = False
+            if not self.is_moving_noise:
+                self.check_hr_count += 1
+
+    def _set_not_worn(self):
+        if self.quality is None:
+            print("[Sensor] PPG sensor reading is 0. Sensor not worn.")
+        else:
+            print("[Sensor] No pulsatile PPG signal. Sensor not worn.")
+        self.is_wearing = False
+        self.check_hr_count = 0
+        self.result_hr = 0.0
+        self.peak_bpm_values.clear()
+        if self.hrv is not None:
+            self.hrv.reset()
+
+    def _set_noise(self, acc):
+        """착용 상태로 표시하고 최근 1초(50 샘플) 가속도 창의 축별 표준편차 합으로 움직임 노이즈를 판단합니다."""
+        self.is_wearing = True
+        noiseThreshold = self.motion_estimator.noise_threshold if len(acc) > 0 else 0
+        self.global_noise_threshold = noiseThreshold
+        # 움직임 노이즈 판단 기준을 조정 (threshold를 낮추거나 변경)
+        self.is_moving_noise = True if noiseThreshold > 5 else False  # 기준값 500으로 설정 (기존 5.0)
+        return noiseThreshold
+
+    def _record_intervals(self, peak_intervals):
+        """피크 간격(초) 평균으로 BPM을 구해 최근 BPM 이력의 평균을 심박수로 갱신합니다."""
+        self._record_bpm(60 / np.mean(peak_intervals) if peak_intervals else None)
+
+    def _record_bpm(self, bpm):
+        """이번 창의 BPM(없으면 None)을 최근 BPM 이력(최대 bpm_history개)에 넣고 이력 평균을 심박수로 갱신합니다."""
+        if len(self.peak_bpm_values) >= self.bpm_history:
+            self.peak_bpm_values.pop(0)
+        if bpm is not None:
+            self.hr_error_count = 0
+            self.peak_error_count = 0
+            if not self.peak_bpm_values:
+                self.peak_bpm_values.append(bpm)
+                self.result_hr = bpm
+            else:
+                self.peak_bpm_values.append(bpm)
+                self.result_hr = np.mean(self.peak_bpm_values)
+
+    def _record_peaks(self, peak_indices):
+        """이번 창의 피크 인덱스를 절대 샘플 위치로 바꾸어 RR 간격 스트림에 넘깁니다. (창 끝 피크는 다음 창에서 확정)"""
+        if self.hrv is None or not len(peak_indices):
+            return
+        start = self._sample_count - self.window_size
+        guard = min(self.hrv.edge_guard, self.window_size - self.hop_size)
+        self.hrv.add_peaks([start + index for index in peak_indices], settled_until=self._sample_count - guard)
+
+    def _assess(self):
+        """품질 추정기가 있으면 현재 창의 SignalQuality (누적 통계만 사용), 없으면 None"""
+        return self.quality.assess() if self.quality is not None else None
+
+    def _refine(self, quality, detrended, peak_indices):
+        """분석 전 품질에 분석에서 검출한 피크의 박동 템플릿 상관을 반영 (품질 추정기가 없으면 None)"""
+        return self.quality.refine(quality, detrended, peak_indices) if quality is not None else None
+
+    def _result(self, filtered_ppg, updated, quality=None):
+        hrv = self.hrv.collect() if self.hrv is not None and updated else None
+        return HeartRateResult(self.result_hr, filtered_ppg, self.global_noise_threshold,
+                               self.is_wearing, self.is_moving_noise, self.is_fitting, updated, hrv, quality)
+
+    def update(self, ppg, acc) -> HeartRateResult:
+        """
+        ppg: 새로운 PPG 샘플 (n,) float64 배열
+        acc: 새로운 가속도 샘플 (n, 3) 배열 (비어 있으면 노이즈 0)
+
+        최근 window_size샘플을 고정 크기 원형 버퍼에 보관하고, 마지막 분석 이후 hop_size샘플 이상 들어오면
+        최신 창(window_size샘플)으로 HR을 계산합니다. (50Hz, 기본값은 2초 창을 1초마다 분석)
+        Flutter 코드의 안정화 및 노이즈 조건 분기 로직을 반영합니다.
+        """
+        if not self._advance(ppg, acc):
+            return self._result(np.empty(0), False)
+        window = self._ordered_window()
+        self._stabilize()
+        quality = self._assess()
+
+        # 센서 미착용 판단: PPG 데이터의 합이 0이면 (결과는 2차 추세 제거 창)
+        # 품질 추정기가 있으면 누적 통계의 착용 판단을 사용하고 추세 제거 없이 반환
+        if quality is not None and not quality.is_wearing:
+            self._set_not_worn()
+            return self._result(np.empty(0), True, quality)
+        if quality is None and window.sum() == 0:
+            self._set_not_worn()
+            return self._result(np.round(DetrendEngine.detrend(window, 2), 4), True)
+        noiseThreshold = self._set_noise(acc)
+
+        # 안정화 및 센서 착용 상태에서 HR 계산 진행 (추세 제거는 백엔드가 노이즈에 맞는 차수로 한 번 수행)
+        if self.check_hr_count >= self.calibration_cycles and self.is_wearing:
+            self.is_fitting = True
+            if quality is not None and quality.sqi < self.quality.min_sqi:
+                # 저품질 창: 심박수 추정을 건너뛰고 이전 심박수 유지
+                return self._result(np.empty(0), True, quality)
+            bpm, detrend_value = self.estimator.estimate(self, window, noiseThreshold)
+            self._record_bpm(bpm)
+            self._record_peaks(self.estimator.peak_indices)
+            quality = self._refine(quality, detrend_value, self.estimator.peak_indices)
+
+            # 필터링 및 데이터 처리: 정규화 + SMA(9) + WMA(7) + SMA(5)
+            # (정규화 범위는 전체 창 기준, 그래프에는 창의 앞 hop_size개 샘플 사용, 내부 버퍼이므로 복사)
+            filtered_ppg_data = self.filter_chain.process(detrend_value, self.hop_size).copy()
+
+        else: filtered_ppg_data = np.empty(0)
+
+        return self._result(filtered_ppg_data, True, quality)
+
     def update_hr(self, interpolated_ppg, interpolated_acc):
         """
+        리스트 API (기존 호환)
         interpolated_ppg: 새로운 PPG 데이터 리스트
         interpolated_acc: 새로운 가속도 데이터 리스트, 각 항목은 [x, y, z]
-
-        50Hz 기준, 2초분(100샘플) 데이터가 모이면 HR을 계산합니다.
-        Flutter 코드의 안정화 및 노이즈 조건 분기 로직을 반영합니다.
+        반환: (심박수, 필터 출력 리스트) - update() 결과를 리스트로 변환
         """
-        # 새로운 PPG 데이터 추가
-        self.ppg_array.extend(interpolated_ppg)
-
-        # 2초분(100 샘플) 이상이면 계산 시작
-        if len(self.ppg_array) >= 100:
-            # 안정화 대기: check_hr_count가 cal_hr_time 미만이면 안정화 진행
-            if self.check_hr_count < self.cal_hr_time:
-                self.is_fitting = False
-                if not self.is_moving_noise:
-                    self.check_hr_count += 1
-
-            # 초기 detrend 처리 (order = 2)
-            processor = PolynomialDetrendProcessor(self.ppg_array, 100, 10, 2)
-            detrend_value = processor.process()
-
-            # 센서 미착용 판단: PPG 데이터의 합이 0이면
-            if sum(self.ppg_array) == 0:
-                print("[Sensor] PPG sensor reading is 0. Sensor not worn.")
-                self.is_wearing = False
-                self.check_hr_count = 0
-                self.result_hr = 0.0
-                self.peak_bpm_values.clear()
-                return self.result_hr, detrend_value
-            else:
-                self.is_wearing = True
-
-            # 가속도 데이터 처리
-            dataSize = len(interpolated_acc)
-            if dataSize > 0:
-                xMean = sum(entry[0] for entry in interpolated_acc) / dataSize
-                yMean = sum(entry[1] for entry in interpolated_acc) / dataSize
-                zMean = sum(entry[2] for entry in interpolated_acc) / dataSize
-                xVariance = sum((entry[0] - xMean) ** 2 for entry in interpolated_acc) / dataSize
-                yVariance = sum((entry[1] - yMean) ** 2 for entry in interpolated_acc) / dataSize
-                zVariance = sum((entry[2] - zMean) ** 2 for entry in interpolated_acc) / dataSize
-                xStdDev = math.sqrt(xVariance)
-                yStdDev = math.sqrt(yVariance)
-                zStdDev = math.sqrt(zVariance)
+        result = self.update(np.asarray(interpolated_ppg, dtype=np.float64),
+                             np.asarray(interpolated_acc, dtype=np.float64).reshape(-1, 3))
+        return result.hr, result.filtered_ppg.tolist()
+
+
+class BatchHeartRateAnalyzer:
+    """
+    다중 장치 일괄 심박수 분석기
+    장치별 상태(원형 버퍼, 안정화 카운트, BPM 이력, 표시 필터)는 각 HeartRateAnalyzer가 그대로 보관하고,
+    이번 주기에 분석할 장치들의 창을 창 길이별 (N, window_size) 행렬로 쌓아 착용/노이즈 판단 후
+    추세 제거(차수 그룹마다 커널 호출 1회)와 피크 높이 임계값을 행 단위 벡터 연산으로 계산합니다.
+    피크 선택과 필터는 행마다 수행합니다.
+    결과는 각 분석기의 update()를 따로 호출한 것과 같습니다.
+
+        batch = BatchHeartRateAnalyzer()
+        results = batch.update(analyzers, ppg_list, acc_list)
+    """
+    def __init__(self, capacity=64):
+        """capacity: 창 길이마다 처음 할당할 행렬 행 수 (장치 수가 더 많으면 늘림)"""
+        self.capacity = capacity
+        self._matrices = {}  # window_size -> (행 수, window_size) 작업 행렬
 
+    @staticmethod
+    def accepts(analyzer):
+        """일괄 처리할 수 있는 분석기인지 여부 (피크 간격 백엔드만 일괄 처리)"""
+        return isinstance(analyzer, HeartRateAnalyzer) and type(analyzer.estimator) is PeakIntervalEstimator
+
+    def update(self, analyzers, ppgs, accs):
+        """
+        analyzers: HeartRateAnalyzer 리스트 (장치마다 하나, 중복 없음)
+                   accepts()가 거부한 분석기(다른 추정 백엔드)는 일괄 처리하지 않고 각자의 update()로 처리
+        ppgs, accs: 장치별 새 샘플 ((n,) PPG 배열, (n, 3) 가속도 배열)
+        반환: 장치별 HeartRateResult 리스트 (analyzers 순서)
+        """
+        results = [None] * len(analyzers)
+        groups = {}  # window_size -> 분석할 장치 인덱스
+        for index, (analyzer, ppg, acc) in enumerate(zip(analyzers, ppgs, accs)):
+            if not self.accepts(analyzer):
+                results[index] = analyzer.update(ppg, acc)
+            elif analyzer._advance(ppg, acc):
+                groups.setdefault(analyzer.window_size, []).append(index)
             else:
-                xStdDev = yStdDev = zStdDev = 0
-            noiseThreshold = xStdDev + yStdDev + zStdDev
-            self.global_noise_threshold = noiseThreshold
-
-            # 움직임 노이즈 판단 기준을 조정 (threshold를 낮추거나 변경)
-            self.is_moving_noise = True if noiseThreshold > 5 else False  # 기준값 500으로 설정 (기존 5.0)
-
-            # 안정화 및 센서 착용 상태에서 HR 계산 진행
-            if self.check_hr_count >= self.cal_hr_time and self.is_wearing:
-                self.is_fitting = True
-                mean_val = np.mean(detrend_value)
-                variance = np.mean((np.array(detrend_value) - mean_val) ** 2)
-                standard_deviation = math.sqrt(variance)
-                threshold_height = mean_val + 0.5 * standard_deviation
-                min_distance = 12
-                max_num = 8
-                sampling_interval = 0.02
-
-                # 첫 번째 피크 검출 및 HR 산출
-                peak_indices = PeakDetector.find_peaks(detrend_value,
-                                                       height=threshold_height,
-                                                       distance=min_distance,
-                                                       max_num=max_num)
-                peak_intervals = []
-                for i in range(1, len(peak_indices)):
-                    index_diff = peak_indices[i] - peak_indices[i - 1]
-                    time_diff = index_diff * sampling_interval
-                    if time_diff <= 0.20 or time_diff >= 1.5:
-                        continue
-                    temp_hr = 60 / time_diff
-                    peak_intervals.append(time_diff)
-
-                # 추가 분기: 노이즈 조건에 따른 재처리
-                if self.threshold1 <= noiseThreshold < self.threshold2:
-                    processor = PolynomialDetrendProcessor(self.ppg_array, 100, 10, 5)
-                    detrend_value = processor.process()
-                    mean_val = np.mean(detrend_value)
-                    variance = np.mean((np.array(detrend_value) - mean_val) ** 2)
-                    standard_deviation = math.sqrt(variance)
-                    threshold_height = mean_val + 0.5 * standard_deviation
-                    peak_indices = PeakDetector.find_peaks(detrend_value,
-                                                           height=threshold_height,
-                                                           distance=min_distance,
-                                                           max_num=max_num)
-                    peak_intervals = []
-                    for i in range(1, len(peak_indices)):
-                        index_diff = peak_indices[i] - peak_indices[i - 1]
-                        time_diff = index_diff * sampling_interval
-                        if time_diff <= 0.25 or time_diff >= 1.5:
-                            continue
-                        temp_hr = 60 / time_diff
-                        peak_intervals.append(time_diff)
-
-                elif noiseThreshold >= self.threshold2:
-                    if noiseThreshold >= self.threshold3 and self.result_hr >= 140:
-                        processor = PolynomialDetrendProcessor(self.ppg_array, 100, 10, 25)
-                        detrend_value = processor.process()
-                        mean_val = np.mean(detrend_value)
-                        variance = np.mean((np.array(detrend_value) - mean_val) ** 2)
-                        standard_deviation = math.sqrt(variance)
-                        threshold_height = mean_val + 0.5 * standard_deviation
-                        peak_indices = PeakDetector.find_peaks(detrend_value,
-                                                               height=threshold_height,
-                                                               distance=min_distance,
-                                                               max_num=max_num)
-                        peak_intervals = []
-                        for i in range(1, len(peak_indices)):
-                            index_diff = peak_indices[i] - peak_indices[i - 1]
-                            time_diff = index_diff * sampling_interval
-                            if time_diff <= 0.25 or time_diff >= 1.5:
-                                continue
-                            temp_hr = 60 / time_diff
-                            peak_intervals.append(time_diff)
-                    else:
-                        processor = PolynomialDetrendProcessor(self.ppg_array, 100, 10, 7)
-                        detrend_value = processor.process()
-                        mean_val = np.mean(detrend_value)
-                        variance = np.mean((np.array(detrend_value) - mean_val) ** 2)
-                        standard_deviation = math.sqrt(variance)
-                        threshold_height = mean_val + 0.5 * standard_deviation
-                        peak_indices = PeakDetector.find_peaks(detrend_value,
-                                                               height=threshold_height,
-                                                               distance=min_distance,
-                                                               max_num=max_num)
-                        peak_intervals = []
-                        for i in range(1, len(peak_indices)):
-                            index_diff = peak_indices[i] - peak_indices[i - 1]
-                            time_diff = index_diff * sampling_interval
-                            if time_diff <= 0.25 or time_diff >= 1.5:
-                                continue
-                            temp_hr = 60 / time_diff
-                            peak_intervals.append(time_diff)
-
-                if len(self.peak_bpm_values) > 15:
-                    self.peak_bpm_values.pop(0)
-                if peak_intervals:
-                    self.hr_error_count = 0
-                    self.peak_error_count = 0
-                    avg_peak_interval = np.mean(peak_intervals)
-                    bpm = 60 / avg_peak_interval
-                    if not self.peak_bpm_values:
-                        self.peak_bpm_values.append(bpm)
-                        self.result_hr = bpm
-                    else:
-                        self.peak_bpm_values.append(bpm)
-                        self.result_hr = np.mean(self.peak_bpm_values)
-
-
-                # 필터링 및 데이터 처리
-                normalized_ppg = normalize_to_minus_one_to_one(detrend_value)
-
-                # 필터링 적용
-                filtered_data = [self.filter.filter(value) for value in normalized_ppg[:50]]
-                wfiltered_data = [self.wfilter.filter(value) for value in filtered_data[:50]]
-                filtered_data2 = [self.filter2.filter(value) for value in wfiltered_data[:50]]
-
-                # 그래프 데이터 업데이트 (기본적인 그래프 데이터 처리)
-                filtered_ppg_data = filtered_data2  # 필터링된 50개의 PPG 데이터
-
-            else: filtered_ppg_data = []
-
-            # 데이터 오버랩: 다음 2초 분석을 위해 최신 50개 샘플만 유지 (1초 중첩)
-            self.ppg_array = self.ppg_array[-50:]
-            return self.result_hr, filtered_ppg_data
-        else:
-            return self.result_hr, []
+                results[index] = analyzer._result(np.empty(0), False)
+        for window_size, due in groups.items():
+            self._analyze(window_size, due, analyzers, accs, results)
+        return results
+
+    def _analyze(self, window_size, due, analyzers, accs, results):
+        matrix = self._matrices.get(window_size)
+        if matrix is None or len(due) > len(matrix):
+            rows = self.capacity if matrix is None else 2 * len(matrix)
+            matrix = self._matrices[window_size] = np.empty((max(len(due), rows), window_size))
+        windows = matrix[:len(due)]
+        for row, index in enumerate(due):
+            analyzers[index]._ordered_window(windows[row])
+            analyzers[index]._stabilize()
+
+        # 착용 판단 (PPG 데이터의 합이 0이면 미착용), 착용 장치의 움직임 노이즈와 추세 제거 차수
+        # 장치마다 한 차수로만 추세 제거 (미착용: 결과용 2차, 안정화 중: 추세 제거 없음)
+        worn = windows.sum(axis=1) != 0
+        orders = np.zeros(len(due), dtype=int)
+        qualities = [analyzers[index]._assess() for index in due]
+        for row, index in enumerate(due):
+            analyzer = analyzers[index]
+            quality = qualities[row]
+            if quality is not None:
+                # 품질 추정기가 있으면 창의 합 대신 누적 통계의 착용 판단을 사용 (미착용 창은 추세 제거 없음)
+                worn[row] = quality.is_wearing
+                if not worn[row]:
+                    analyzer._set_not_worn()
+                    results[index] = analyzer._result(np.empty(0), True, quality)
+                    continue
+            elif not worn[row]:
+                analyzer._set_not_worn()
+                orders[row] = 2
+                continue
+            noise = analyzer._set_noise(accs[index])
+            if analyzer.check_hr_count < analyzer.calibration_cycles:
+                results[index] = analyzer._result(np.empty(0), True, quality)
+                continue
+            analyzer.is_fitting = True
+            if quality is not None and quality.sqi < analyzer.quality.min_sqi:
+                results[index] = analyzer._result(np.empty(0), True, quality)
+                continue
+            orders[row] = PeakIntervalEstimator.detrend_order(analyzer, noise)
+
+        # 차수 그룹마다 추세 제거 커널 호출 1회
+        for order in np.unique(orders[orders > 0]).tolist():
+            rows = np.flatnonzero(orders == order)
+            values = np.round(DetrendEngine.detrend_rows(windows[rows], order), 4)
+            # 행별 피크 높이 임계값: 평균 + 0.5 * 표준편차
+            mean_val = np.mean(values, axis=1)
+            variance = np.mean((values - mean_val[:, None]) ** 2, axis=1)
+            threshold_height = mean_val + 0.5 * np.sqrt(variance)
+            for position, row in enumerate(rows.tolist()):
+                analyzer = analyzers[due[row]]
+                if not worn[row]:
+                    results[due[row]] = analyzer._result(values[position].copy(), True)
+                    continue
+                peak_indices = PeakDetector.find_peaks(values[position], height=threshold_height[position],
+                                                       distance=12, max_num=analyzer.max_peaks)
+                analyzer.estimator.peak_indices = peak_indices  # estimate()와 같은 상태 갱신
+                analyzer._record_intervals(PeakIntervalEstimator.peak_intervals(peak_indices, order).tolist())
+                analyzer._record_peaks(peak_indices)
+                filtered_ppg_data = analyzer.filter_chain.process(values[position], analyzer.hop_size).copy()
+                quality = analyzer._refine(qualities[row], values[position], peak_indices)
+                results[due[row]] = analyzer._result(filtered_ppg_data, True, quality)
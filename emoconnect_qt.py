@@ -0,0 +1,37 @@
+# emoconnect_qt.py
+# SensorSession / ProcessingWorker의 결과와 백프레셔 지표를 Qt 시그널로 UI에 전달하는 브리지
+from PySide6.QtCore import QObject, QTimer, Signal
+
+
+class SessionSignals(QObject):
+    """
+    세션 결과 시그널
+    result_ready: SensorSession 처리 결과 딕셔너리
+    metrics_updated: ProcessingWorker.metrics()에 세션 알림 처리 지연(handler_p95 등)을 더한 딕셔너리 (주기적으로 발생)
+    다른 스레드에서 emit해도 수신 슬롯은 UI 스레드에서 실행됩니다. (Qt 자동 연결)
+    """
+    result_ready = Signal(object)
+    metrics_updated = Signal(object)
+
+    def __init__(self, worker=None, metrics_interval_ms=5000, parent=None):
+        super().__init__(parent)
+        self.worker = worker
+        self.session = None
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.emit_metrics)
+        if worker is not None and metrics_interval_ms:
+            self._timer.start(metrics_interval_ms)
+
+    def attach(self, session):
+        """세션 결과를 result_ready 시그널로 내보냅니다."""
+        self.session = session
+        session.add_callback(self.result_ready.emit)
+
+    def emit_metrics(self):
+        metrics = self.worker.metrics() if self.worker is not None else {}
+        if self.session is not None and self.session.handler_latency:
+            latency = sorted(self.session.handler_latency)
+            metrics['handler_p50'] = latency[len(latency) // 2]
+            metrics['handler_p95'] = latency[min(int(len(latency) * 0.95), len(latency) - 1)]
+            metrics['handler_max'] = latency[-1]
+        self.metrics_updated.emit(metrics)
@@ -0,0 +1,279 @@
+# emoconnect_quality.py
+# PPG 신호 품질 지표(SQI)와 착용 판단
+# 샘플 청크가 들어올 때 한 번만 훑어 청크 요약(평균, 편차 제곱합, 인접 샘플 공분산, 0 / 포화 샘플 수)을 만들고,
+# 분석 시점에는 창에 걸친 몇 개의 청크 요약을 합쳐 창을 다시 훑지 않고 관류 지수, 클리핑 비율, 파형 매끄러움,
+# 움직임 에너지로 품질과 착용 여부를 판단합니다.
+# 박동 템플릿 상관은 분석에서 검출한 피크가 있을 때만 계산합니다. (피크 검출을 다시 하지 않음)
+import math
+from collections import deque
+from typing import NamedTuple
+
+import numpy as np
+
+from emoconnect_utils import MotionNoiseEstimator
+
+
+class SignalQuality(NamedTuple):
+    """
+    SignalQualityEstimator.assess() 결과
+    sqi: 종합 신호 품질 (0 ~ 1, 구성 점수의 곱)
+    is_wearing: 착용 여부 (신호 없음, 낮은 관류 지수, 과도한 포화, 잡음뿐인 파형이면 False)
+    perfusion_index: 관류 지수 (%, 100 × 2√2 × 표준편차 / 평균: 정현파 맥동의 peak-to-peak / DC)
+    clipping_ratio: 센서 범위 끝(clip_low 이하 / clip_high 이상)에 걸린 샘플 비율 (0 ~ 1)
+    smoothness: 인접 샘플 자기상관 (lag 1, -1 ~ 1: 50Hz 맥파는 1에 가깝고 센서 잡음뿐이면 0 근처)
+    motion_energy: 가속도 축별 분산의 합 ((m/s^2)^2)
+    template_correlation: 박동 구간과 (나머지 구간의) 평균 박동 템플릿의 상관 평균 (-1 ~ 1, 온전한 박동 구간이 2개 미만이면 nan)
+    """
+    sqi: float
+    is_wearing: bool
+    perfusion_index: float
+    clipping_ratio: float
+    smoothness: float
+    motion_energy: float
+    template_correlation: float
+
+
+class SignalQualityEstimator:
+    """
+    PPG 신호 품질 추정 클래스
+    최근 window_size개 PPG 샘플을 링 버퍼에 보관하고, update()로 들어온 청크마다 요약
+    [샘플 수, 평균, 편차 제곱합, 인접 샘플 편차 곱의 합, 첫 샘플, 마지막 샘플, 0 샘플 수, 클리핑 샘플 수]를
+    저장합니다. 창을 벗어난 청크는 요약을 버리기만 하고(일부만 벗어나면 남은 부분만 다시 요약),
+    창 통계는 청크 요약을 병렬 분산 공식으로 합쳐 계산합니다. (청크마다 자기 평균 기준이라 누적 오차 없음)
+    가속도 분산은 같은 창 길이의 MotionNoiseEstimator로 누적합니다.
+    (HeartRateAnalyzer에 연결하면 분석기의 움직임 추정기를 공유: attach())
+
+    SQI = 관류 점수 × (1 - 클리핑 비율) × max(매끄러움, 0) × 움직임 점수 × 템플릿 점수
+      관류 점수: min(관류 지수 / good_perfusion, 1)
+      움직임 점수: 1 / (1 + 움직임 에너지 / motion_energy_scale)
+      템플릿 점수: max(템플릿 상관, 0) (피크가 없으면 1)
+    """
+    def __init__(self, window_size=100, clip_low=0.0, clip_high=65535.0, min_perfusion=0.05, good_perfusion=0.5,
+                 max_clipping=0.5, min_smoothness=0.5, motion_energy_scale=25.0, min_sqi=0.0, beat_template=True):
+        """
+        window_size: 통계에 포함할 최근 샘플 수 (HeartRateAnalyzer의 window_size와 같게)
+        clip_low, clip_high: 센서 출력 범위 (PPG는 uint16)
+        min_perfusion: 착용으로 판단할 최소 관류 지수 (%, 미만이면 맥동이 없는 평탄한 신호로 판단)
+        good_perfusion: 관류 점수가 1이 되는 관류 지수 (%)
+        max_clipping: 착용으로 판단할 최대 클리핑 비율
+        min_smoothness: 착용으로 판단할 최소 인접 샘플 자기상관 (미만이면 맥파 없이 잡음만 있는 주변광/빈 센서로 판단)
+        motion_energy_scale: 움직임 점수가 0.5가 되는 움직임 에너지
+        min_sqi: HeartRateAnalyzer가 심박수 추정을 건너뛸 분석 전 SQI 기준 (0이면 착용 여부로만 판단)
+        beat_template: False면 분석 후 박동 템플릿 상관을 계산하지 않음 (착용 장치의 분석당 비용 절감, 결과는 nan)
+        """
+        self.window_size = window_size
+        self.clip_low = clip_low
+        self.clip_high = clip_high
+        self.min_perfusion = min_perfusion
+        self.good_perfusion = good_perfusion
+        self.max_clipping = max_clipping
+        self.min_smoothness = min_smoothness
+        self.motion_energy_scale = motion_energy_scale
+        self.min_sqi = min_sqi
+        self.beat_template = beat_template
+        self._ring = np.zeros(window_size)
+        self._chunks = deque()
+        self.motion = MotionNoiseEstimator(window_size=window_size)
+        self._owns_motion = True
+        self.clear()
+
+    def __len__(self):
+        return self._count
+
+    def attach(self, motion):
+        """
+        분석기의 움직임 추정기(MotionNoiseEstimator)를 공유합니다. (HeartRateAnalyzer가 생성 시 호출)
+        가속도를 두 번 누적하지 않도록 이후 update()에는 가속도를 넘기지 않으며, 움직임 에너지는 분석기의
+        노이즈 판단과 같은 최근 1초 창 기준이 됩니다.
+        """
+        self.motion = motion
+        self._owns_motion = False
+
+    def clear(self):
+        """PPG 통계를 비웁니다. (attach()로 공유한 분석기의 움직임 추정기는 분석기 소유이므로 그대로 둠)"""
+        self._head = 0
+        self._count = 0
+        self._chunks.clear()
+        if self._owns_motion:
+            self.motion.clear()
+
+    def _read(self, start, count):
+        split = min(count, self.window_size - start)
+        if split == count:
+            return self._ring[start:start + count]
+        return np.concatenate((self._ring[start:], self._ring[:count - split]))
+
+    def _summarize(self, values):
+        """청크 요약 (청크 평균 기준으로 계산하므로 DC가 커도 상쇄 오차가 작음)"""
+        size = len(values)
+        mean = float(values.sum()) / size
+        centered = values - mean
+        low, high = float(values.min()), float(values.max())
+        # 대부분의 청크는 최솟값/최댓값만 보고 0 / 클리핑 샘플 수 계산을 생략
+        if low > 0 and low > self.clip_low and high < self.clip_high:
+            zeros = clipped = 0
+        else:
+            zeros = int(np.count_nonzero(values == 0))
+            clipped = int(np.count_nonzero((values <= self.clip_low) | (values >= self.clip_high)))
+        return [size, mean, float(centered @ centered), float(centered[1:] @ centered[:-1]),
+                float(values[0]), float(values[-1]), zeros, clipped]
+
+    def update(self, ppg, acc=None):
+        """
+        ppg: 새 PPG 샘플 (n,) 배열
+        acc: 새 가속도 샘플 (n, 3) 배열 (생략하거나 비어 있으면 움직임 통계를 갱신하지 않음)
+        """
+        if acc is not None and len(acc) > 0:
+            self.motion.update(acc)
+        ppg = np.asarray(ppg, dtype=np.float64).reshape(-1)
+        size = len(ppg)
+        if size == 0:
+            return
+        if size >= self.window_size:
+            ppg = ppg[-self.window_size:]
+            size = self.window_size
+            self._chunks.clear()
+            self._count = 0
+        split = min(size, self.window_size - self._head)
+        self._ring[self._head:self._head + split] = ppg[:split]
+        self._ring[:size - split] = ppg[split:]
+        self._head = (self._head + size) % self.window_size
+        self._chunks.append(self._summarize(ppg))
+        self._count += size
+
+        # 창을 벗어난 청크 요약 제거 (가장 오래된 청크가 일부만 벗어나면 남은 부분을 버퍼에서 다시 요약)
+        excess = self._count - self.window_size
+        while excess > 0:
+            oldest = self._chunks[0][0]
+            if oldest <= excess:
+                self._chunks.popleft()
+                self._count -= oldest
+                excess -= oldest
+            else:
+                self._count -= excess
+                start = (self._head - self._count) % self.window_size
+                self._chunks[0] = self._summarize(self._read(start, oldest - excess))
+                excess = 0
+
+    def _moments(self):
+        """창의 (평균, 편차 제곱합, 인접 샘플 편차 곱의 합) - 청크 요약을 병렬 분산 공식으로 합침"""
+        count = self._count
+        mean = sum(chunk[0] * chunk[1] for chunk in self._chunks) / count
+        squares = lag = 0.0
+        previous = None
+        for size, chunk_mean, chunk_squares, chunk_lag, first, last, _, _ in self._chunks:
+            shift = chunk_mean - mean
+            squares += chunk_squares + size * shift * shift
+            # 청크 안의 쌍: 앞 원소 편차 합 = -(last - 청크 평균), 뒤 원소 편차 합 = -(first - 청크 평균)
+            lag += chunk_lag - shift * ((last - chunk_mean) + (first - chunk_mean)) + (size - 1) * shift * shift
+            if previous is not None:
+                lag += (previous - mean) * (first - mean)  # 청크 경계의 쌍
+            previous = last
+        return mean, squares, lag
+
+    @property
+    def mean(self):
+        """창의 PPG 평균 (DC)"""
+        return self._moments()[0] if self._count else 0.0
+
+    @property
+    def std(self):
+        """창의 PPG 모표준편차 (ddof=0)"""
+        return math.sqrt(self._moments()[1] / self._count) if self._count else 0.0
+
+    @property
+    def smoothness(self):
+        """창의 인접 샘플 자기상관 (lag 1, 샘플이 부족하거나 값이 모두 같으면 0)"""
+        if self._count < 2:
+            return 0.0
+        _, squares, lag = self._moments()
+        return self._autocorrelation(squares, lag)
+
+    def _autocorrelation(self, squares, lag):
+        if self._count < 2 or squares <= 0:
+            return 0.0
+        return max(min((lag / (self._count - 1)) / (squares / self._count), 1.0), -1.0)
+
+    @property
+    def zeros(self):
+        """창의 0 샘플 수"""
+        return sum(chunk[6] for chunk in self._chunks)
+
+    @property
+    def clipped(self):
+        """창에서 센서 범위 끝에 걸린 샘플 수"""
+        return sum(chunk[7] for chunk in self._chunks)
+
+    @property
+    def has_signal(self):
+        """창에 0이 아닌 샘플이 있는지 여부 (기존 착용 판단 sum(ppg) != 0과 같음, PPG는 0 이상)"""
+        return self.zeros < self._count
+
+    @staticmethod
+    def template_correlation(detrended, peak_indices):
+        """
+        detrended: 추세 제거한 분석 창, peak_indices: 창 기준 오름차순 피크 인덱스
+        각 피크에서 시작해 피크 간격 중앙값 길이만큼 자른 박동 구간마다 나머지 구간들의 평균을 템플릿으로 하여
+        (자기 자신을 빼야 구간이 적어도 잡음끼리의 상관이 0 근처) 각 구간과 템플릿의 피어슨 상관 평균을 반환합니다.
+        (창 안에 온전한 박동 구간이 2개 미만이면 nan)
+        """
+        # 피크가 몇 개뿐이므로 간격 중앙값과 구간 선택은 파이썬 정수 연산으로
+        peaks = [int(index) for index in peak_indices]
+        if len(peaks) < 2:
+            return math.nan
+        intervals = sorted(right - left for left, right in zip(peaks, peaks[1:]))
+        middle = len(intervals) // 2
+        length = int(intervals[middle] if len(intervals) % 2 else (intervals[middle - 1] + intervals[middle]) / 2)
+        peaks = [index for index in peaks if index + length <= len(detrended)]
+        if len(peaks) < 2 or length < 4:
+            return math.nan
+        beats = np.asarray(detrended, dtype=np.float64)[np.add.outer(peaks, np.arange(length))]
+        beats -= (beats.sum(axis=1) / length)[:, None]
+        # 구간 i의 템플릿(나머지 구간의 합, 상관에는 평균과 같음) T = S - B[i]이므로
+        # B[i]·T = B[i]·S - |B[i]|², |T|² = |S|² - 2 B[i]·S + |B[i]|² (행렬 연산 3번으로 모든 구간 계산)
+        total = beats.sum(axis=0)
+        projections = (beats @ total).tolist()
+        energies = np.einsum('ij,ij->i', beats, beats).tolist()
+        total_energy = float(total @ total)
+        correlations = []
+        for projection, energy in zip(projections, energies):
+            norm = energy * (total_energy - 2 * projection + energy)
+            if norm > 0:
+                correlations.append((projection - energy) / math.sqrt(norm))
+        return sum(correlations) / len(correlations) if correlations else math.nan
+
+    def assess(self, detrended=None, peak_indices=()):
+        """
+        현재 창의 신호 품질을 반환합니다. (누적 통계로 계산, 창을 다시 훑지 않음)
+        detrended, peak_indices: 분석에서 얻은 추세 제거 창과 피크 (지정하면 박동 템플릿 상관을 포함)
+        """
+        mean, squares, lag = self._moments() if self._count else (0.0, 0.0, 0.0)
+        std = math.sqrt(squares / self._count) if self._count else 0.0
+        perfusion_index = 100 * 2 * math.sqrt(2) * std / mean if mean > 0 else 0.0
+        clipping_ratio = self.clipped / self._count if self._count else 0.0
+        smoothness = self._autocorrelation(squares, lag)
+        motion_energy = self.motion.energy
+        correlation = math.nan
+        if self.beat_template and detrended is not None and len(peak_indices):
+            correlation = self.template_correlation(detrended, peak_indices)
+        is_wearing = (self._count > 0 and self.has_signal and perfusion_index >= self.min_perfusion
+                      and clipping_ratio <= self.max_clipping and smoothness >= self.min_smoothness)
+        sqi = 0.0
+        if is_wearing:
+            sqi = (min(perfusion_index / self.good_perfusion, 1.0) * (1.0 - clipping_ratio) * smoothness
+                   / (1.0 + motion_energy / self.motion_energy_scale))
+            if not math.isnan(correlation):
+                sqi *= max(correlation, 0.0)
+        return SignalQuality(sqi, is_wearing, perfusion_index, clipping_ratio, smoothness, motion_energy, correlation)
+
+    def refine(self, quality, detrended, peak_indices):
+        """
+        분석 전 assess() 결과에 분석에서 얻은 박동 템플릿 상관을 반영합니다. (창 통계는 다시 합치지 않음)
+        assess(detrended, peak_indices)와 같은 결과
+        """
+        if not self.beat_template or not len(peak_indices):
+            return quality
+        correlation = self.template_correlation(detrended, peak_indices)
+        if math.isnan(correlation):
+            return quality
+        return quality._replace(sqi=quality.sqi * max(correlation, 0.0), template_correlation=correlation)
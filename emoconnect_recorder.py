@@ -0,0 +1,208 @@
+# emoconnect_recorder.py
+# 원본 알림 데이터를 단조 시간(monotonic)과 함께 append-only 바이너리 파일로 기록하고,
+# 메모리 매핑으로 다시 읽는 세션 기록기
+import os
+import struct
+import time
+
+import numpy as np
+
+import emoconnect_utils as eu
+
+MAGIC = b"EMOREC\x00\x01"
+# 헤더: magic(8) + 레코드 크기(uint32) + 예약(4) + 기록 시작 시각(time.time, float64) + 시작 monotonic(float64)
+HEADER_FORMAT = "<8sII dd"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+KIND_SENSOR = 0
+KIND_BATTERY = 1
+
+# 레코드 한 개 = 20바이트 프레임 한 개. 알림 한 건의 프레임들은 같은 timestamp/sequence를 가짐.
+# BATT 패킷은 kind=KIND_BATTERY 레코드 한 개로 저장 (frame 자리에 패킷 앞 20바이트)
+RECORD_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('sequence', '<u4'),
+    ('kind', '<u2'),
+    ('frame', eu.FRAME_DTYPE),
+])
+
+
+class SessionRecorder:
+    """
+    세션 기록기
+    알림 데이터를 받은 그대로 레코드 단위로 파일 끝에 추가합니다. 기존 파일이면 이어서 기록합니다.
+
+        with SessionRecorder("session.emorec") as recorder:
+            session = SensorSession(address, recorder=recorder)
+    """
+    def __init__(self, path, clock=time.monotonic):
+        self.path = path
+        self.clock = clock
+        exists = os.path.exists(path) and os.path.getsize(path) >= HEADER_SIZE
+        if exists:
+            with open(path, "rb") as f:
+                header = read_header(f)
+            # 비정상 종료로 잘린 마지막 레코드는 버리고 이어서 기록
+            size = os.path.getsize(path)
+            records = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+            self.sequence = 0
+            if records:
+                last = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(records,))
+                self.sequence = int(last['sequence'][-1]) + 1
+                del last
+            self.start_time, self.start_monotonic = header
+            self._file = open(path, "r+b")
+            self._file.truncate(HEADER_SIZE + records * RECORD_DTYPE.itemsize)
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self.sequence = 0
+            self.start_time = time.time()
+            self.start_monotonic = self.clock()
+            self._file = open(path, "wb")
+            self._file.write(struct.pack(HEADER_FORMAT, MAGIC, RECORD_DTYPE.itemsize, 0,
+                                         self.start_time, self.start_monotonic))
+
+    def record(self, data, timestamp=None) -> int:
+        """
+        알림 한 건을 기록합니다.
+        timestamp: 수신 시각 (지정하지 않으면 clock())
+        반환: 기록한 레코드 수
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        if data[0:4] == b"BATT":
+            records = np.zeros(1, dtype=RECORD_DTYPE)
+            packet = bytes(data[:eu.FRAME_SIZE]).ljust(eu.FRAME_SIZE, b"\x00")
+            records['frame'] = np.frombuffer(packet, dtype=eu.FRAME_DTYPE)
+            records['kind'] = KIND_BATTERY
+        else:
+            num_chunks = len(data) // eu.FRAME_SIZE
+            if num_chunks == 0:
+                return 0
+            records = np.empty(num_chunks, dtype=RECORD_DTYPE)
+            records['frame'] = np.frombuffer(data, dtype=eu.FRAME_DTYPE, count=num_chunks)
+            records['kind'] = KIND_SENSOR
+        records['timestamp'] = timestamp
+        records['sequence'] = self.sequence
+        self.sequence += 1
+        self._file.write(records.tobytes())
+        return len(records)
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_header(f):
+    magic, record_size, _, start_time, start_monotonic = struct.unpack(HEADER_FORMAT, f.read(HEADER_SIZE))
+    if magic != MAGIC:
+        raise ValueError("Not an EmoConnect session recording.")
+    if record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Unsupported record size: {record_size}")
+    return start_time, start_monotonic
+
+
+class SessionReader:
+    """
+    세션 기록 파일 리더
+    파일을 메모리 매핑하여 파싱 없이 바로 레코드 배열(records)로 사용합니다.
+    채널 값은 파일의 float16 값을 그대로 가리키는 뷰이며, float32가 필요하면 astype()으로 변환합니다.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.start_time, self.start_monotonic = read_header(f)
+        count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        self._battery_index = np.flatnonzero(self.records['kind'] == KIND_BATTERY)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def duration(self):
+        """첫 레코드부터 마지막 레코드까지의 시간 (초)"""
+        if len(self.records) == 0:
+            return 0.0
+        return float(self.records['timestamp'][-1] - self.records['timestamp'][0])
+
+    @staticmethod
+    def _channels(records):
+        frames = records['frame']
+        return {
+            'timestamp': records['timestamp'],
+            'ppg': frames['ppg'],
+            'acc': frames['acc'],
+            'gyro': frames['gyro'],
+            'mag': frames['mag']
+        }
+
+    def iter_chunks(self, max_samples=None):
+        """
+        BATT 레코드로 나뉜 연속 센서 구간마다 채널 뷰(dict, 복사 없음)를 내보냅니다.
+        max_samples: 지정하면 구간을 최대 max_samples개 샘플 단위로 나눔
+        """
+        bounds = np.concatenate([[-1], self._battery_index, [len(self.records)]])
+        for start, stop in zip(bounds[:-1] + 1, bounds[1:]):
+            step = max_samples or max(stop - start, 1)
+            for chunk_start in range(start, stop, step):
+                yield self._channels(self.records[chunk_start:min(chunk_start + step, stop)])
+
+    def channels(self):
+        """
+        전체 센서 채널을 반환합니다. BATT 레코드가 없으면 복사 없는 뷰, 있으면 센서 레코드만 모은 복사본입니다.
+        """
+        if len(self._battery_index) == 0:
+            return self._channels(self.records)
+        return self._channels(self.records[self.records['kind'] == KIND_SENSOR])
+
+    def battery(self):
+        """BATT 패킷 목록: [(timestamp, battery, count), ...]"""
+        result = []
+        for index in self._battery_index:
+            record = self.records[index]
+            packet = record['frame'].tobytes()
+            result.append((float(record['timestamp']), min(max(packet[6], 0), 100), (packet[9] << 8) | packet[8]))
+        return result
+
+    def notifications(self):
+        """
+        기록된 알림을 원래 단위로 (timestamp, payload bytes)로 복원하여 내보냅니다.
+        (SensorSession 등으로 다시 재생할 때 사용)
+        """
+        sequence = self.records['sequence']
+        if len(sequence) == 0:
+            return
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(sequence)) + 1, [len(sequence)]])
+        for start, stop in zip(starts[:-1], starts[1:]):
+            chunk = self.records[start:stop]
+            payload = chunk['frame'].tobytes()
+            if chunk['kind'][0] == KIND_BATTERY:
+                payload = payload[:eu.FRAME_SIZE]
+            yield float(chunk['timestamp'][0]), payload
+
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="EmoConnect 세션 기록 파일 정보")
+    arg_parser.add_argument("paths", nargs="+")
+    args = arg_parser.parse_args()
+
+    for path in args.paths:
+        reader = SessionReader(path)
+        start = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(reader.start_time))
+        print(f"{path}: {len(reader)} records, {reader.duration:.1f} s, "
+              f"{len(reader.battery())} battery packets, started {start}")
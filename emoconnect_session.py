@@ -0,0 +1,334 @@
+# emoconnect_session.py
+# GUI(Qt) 없이 동작하는 BLE 스트리밍 코어
+import asyncio
+import re
+import time
+from collections import deque
+
+import numpy as np
+
+import emoconnect_utils as eu
+from emoconnect_transport import BleakTransport, scan_devices
+
+# 측정 시작/종료 UART 명령 (명령 사이 0.1초 대기)
+START_COMMANDS = (b"\nset POWER_1V8 1\n", b"\nset ppg_enable 1\n", b"\nsetup ppg\n")
+STOP_COMMANDS = (b"\nset ppg_enable 0\n", b"\nsetup ppg\n")
+
+
+def parse_device_id(device_name):
+    """
+    장치 이름에서 괄호 안의 장치 ID를 추출합니다. (예: "EmoConnect v1.0(A107)" → "A107")
+    괄호가 없으면 이름 전체를 반환합니다.
+    """
+    match = re.search(r'\((.*?)\)', device_name)
+    if match:
+        return match.group(1)
+    return device_name
+
+
+_RESAMPLERS = {}
+
+
+def get_resampler(num_points=50):
+    """num_points별로 공유하는 Resampler (입력 길이별 보간 격자 캐시를 재사용)"""
+    resampler = _RESAMPLERS.get(num_points)
+    if resampler is None:
+        resampler = _RESAMPLERS[num_points] = eu.Resampler(num_points)
+    return resampler
+
+
+def interpolate_data(buffer, num_points=50):
+    """
+    수신된 샘플(1차원 또는 (n, 3))을 num_points개로 선형 보간하고 소수점 3자리로 반올림합니다.
+    """
+    return get_resampler(num_points).interpolate(buffer)
+
+
+def resample_window(samples, num_points=50, resampler=None):
+    """
+    한 주기 동안 수신된 샘플(SensorStream.drain() 형식)을 보간합니다.
+    resampler: eu.TimelineResampler면 샘플 시각 기준으로 고정 주기 격자에 보간 ('time' 포함, 포인트 수 가변),
+               없으면 수신 샘플 수와 관계없이 num_points개로 늘이거나 줄임
+    보간 결과는 배열입니다: 'ppg' (n,), 'acc' / 'gyro' / 'mag' (n, 3) ('hr', 'filtered_ppg'는 None)
+    """
+    result = None
+    if resampler is not None:
+        result = resampler.resample(samples)
+    elif len(samples['ppg']) >= 10:
+        try:
+            result = get_resampler(num_points).resample(samples)
+        except Exception as e:
+            print(f"Interpolation error: {e}")
+    if result is None:
+        result = {'ppg': np.zeros(num_points)}
+        for name in ('acc', 'gyro', 'mag'):
+            result[name] = np.zeros((num_points, 3))
+
+    result['hr'] = None
+    result['filtered_ppg'] = None
+    result['hrv'] = None
+    result['quality'] = None
+    return result
+
+
+def analyze_window(result, hr_analyzer):
+    """보간 결과로 심박수를 계산하여 result의 'hr', 'filtered_ppg' (배열 API면 'hrv', 'quality'도)를 채웁니다."""
+    if hasattr(hr_analyzer, 'update'):
+        # 배열 API: 보간 배열을 변환 없이 전달
+        analysis = hr_analyzer.update(result['ppg'], result['acc'])
+        result['hr'] = analysis.hr
+        result['filtered_ppg'] = analysis.filtered_ppg
+        result['hrv'] = analysis.hrv
+        result['quality'] = analysis.quality
+    else:
+        hr_value, filter_list = hr_analyzer.update_hr(result['ppg'], result['acc'])
+        result['hr'] = hr_value
+        result['filtered_ppg'] = filter_list
+    return result
+
+
+def process_window(samples, hr_analyzer=None, num_points=50, resampler=None):
+    """
+    한 주기 동안 수신된 샘플(SensorStream.drain() 형식)을 보간하고(resample_window),
+    hr_analyzer가 있으면 심박수를 계산합니다. (실시간 세션과 오프라인 일괄 분석이 공유)
+    """
+    result = resample_window(samples, num_points, resampler)
+    if hr_analyzer:
+        analyze_window(result, hr_analyzer)
+    return result
+
+
+class SensorSession:
+    """
+    장치 한 대와의 측정 세션
+    BLE 연결, PPG 특성 알림 구독, 측정 시작/종료 명령, 1초 주기 보간 및 심박수 계산을 수행하고
+    결과를 콜백 또는 비동기 이터레이터(results())로 전달합니다.
+
+    결과 딕셔너리: {'ppg', 'acc', 'gyro', 'mag'} (보간 배열), 'time' (timebase='arrival'일 때 격자 시각),
+                 'hr', 'filtered_ppg' (hr_analyzer가 없으면 None, update()를 제공하는 분석기면 배열), 'timestamp',
+                 'hrv' (update()를 제공하는 분석기면 HeartRateResult.hrv, RR 간격 스트림이 없으면 None),
+                 'quality' (update()를 제공하는 분석기면 HeartRateResult.quality, 품질 추정기가 없으면 None)
+    """
+    def __init__(self, address, device_id='', hr_analyzer=None, on_result=None,
+                 interval=1.0, num_points=50, transport=None, auto_process=True, recorder=None,
+                 timebase=None, anti_alias='auto', worker=None):
+        """
+        address: BLE 장치 주소
+        hr_analyzer: update(ppg, acc) 또는 update_hr(ppg, acc)를 제공하는 분석기 (없으면 보간 결과만 전달)
+        on_result: 결과 딕셔너리를 받을 콜백 (add_callback()으로 추가 등록 가능)
+        interval: 처리 주기 (초)
+        transport: emoconnect_transport.Transport 구현 (지정하지 않으면 address의 BleakTransport)
+        auto_process: True면 알림 수신 시 주기가 지났을 때 바로 처리,
+                      False면 외부 스케줄러(SessionManager)가 process()를 호출
+        recorder: 수신한 알림 원본을 기록할 emoconnect_recorder.SessionRecorder (선택)
+        timebase: 'arrival' - 알림 도착 시각으로 추정한 연속 시간축에서 50Hz 격자로 보간 (주기 경계 불연속 없음)
+                  'count' - 기존 방식, 주기 동안 받은 샘플을 num_points개로 늘이거나 줄임
+                  None - hr_analyzer가 update_hr()만 제공하면 'count', 그 외에는 'arrival'
+                         (update_hr() 분석기는 호출마다 num_points개 입력을 가정하므로 가변 길이 창을 넘기지 않음)
+        anti_alias: timebase='arrival'일 때 eu.TimelineResampler의 anti_alias 정책
+        worker: emoconnect_worker.ProcessingWorker를 지정하면 처리 창을 작업 스레드로 넘기고
+                결과는 이벤트 루프 스레드에서 콜백/results()로 전달 (알림 처리와 UI가 분석 시간만큼 멈추지 않음)
+        """
+        if timebase is None:
+            timebase = 'count' if hr_analyzer is not None and not hasattr(hr_analyzer, 'update') else 'arrival'
+        if timebase not in ('arrival', 'count'):
+            raise ValueError(f"Unknown timebase: {timebase!r}")
+        self.address = address
+        self.device_id = device_id
+        self.hr_analyzer = hr_analyzer
+        self.interval = interval
+        self.num_points = num_points
+        self.auto_process = auto_process
+        self.recorder = recorder
+        self.resampler = eu.TimelineResampler(anti_alias=anti_alias) if timebase == 'arrival' else None
+        self.transport = transport if transport is not None else BleakTransport(address)
+        self.uuids = eu.UUIDs()
+        self.stream = eu.SensorStream()
+        self.motion = eu.MotionNoiseEstimator()  # 알림 단위로 갱신되는 움직임 노이즈 (최근 1초)
+        self.worker = worker
+        self.handler_latency = deque(maxlen=1000)  # notification_handler 1회 처리 시간 (초)
+        self.last_timestamp = time.time()
+        self._loop = None
+        self._callbacks = []
+        self._queues = []
+        if on_result is not None:
+            self._callbacks.append(on_result)
+
+    @property
+    def is_connected(self):
+        return self.transport.is_connected
+
+    @property
+    def noise_threshold(self):
+        """최근 1초 원시 가속도의 축별 표준편차 합 (알림마다 갱신되므로 1초 미만 단위의 움직임 판단에 사용)"""
+        return self.motion.noise_threshold
+
+    @property
+    def due_time(self):
+        """다음 처리 예정 시각"""
+        return self.last_timestamp + self.interval
+
+    def add_callback(self, callback):
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        self._callbacks.remove(callback)
+
+    async def connect(self):
+        """장치에 연결하고 PPG/IMU 특성 알림을 구독합니다."""
+        await self.transport.connect()
+        self._loop = asyncio.get_running_loop()
+        self.last_timestamp = time.time()
+        await self.transport.start_notify(self.uuids.get_READ_PPG_CHAR(), self.notification_handler)
+
+    async def disconnect(self):
+        if self.transport.is_connected:
+            await self.transport.disconnect()
+        for queue in self._queues:
+            queue.put_nowait(None)
+
+    async def start_measure(self):
+        await self._send_commands(START_COMMANDS)
+
+    async def stop_measure(self):
+        await self._send_commands(STOP_COMMANDS)
+
+    async def _send_commands(self, commands):
+        for command in commands:
+            await self.transport.write_gatt_char(self.uuids.get_WRITE_UART_CHAR(), command)
+            await asyncio.sleep(0.1)
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.disconnect()
+
+    def notification_handler(self, sender, data):
+        started = time.perf_counter()
+        arrival = time.monotonic()
+        if self.recorder is not None:
+            # 기록은 부가 기능: 실패하면 (디스크 부족, 닫힌 파일 등) 기록을 끄고 실시간 처리는 계속
+            try:
+                self.recorder.record(data, arrival)
+            except Exception as e:
+                print(f"Error recording {self.address}, recording disabled: {e}")
+                self.recorder = None
+        try:
+            count = self.stream.ingest(data, arrival)
+            if count:
+                self.motion.update(self.stream.latest(count)['acc'])
+        except Exception as e:
+            print(f"Error handling notification: {e}")
+            return
+
+        if self.auto_process:
+            current_timestamp = time.time()
+            if current_timestamp - self.last_timestamp >= self.interval:
+                # 처리 창 하나의 오류가 BLE 알림 콜백(전송 계층의 알림 작업)을 끝내지 않도록 기록만 하고 계속
+                try:
+                    self.process()
+                except Exception as e:
+                    print(f"Error processing {self.address}: {e}")
+                self.last_timestamp = current_timestamp
+        self.handler_latency.append(time.perf_counter() - started)
+
+    def process(self):
+        """
+        지난 처리 이후 수신된 샘플을 보간하고 (분석기가 있으면) 심박수를 계산하여 결과를 전달합니다.
+        worker가 있으면 처리 창의 복사본을 작업 큐에 넣고 None을 반환합니다. (결과는 콜백/results()로 전달)
+        """
+        samples = self.stream.drain()
+        if self.worker is not None:
+            self.worker.submit(self, {name: values.copy() for name, values in samples.items()})
+            return None
+        return self.publish(self.process_samples(samples))
+
+    def process_samples(self, samples):
+        """처리 창 하나를 보간/분석하여 결과 딕셔너리를 만듭니다. (worker 사용 시 작업 스레드에서 호출)"""
+        result = process_window(samples, self.hr_analyzer, self.num_points, self.resampler)
+        result['timestamp'] = time.time()
+        return result
+
+    def publish(self, result):
+        """결과를 콜백과 results() 이터레이터에 전달합니다."""
+        for callback in self._callbacks:
+            callback(result)
+        for queue in self._queues:
+            queue.put_nowait(result)
+        return result
+
+    def publish_threadsafe(self, result):
+        """다른 스레드에서 결과를 전달할 때 사용합니다. (이벤트 루프가 있으면 루프 스레드에서 publish 실행)"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.publish, result)
+        else:
+            self.publish(result)
+
+    async def results(self):
+        """
+        처리 결과를 순서대로 내보내는 비동기 이터레이터. disconnect() 시 종료됩니다.
+
+            async for result in session.results():
+                print(result['hr'])
+        """
+        self._loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                result = await queue.get()
+                if result is None:
+                    break
+                yield result
+        finally:
+            self._queues.remove(queue)
+
+
+async def main(address, duration=None, transport=None, record_path=None):
+    """
+    명령행 실행: 지정한 장치(또는 에뮬레이터)에 연결하여 측정 결과를 출력합니다.
+    record_path: 지정하면 수신한 알림을 세션 기록 파일로 저장
+    """
+    import emoconnect_pro as ep
+    from emoconnect_recorder import SessionRecorder
+
+    recorder = SessionRecorder(record_path) if record_path else None
+    session = SensorSession(address, hr_analyzer=ep.HeartRateAnalyzer(cal_hr_time=5), transport=transport,
+                            recorder=recorder)
+    try:
+        async with session:
+            await session.start_measure()
+            start = time.time()
+            async for result in session.results():
+                print(f"Heart Rate: {result['hr']:.2f}")
+                if duration is not None and time.time() - start >= duration:
+                    break
+            await session.stop_measure()
+    finally:
+        # 세션이 예외로 끝나도 기록 파일을 닫아 마지막 레코드까지 기록
+        if recorder:
+            recorder.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="EmoConnect/VitalTrack headless 측정")
+    arg_parser.add_argument("address", nargs="?", help="BLE 장치 주소 (생략 시 검색 결과 출력)")
+    arg_parser.add_argument("--duration", type=float, default=None, help="측정 시간 (초)")
+    arg_parser.add_argument("--emulate", action="store_true", help="BLE 장치 대신 내장 에뮬레이터 사용")
+    arg_parser.add_argument("--record", default=None, help="수신 알림을 기록할 세션 파일 경로")
+    args = arg_parser.parse_args()
+
+    if args.emulate:
+        from emoconnect_transport import EmulatedTransport
+
+        asyncio.run(main("EMULATOR", args.duration, EmulatedTransport(), args.record))
+    elif args.address:
+        asyncio.run(main(args.address, args.duration, record_path=args.record))
+    else:
+        for name, address in asyncio.run(scan_devices()):
+            print(f"{name} - {address}")
@@ -0,0 +1,282 @@
+# emoconnect_transport.py
+# BLE 전송 계층: Bleak 기반 실제 장치 연결과, 무선 장치 없이 동작하는 프로세스 내 에뮬레이터
+import asyncio
+import csv
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+import emoconnect_utils as eu
+
+DEVICE_PREFIXES = ("VitalTrack", "EmoConnect")
+
+
+async def scan_devices(timeout=5.0):
+    """
+    BLE 장치를 검색하여 VitalTrack / EmoConnect 장치의 (이름, 주소) 리스트를 반환합니다.
+    """
+    from bleak import BleakScanner  # 실제 BLE 사용 시에만 import (분석/에뮬레이터 경로의 시작 시간 단축)
+    devices = await BleakScanner.discover(timeout=timeout)
+    return [(device.name, device.address) for device in devices
+            if device.name and device.name.startswith(DEVICE_PREFIXES)]
+
+
+class Transport(ABC):
+    """
+    전송 계층 인터페이스
+    SensorSession이 사용하는 BleakClient 호환 메서드를 정의합니다.
+    (추상 메서드를 하나라도 구현하지 않으면 측정 도중이 아니라 생성 시 TypeError)
+    """
+    @property
+    @abstractmethod
+    def is_connected(self):
+        ...
+
+    @abstractmethod
+    async def connect(self):
+        ...
+
+    @abstractmethod
+    async def disconnect(self):
+        ...
+
+    @abstractmethod
+    async def start_notify(self, char, handler):
+        ...
+
+    @abstractmethod
+    async def stop_notify(self, char):
+        ...
+
+    @abstractmethod
+    async def write_gatt_char(self, char, data):
+        ...
+
+
+class BleakTransport(Transport):
+    """Bleak(BleakClient)를 이용한 실제 BLE 장치 전송 계층"""
+    def __init__(self, address):
+        from bleak import BleakClient
+        self.address = address
+        self.client = BleakClient(address)
+
+    @property
+    def is_connected(self):
+        return self.client.is_connected
+
+    async def connect(self):
+        await self.client.connect()
+
+    async def disconnect(self):
+        await self.client.disconnect()
+
+    async def start_notify(self, char, handler):
+        await self.client.start_notify(char, handler)
+
+    async def stop_notify(self, char):
+        await self.client.stop_notify(char)
+
+    async def write_gatt_char(self, char, data):
+        await self.client.write_gatt_char(char, data)
+
+
+class Recording:
+    """
+    에뮬레이터 재생용 기록 데이터
+    ppg: (n,) PPG 값, imu: (n, 9) acc/gyro/mag 값 또는 (n, 3) acc 값 (둘 중 하나만 있어도 됨)
+    """
+    def __init__(self, ppg=None, imu=None):
+        self.ppg = None if ppg is None else np.asarray(ppg, dtype=np.float64).reshape(-1)
+        self.imu = None
+        if imu is not None:
+            imu = np.asarray(imu, dtype=np.float64)
+            self.imu = np.zeros((len(imu), 9))
+            self.imu[:, :imu.shape[1]] = imu
+
+    @classmethod
+    def from_csv(cls, ppg_path=None, imu_path=None, imu_raw_bits=False):
+        """
+        hr_values.csv(한 열) / acc_interp.csv(행마다 acc 3열 또는 acc/gyro/mag 9열) 형식의 CSV에서 기록을 읽습니다.
+        imu_raw_bits: IMU 값이 float16 비트 패턴(0 ~ 65535)으로 저장된 경우 True
+        """
+        ppg = None
+        imu = None
+        if ppg_path:
+            with open(ppg_path, newline='') as f:
+                ppg = [float(row[0]) for row in csv.reader(f) if row]
+        if imu_path:
+            with open(imu_path, newline='') as f:
+                rows = [[float(value) for value in row] for row in csv.reader(f) if row]
+            imu = np.zeros((len(rows), 9))
+            for i, row in enumerate(rows):
+                imu[i, :len(row)] = row
+            if imu_raw_bits:
+                imu = eu.FLOAT16_TABLE[np.clip(np.round(imu), 0, 65535).astype(np.uint16)]
+        return cls(ppg, imu)
+
+
+class EmulatedTransport(Transport):
+    """
+    프로세스 내 장치 에뮬레이터
+    실제 장치와 같은 20바이트 PPG/IMU 프레임과 BATT 패킷을 설정한 속도, 지터, 패킷 손실로 전송합니다.
+    "set ppg_enable 1" / "set ppg_enable 0" UART 명령으로 측정을 시작/종료합니다.
+    """
+    def __init__(self, address="EMULATOR", sample_rate=50.0, samples_per_notification=5,
+                 heart_rate=72.0, motion=0.0, jitter=0.0, packet_loss=0.0,
+                 battery_interval=10.0, battery_level=87, recording=None, autostart=False, seed=None):
+        """
+        sample_rate: 초당 샘플 수
+        samples_per_notification: 알림 한 건에 담을 20바이트 프레임 수
+        heart_rate: 합성 PPG의 심박수 (bpm)
+        motion: 움직임 세기 (가속도 표준편차, m/s^2), PPG에도 움직임 잡음이 더해짐
+        jitter: 알림 간격의 표준편차 (초)
+        packet_loss: 알림 손실 확률 (0 ~ 1)
+        battery_interval: BATT 패킷 전송 주기 (초, None이면 전송하지 않음)
+        recording: Recording (지정하면 합성 대신 기록 데이터를 반복 재생)
+        autostart: True면 UART 시작 명령 없이 start_notify 직후 전송 시작
+        """
+        self.address = address
+        self.sample_rate = sample_rate
+        self.samples_per_notification = samples_per_notification
+        self.heart_rate = heart_rate
+        self.motion = motion
+        self.jitter = jitter
+        self.packet_loss = packet_loss
+        self.battery_interval = battery_interval
+        self.battery_level = battery_level
+        self.recording = recording
+        self.streaming = autostart
+        self.written = []
+        self.sent_notifications = 0
+        self.dropped_notifications = 0
+        self.rng = np.random.default_rng(seed)
+        self._connected = False
+        self._handler = None
+        self._task = None
+        self._sample_index = 0
+        self._battery_count = 0
+
+    @property
+    def is_connected(self):
+        return self._connected
+
+    async def connect(self):
+        self._connected = True
+
+    async def disconnect(self):
+        await self.stop_notify(None)
+        self._connected = False
+
+    async def start_notify(self, char, handler):
+        self._handler = handler
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop_notify(self, char):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def write_gatt_char(self, char, data):
+        self.written.append(bytes(data))
+        if b"set ppg_enable 1" in data:
+            self.streaming = True
+        elif b"set ppg_enable 0" in data:
+            self.streaming = False
+
+    def samples(self, start, count):
+        """start번째부터 count개 샘플의 (ppg, imu(count, 9)) 값을 반환합니다."""
+        index = np.arange(start, start + count)
+        t = index / self.sample_rate
+        recording = self.recording
+
+        if recording is not None and recording.ppg is not None:
+            ppg = recording.ppg[index % len(recording.ppg)]
+        else:
+            # 수축기 피크 + 중복맥파(dicrotic notch) 형태의 맥파와 호흡에 의한 기저선 변동
+            phase = (t * self.heart_rate / 60.0) % 1.0
+            pulse = np.exp(-((phase - 0.2) / 0.08) ** 2) + 0.4 * np.exp(-((phase - 0.55) / 0.1) ** 2)
+            ppg = 30000 + 1500 * pulse + 300 * np.sin(2 * np.pi * 0.25 * t)
+            ppg = ppg + self.rng.normal(0.0, 30.0 + 200.0 * self.motion, count)
+
+        if recording is not None and recording.imu is not None:
+            imu = recording.imu[index % len(recording.imu)]
+        else:
+            imu = np.empty((count, 9))
+            imu[:, 0:3] = [0.0, 0.0, 9.81]
+            imu[:, 0:3] += self.rng.normal(0.0, 0.02 + self.motion, (count, 3))
+            imu[:, 3:6] = self.rng.normal(0.0, 0.01 + 0.5 * self.motion, (count, 3))
+            imu[:, 6:9] = [30.0, -10.0, 45.0]
+            imu[:, 6:9] += self.rng.normal(0.0, 0.5, (count, 3))
+        return ppg, imu
+
+    def next_notification(self):
+        """다음 센서 알림 한 건(samples_per_notification개 프레임)을 만듭니다."""
+        count = self.samples_per_notification
+        ppg, imu = self.samples(self._sample_index, count)
+        self._sample_index += count
+        records = np.zeros(count, dtype=eu.FRAME_DTYPE)
+        records['ppg'] = np.clip(np.round(ppg), 0, 65535)
+        records['acc'] = imu[:, 0:3]
+        records['gyro'] = imu[:, 3:6]
+        records['mag'] = imu[:, 6:9]
+        return records.tobytes()
+
+    def battery_notification(self):
+        """BATT 패킷 (배터리 레벨: 6번째 바이트, 카운트: 8~9번째 바이트)"""
+        self._battery_count = (self._battery_count + 1) & 0xFFFF
+        payload = bytearray(eu.FRAME_SIZE)
+        payload[0:4] = b"BATT"
+        payload[6] = self.battery_level
+        payload[8:10] = self._battery_count.to_bytes(2, 'little')
+        return bytes(payload)
+
+    def generate(self, count):
+        """
+        이벤트 루프 없이 알림 count건 분량을 생성합니다. (패킷 손실, BATT 패킷 포함)
+        벤치마크에서 실시간 대기 없이 파이프라인을 재생할 때 사용합니다.
+        """
+        period = self.samples_per_notification / self.sample_rate
+        notifications = []
+        next_battery = self.battery_interval
+        for i in range(count):
+            if self.battery_interval and i * period >= next_battery:
+                notifications.append(self.battery_notification())
+                next_battery += self.battery_interval
+            payload = self.next_notification()
+            if self.packet_loss and self.rng.random() < self.packet_loss:
+                self.dropped_notifications += 1
+                continue
+            self.sent_notifications += 1
+            notifications.append(payload)
+        return notifications
+
+    async def _run(self):
+        period = self.samples_per_notification / self.sample_rate
+        next_time = time.monotonic()
+        next_battery = next_time + (self.battery_interval or 0)
+        while True:
+            next_time += period
+            delay = next_time - time.monotonic()
+            if self.jitter:
+                delay += self.rng.normal(0.0, self.jitter)
+            await asyncio.sleep(max(0.0, delay))
+            if not self.streaming:
+                # 전송하지 않는 동안 배터리 주기를 현재 시각에 맞춰 두어 시작 직후 밀린 BATT 패킷을 몰아 보내지 않음
+                next_battery = time.monotonic() + (self.battery_interval or 0)
+                continue
+
+            if self.battery_interval and time.monotonic() >= next_battery:
+                self._handler(None, bytearray(self.battery_notification()))
+                next_battery += self.battery_interval
+
+            payload = self.next_notification()
+            if self.packet_loss and self.rng.random() < self.packet_loss:
+                self.dropped_notifications += 1
+                continue
+            self.sent_notifications += 1
+            self._handler(None, bytearray(payload))
@@ -1,6 +1,30 @@
 # emoconnect_utils.py
-import asyncio
-import struct
+import math
+
+import numpy as np
+
+import emoconnect_kernels as ek
+
+# 센서 데이터 청크(20바이트) 레이아웃: ppg(uint16) + acc/gyro/mag 각 3축 float16 (리틀 엔디안)
+FRAME_SIZE = 20
+FRAME_DTYPE = np.dtype([
+    ('ppg', '<u2'),
+    ('acc', '<f2', (3,)),
+    ('gyro', '<f2', (3,)),
+    ('mag', '<f2', (3,)),
+])
+
+# IEEE-754 16비트 부동소수점의 65,536개 비트 패턴 전체를 32비트 값으로 미리 변환한 테이블
+# (서브노멀, ±inf, NaN 포함). newert_utils 등 다른 파서도 이 테이블을 공유합니다.
+FLOAT16_TABLE = np.arange(65536, dtype=np.uint16).view(np.float16).astype(np.float32)
+FLOAT16_VALUES = FLOAT16_TABLE.tolist()
+
+
+def float16_to_float32(value):
+    """
+    16비트 정수 비트 패턴(0 ~ 0xFFFF)을 float 값으로 변환합니다. (테이블 조회)
+    """
+    return FLOAT16_VALUES[value]
 
 
 class UUIDs:
@@ -46,6 +70,9 @@ class DataParser:
     배터리 정보 또는 ppg, 가속도, 자이로, 자기장 데이터를 추출합니다.
     """
     def parse_data(self, data: bytes) -> list:
+        """
+        parse_frames() 결과를 샘플 단위 딕셔너리 리스트로 변환하는 호환용 래퍼.
+        """
         parsed_data = []
         if data[0:4] == b"BATT":
             # 배터리 데이터 처리: 배터리 레벨과 카운트를 추출
@@ -53,56 +80,442 @@ class DataParser:
             count = (data[9] << 8) | data[8]
             parsed_data.append({'battery': battery_level, 'count': count})
         else:
-            chunk_size = 20
-            num_chunks = len(data) // chunk_size
-            for i in range(num_chunks):
-                base = 20 * i
-                ppg = ((data[base + 1] << 8) | data[base + 0])
-                acc_x = self.float16_to_float32((data[base + 3] << 8) | data[base + 2])
-                acc_y = self.float16_to_float32((data[base + 5] << 8) | data[base + 4])
-                acc_z = self.float16_to_float32((data[base + 7] << 8) | data[base + 6])
-                gyro_x = self.float16_to_float32((data[base + 9] << 8) | data[base + 8])
-                gyro_y = self.float16_to_float32((data[base + 11] << 8) | data[base + 10])
-                gyro_z = self.float16_to_float32((data[base + 13] << 8) | data[base + 12])
-                mag_x = self.float16_to_float32((data[base + 15] << 8) | data[base + 14])
-                mag_y = self.float16_to_float32((data[base + 17] << 8) | data[base + 16])
-                mag_z = self.float16_to_float32((data[base + 19] << 8) | data[base + 18])
+            frames = self.parse_frames(data)
+            for ppg, acc, gyro, mag in zip(frames['ppg'].tolist(), frames['acc'].tolist(),
+                                           frames['gyro'].tolist(), frames['mag'].tolist()):
                 parsed_data.append({
                     'ppg': ppg,
-                    'acc': [acc_x, acc_y, acc_z],
-                    'gyro': [gyro_x, gyro_y, gyro_z],
-                    'mag': [mag_x, mag_y, mag_z]
+                    'acc': acc,
+                    'gyro': gyro,
+                    'mag': mag
                 })
         return parsed_data
 
+    def parse_frames(self, data) -> dict:
+        """
+        센서 데이터의 모든 20바이트 청크를 한 번에 디코딩하여 채널별 배열을 반환합니다.
+        data: bytes, bytearray 또는 memoryview (20바이트 미만의 나머지는 무시)
+
+        반환: {'ppg': (n,) uint16, 'acc' / 'gyro' / 'mag': (n, 3) float32}
+        배터리(BATT) 패킷은 센서 샘플이 없으므로 길이 0 배열을 반환합니다.
+        """
+        if data[0:4] == b"BATT":
+            num_chunks = 0
+        else:
+            num_chunks = len(data) // FRAME_SIZE
+        ppg, imu = ek.parse_frames(data, num_chunks)
+        return {
+            'ppg': ppg,
+            'acc': imu[:, 0:3],
+            'gyro': imu[:, 3:6],
+            'mag': imu[:, 6:9]
+        }
 
     def float16_to_float32(self, value):
         """
         IEEE-754 16비트 부동소수점 값을 32비트 부동소수점 값으로 변환하는 함수.
         """
-        # 16비트 float 값을 부호, 지수, 가수로 나누어 처리
-        sign = (value >> 15) & 0x1  # 부호 비트 (1비트)
-        exponent = (value >> 10) & 0x1F  # 지수 비트 (5비트)
-        fraction = value & 0x3FF  # 가수 비트 (10비트)
+        return FLOAT16_VALUES[value]
+
+
+class SensorStream:
+    """
+    센서 스트림 수신 클래스
+    BLE 알림 데이터를 채널별 고정 크기 NumPy 링 버퍼(ppg, acc, gyro, mag)에 바로 디코딩합니다.
+    버퍼는 생성 시 한 번만 할당되며, 이후 수신/조회 과정에서는 새 버퍼를 만들지 않습니다.
+    """
+    def __init__(self, capacity=512, sample_rate=50.0, clock_gain=0.05, max_gap=0.5):
+        """
+        capacity: 채널별 최대 보관 샘플 수 (50Hz 기준 512 샘플 ≒ 10초)
+        sample_rate: 장치의 공칭 샘플링 주파수 (Hz), 샘플 시각 추정에 사용
+        clock_gain: 알림 도착 시각 쪽으로 샘플 시간축을 보정하는 비율 (0 ~ 1, 클수록 도착 지터를 그대로 따름)
+        max_gap: 예상 시각보다 이만큼(초) 이상 늦게 도착하면 (패킷 손실, 일시 중단) 도착 시각으로 재동기화
+        """
+        self.capacity = capacity
+        self.sample_rate = sample_rate
+        self.clock_gain = clock_gain
+        self.max_gap = max_gap
+        self.last_time = None  # 마지막 샘플의 추정 시각
+        self.time = np.zeros(capacity, dtype=np.float64)
+        self.ppg = np.zeros(capacity, dtype=np.float64)
+        self.acc = np.zeros((capacity, 3), dtype=np.float32)
+        self.gyro = np.zeros((capacity, 3), dtype=np.float32)
+        self.mag = np.zeros((capacity, 3), dtype=np.float32)
+        self.total_samples = 0  # 지금까지 수신한 전체 샘플 수
+        self.battery = None
+        self.battery_count = None
+        self._head = 0  # 다음 샘플을 기록할 위치
+        self._drained = 0  # 마지막 drain() 시점의 total_samples
+        # drain() 결과를 담는 출력 버퍼 (시간 순서로 정렬된 연속 배열)
+        self._out = {
+            'time': np.zeros(capacity, dtype=np.float64),
+            'ppg': np.zeros(capacity, dtype=np.float64),
+            'acc': np.zeros((capacity, 3), dtype=np.float32),
+            'gyro': np.zeros((capacity, 3), dtype=np.float32),
+            'mag': np.zeros((capacity, 3), dtype=np.float32)
+        }
 
-        # 지수가 0인 경우 (서브노멀 숫자 처리)
-        if exponent == 0:
-            # 서브노멀 숫자 처리를 위한 지수 조정
-            exponent = 0x1F
-            fraction = fraction * 8192  # 2^23 / 2^10 = 8192로 가수 값 조정
+    def __len__(self):
+        return min(self.total_samples, self.capacity)
+
+    def ingest(self, data, timestamp=None) -> int:
+        """
+        알림 한 건(bytes, bytearray, memoryview)을 디코딩하여 링 버퍼에 기록합니다.
+        timestamp: 알림 도착 시각 (초, time.monotonic() 등). 생략하면 공칭 주기로 시간축을 이어감
+        반환: 기록된 센서 샘플 수 (배터리 패킷은 0)
+        """
+        if data[0:4] == b"BATT":
+            self.battery = min(max(data[6], 0), 100)
+            self.battery_count = (data[9] << 8) | data[8]
+            return 0
+
+        num_chunks = len(data) // FRAME_SIZE
+        if num_chunks == 0:
+            return 0
+        records = np.frombuffer(data, dtype=FRAME_DTYPE, count=num_chunks)
+        times = self._sample_times(num_chunks, timestamp)
+        if num_chunks > self.capacity:
+            records = records[-self.capacity:]
+            times = times[-self.capacity:]
+
+        start = self._head
+        stop = start + len(records)
+        if stop <= self.capacity:
+            self._write(records, times, start, stop)
         else:
-            # 지수가 0이 아니면, 지수 조정
-            exponent -= 15
-            exponent += 127  # 32비트 float의 지수 오프셋
+            split = self.capacity - start
+            self._write(records[:split], times[:split], start, self.capacity)
+            self._write(records[split:], times[split:], 0, stop - self.capacity)
+        self._head = stop % self.capacity
+        self.total_samples += num_chunks
+        return num_chunks
+
+    def _sample_times(self, count, arrival):
+        """
+        알림에 담긴 count개 샘플의 시각을 추정합니다.
+        마지막 샘플 시각은 공칭 주기로 이어간 예상 시각을 도착 시각 쪽으로 clock_gain만큼 보정한 값이며
+        (도착 시각보다 늦을 수 없음), 이전 마지막 샘플과의 사이를 균등하게 나눕니다.
+        BLE 연결 주기 지터로 알림이 몰려 도착해도 시간축이 연속적이고 단조 증가하도록 유지합니다.
+        """
+        period = 1.0 / self.sample_rate
+        if self.last_time is not None:
+            expected = self.last_time + count * period
+            if arrival is None:
+                last = expected
+            elif arrival - expected > self.max_gap:
+                last = None  # 재동기화
+            else:
+                last = min(expected + self.clock_gain * (arrival - expected), arrival)
+                if last <= self.last_time:
+                    last = expected
+            if last is not None:
+                times = self.last_time + (last - self.last_time) / count * np.arange(1, count + 1)
+                self.last_time = last
+                return times
+        last = arrival if arrival is not None else (count - 1) * period
+        self.last_time = last
+        return last - period * np.arange(count - 1, -1, -1)
+
+    def _write(self, records, times, start, stop):
+        self.time[start:stop] = times
+        self.ppg[start:stop] = records['ppg']
+        self.acc[start:stop] = records['acc']
+        self.gyro[start:stop] = records['gyro']
+        self.mag[start:stop] = records['mag']
+
+    def latest(self, count) -> dict:
+        """
+        최근 count개 샘플을 시간 순서대로 반환합니다. (내부 출력 버퍼의 뷰, 다음 호출 시 덮어씀)
+        'time'에는 각 샘플의 추정 시각이 담깁니다.
+        """
+        count = min(count, len(self))
+        start = (self._head - count) % self.capacity
+        split = min(count, self.capacity - start)
+        result = {}
+        for name in ('time', 'ppg', 'acc', 'gyro', 'mag'):
+            ring = getattr(self, name)
+            out = self._out[name]
+            out[:split] = ring[start:start + split]
+            out[split:count] = ring[:count - split]
+            result[name] = out[:count]
+        return result
+
+    def drain(self) -> dict:
+        """
+        마지막 drain() 이후 수신된 샘플을 latest()와 같은 형식으로 반환하고 표시를 이동합니다.
+        링 버퍼 용량을 넘어 덮어쓰인 샘플은 포함되지 않습니다.
+        """
+        pending = self.total_samples - self._drained
+        self._drained = self.total_samples
+        return self.latest(pending)
+
+
+CHANNELS = ('ppg', 'acc', 'gyro', 'mag')
+CHANNEL_COLUMNS = {'ppg': 0, 'acc': slice(1, 4), 'gyro': slice(4, 7), 'mag': slice(7, 10)}
+
+
+class Resampler:
+    """
+    선형 보간 리샘플러
+    ppg(1) + acc/gyro/mag(각 3축) 10개 채널을 (n, 10) 행렬로 묶어 한 번의 벡터 연산으로 num_points개로 보간합니다.
+    입력 길이별 보간 인덱스/가중치(출력 격자)는 한 번만 계산하여 캐시합니다.
+    scipy interp1d(kind='linear', fill_value="extrapolate")와 같은 연산 순서를 사용합니다.
+    """
+    def __init__(self, num_points=50, decimals=3):
+        """
+        num_points: 출력 샘플 수
+        decimals: 결과 반올림 자릿수 (None이면 반올림하지 않음)
+        """
+        self.num_points = num_points
+        self.decimals = decimals
+        self._grids = {}
+
+    def grid(self, length):
+        """
+        입력 길이 length에 대한 (lo, hi, 가중치 열벡터)를 반환합니다. (입력 x = 0, 1, ..., length - 1)
+        """
+        grid = self._grids.get(length)
+        if grid is None:
+            x = np.linspace(0, length - 1, num=length)
+            x_new = np.linspace(0, length - 1, num=self.num_points)
+            hi = np.clip(np.searchsorted(x, x_new), 1, length - 1)
+            lo = hi - 1
+            weight = ((x_new - x[lo]) / (x[hi] - x[lo]))[:, None]
+            grid = self._grids[length] = (lo, hi, weight)
+        return grid
+
+    def interpolate(self, values):
+        """
+        values: (n,) 또는 (n, k) 배열을 num_points개로 보간한 float64 배열을 반환합니다.
+        샘플이 1개면 그 값을 반복하고, 없으면 0을 반환합니다.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        length = len(values)
+        if length < 2:
+            shape = (self.num_points,) + values.shape[1:]
+            result = np.tile(values[0], (self.num_points,) + (1,) * (values.ndim - 1)) if length else np.zeros(shape)
+        else:
+            lo, hi, weight = self.grid(length)
+            low = values[lo]
+            if values.ndim == 1:
+                weight = weight[:, 0]
+            result = (values[hi] - low) * weight + low
+        if self.decimals is not None:
+            np.round(result, self.decimals, out=result)
+        return result
+
+    def resample(self, samples) -> dict:
+        """
+        samples: SensorStream.latest()/drain() 형식 {'ppg': (n,), 'acc'/'gyro'/'mag': (n, 3)}
+        반환: 같은 키의 num_points개 보간 배열 (하나의 (num_points, 10) 배열의 뷰)
+        """
+        matrix = np.empty((len(samples['ppg']), 10))
+        for name in CHANNELS:
+            matrix[:, CHANNEL_COLUMNS[name]] = samples[name]
+        result = self.interpolate(matrix)
+        return {name: result[:, CHANNEL_COLUMNS[name]] for name in CHANNELS}
+
+
+class TimelineResampler:
+    """
+    시각 기반 리샘플러
+    SensorStream의 샘플 시각('time')을 이용해 10개 채널을 고정 주기(rate Hz) 격자에 선형 보간합니다.
+    직전 호출의 마지막 샘플과 다음 격자 시각을 이어받으므로 주기 경계에서 시간축이 끊기지 않으며,
+    호출마다 반환하는 포인트 수는 실제로 경과한 시간에 따라 달라집니다.
+    """
+    def __init__(self, rate=50.0, anti_alias='auto', decimals=3):
+        """
+        rate: 출력 격자 주파수 (Hz)
+        anti_alias: 입력이 출력보다 빠를 때 보간 전에 적용할 박스(이동 평균) 필터 정책
+                    'auto' - 입력 샘플 간격으로 추정한 비율(floor(입력 주파수 / rate))만큼 평균
+                    'none' - 필터링하지 않음
+                    정수 n - 항상 n개 샘플 평균
+        decimals: 결과 반올림 자릿수 (None이면 반올림하지 않음)
+        """
+        if anti_alias not in ('auto', 'none') and not (isinstance(anti_alias, int) and anti_alias >= 1):
+            raise ValueError(f"Unknown anti_alias policy: {anti_alias!r}")
+        self.rate = rate
+        self.anti_alias = anti_alias
+        self.decimals = decimals
+        self.clear()
+
+    def clear(self):
+        self.next_time = None  # 다음 출력 격자 시각
+        self._carry_time = np.empty(0)
+        self._carry = np.empty((0, 10))
+
+    def _box_length(self, times):
+        if self.anti_alias == 'none':
+            return 1
+        if self.anti_alias != 'auto':
+            return self.anti_alias
+        if len(times) < 2:
+            return 1
+        step = np.median(np.diff(times))
+        if step <= 0:
+            return 1
+        return max(int(1.0 / (step * self.rate) + 1e-6), 1)
+
+    def resample(self, samples) -> dict:
+        """
+        samples: SensorStream.latest()/drain() 형식 ('time' 포함)
+        반환: {'time': 격자 시각, 'ppg': (m,), 'acc' / 'gyro' / 'mag': (m, 3)} (m은 경과 시간에 따라 가변)
+        """
+        size = len(samples['ppg'])
+        matrix = np.empty((len(self._carry) + size, 10))
+        matrix[:len(self._carry)] = self._carry
+        for name in CHANNELS:
+            matrix[len(self._carry):, CHANNEL_COLUMNS[name]] = samples[name]
+        times = np.concatenate((self._carry_time, samples['time']))
+
+        box = self._box_length(samples['time'])
+        if box > 1 and len(times) >= box:
+            # 값과 시각을 함께 평균하여 필터 지연 없이 시각을 창 중앙에 맞춤
+            kernel = np.full(box, 1.0 / box)
+            filtered = np.empty((len(times) - box + 1, 10))
+            for column in range(10):
+                filtered[:, column] = np.convolve(matrix[:, column], kernel, mode='valid')
+            filtered_times = np.convolve(times, kernel, mode='valid')
+        else:
+            box = 1
+            filtered, filtered_times = matrix, times
+        # 다음 호출에서 첫 필터 출력이 이번 마지막 출력과 같도록 원시 샘플 box개를 이어받음
+        self._carry = matrix[-box:].copy()
+        self._carry_time = times[-box:].copy()
+
+        grid = np.empty(0)
+        if len(filtered_times):
+            if self.next_time is None:
+                self.next_time = filtered_times[0]
+            period = 1.0 / self.rate
+            count = int(np.floor((filtered_times[-1] - self.next_time) * self.rate + 1e-9)) + 1
+            if count > 0:
+                grid = self.next_time + period * np.arange(count)
+                self.next_time = grid[-1] + period
+
+        if len(grid) == 0:
+            result = np.empty((0, 10))
+        elif len(filtered_times) == 1:
+            result = np.repeat(filtered, len(grid), axis=0)
+        else:
+            hi = np.clip(np.searchsorted(filtered_times, grid), 1, len(filtered_times) - 1)
+            lo = hi - 1
+            span = filtered_times[hi] - filtered_times[lo]
+            weight = np.divide(grid - filtered_times[lo], span, out=np.zeros(len(grid)), where=span > 0)
+            low = filtered[lo]
+            result = (filtered[hi] - low) * weight[:, None] + low
+        if self.decimals is not None:
+            np.round(result, self.decimals, out=result)
+        output = {'time': grid}
+        for name in CHANNELS:
+            output[name] = result[:, CHANNEL_COLUMNS[name]]
+        return output
+
+
+class MotionNoiseEstimator:
+    """
+    가속도(IMU) 움직임 노이즈 추정 클래스
+    최근 window_size개 샘플을 링 버퍼에 보관하고 축별 이동 합/제곱합을 샘플 단위로 갱신하여,
+    재스캔 없이 noise_threshold(축별 모표준편차의 합)를 언제든 조회할 수 있습니다.
+    합계는 기준값(shift, 창 평균)을 뺀 값으로 누적하여 상쇄 오차를 줄입니다.
+    """
+    def __init__(self, window_size=50, axes=3):
+        """
+        window_size: 통계에 포함할 최근 샘플 수 (50Hz 기준 50 샘플 = 1초)
+        axes: 샘플당 축 수
+        """
+        self.window_size = window_size
+        self.axes = axes
+        self._ring = np.zeros((window_size, axes), dtype=np.float64)
+        self.clear()
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self._shift = np.zeros(self.axes)
+        self._sum = np.zeros(self.axes)  # Σ(x - shift)
+        self._sum_sq = np.zeros(self.axes)  # Σ(x - shift)²
+        self._since_sync = 0
+
+    def update(self, samples) -> float:
+        """
+        samples: (n, axes) 형태의 리스트 또는 배열 (샘플 하나는 [x, y, z])
+        반환: 갱신된 noise_threshold
+        """
+        samples = np.asarray(samples, dtype=np.float64).reshape(-1, self.axes)
+        size = len(samples)
+        if size == 0:
+            return self.noise_threshold
+        if size >= self.window_size:
+            # 창 전체가 새 샘플로 교체됨
+            self._ring[:] = samples[-self.window_size:]
+            self._head = 0
+            self._count = self.window_size
+            self._resync()
+            return self.noise_threshold
+
+        # 창을 넘치는 가장 오래된 샘플을 합계에서 빼고 새 샘플을 더함
+        evicted = max(self._count + size - self.window_size, 0)
+        if evicted:
+            old = self._read((self._head - self._count) % self.window_size, evicted) - self._shift
+            self._sum -= old.sum(axis=0)
+            self._sum_sq -= (old * old).sum(axis=0)
+            self._count -= evicted
+        new = samples - self._shift
+        self._sum += new.sum(axis=0)
+        self._sum_sq += (new * new).sum(axis=0)
+        self._count += size
+        split = min(size, self.window_size - self._head)
+        self._ring[self._head:self._head + split] = samples[:split]
+        self._ring[:size - split] = samples[split:]
+        self._head = (self._head + size) % self.window_size
 
-        # 32비트 float 형식으로 변환
-        # 1비트 부호, 8비트 지수, 23비트 가수로 구성
-        result = (sign << 31) | (exponent << 23) | (fraction << 13)
+        # 누적 오차가 쌓이지 않도록 창 길이만큼 갱신될 때마다 버퍼로부터 다시 계산 (분할 상환 O(1))
+        self._since_sync += size
+        if self._since_sync >= self.window_size:
+            self._resync()
+        return self.noise_threshold
 
-        # struct를 이용하여 32비트 float 값으로 변환
-        float_value = struct.unpack('f', struct.pack('I', result))[0]
+    def _read(self, start, count):
+        split = min(count, self.window_size - start)
+        if split == count:
+            return self._ring[start:start + count]
+        return np.concatenate((self._ring[start:], self._ring[:count - split]))
 
-        return float_value
+    def _resync(self):
+        window = self._ring[:self._count] if self._count < self.window_size else self._ring
+        self._shift = window.mean(axis=0)
+        centered = window - self._shift
+        self._sum = centered.sum(axis=0)
+        self._sum_sq = (centered * centered).sum(axis=0)
+        self._since_sync = 0
 
+    @property
+    def std(self):
+        """축별 모표준편차 (ddof=0)"""
+        if self._count == 0:
+            return np.zeros(self.axes)
+        mean = self._sum / self._count
+        return np.sqrt(np.maximum(self._sum_sq / self._count - mean * mean, 0.0))
 
+    @property
+    def energy(self) -> float:
+        """움직임 에너지: 축별 분산의 합 (SignalQualityEstimator의 움직임 점수에 사용)"""
+        if self._count == 0:
+            return 0.0
+        count = self._count
+        return sum(max(total_sq / count - (total / count) ** 2, 0.0)
+                   for total, total_sq in zip(self._sum.tolist(), self._sum_sq.tolist()))
 
+    @property
+    def noise_threshold(self) -> float:
+        """움직임 노이즈 지표: 축별 표준편차의 합 (HeartRateAnalyzer의 noiseThreshold와 동일한 정의)"""
+        if self._count == 0:
+            return 0.0
+        # 축 수가 작으므로 배열 연산 대신 파이썬 실수 연산으로 계산
+        count = self._count
+        return sum(math.sqrt(max(total_sq / count - (total / count) ** 2, 0.0))
+                   for total, total_sq in zip(self._sum.tolist(), self._sum_sq.tolist()))
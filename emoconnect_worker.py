@@ -0,0 +1,152 @@
+# emoconnect_worker.py
+# 1초 주기 신호 처리(보간, 추세 제거, 피크 검출, 필터)를 BLE 알림/UI 스레드 밖의 전용 작업 스레드에서 수행합니다.
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+POLICIES = ('coalesce', 'drop_oldest', 'drop_newest')
+
+
+def _percentile(values, q):
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+class ProcessingWorker:
+    """
+    처리 작업 스레드
+    SensorSession.process()가 넘긴 처리 창(샘플 복사본)을 크기가 제한된 큐에 넣고, 전용 스레드 하나가
+    순서대로 분석한 뒤 결과를 세션의 이벤트 루프로 돌려보냅니다. (세션별 분석기 상태는 한 스레드에서만 갱신)
+
+    큐가 가득 찼을 때의 정책:
+        'coalesce'    - 같은 세션의 대기 중인 창에 새 샘플을 이어 붙임 (샘플 손실 없음, 대기 창이 없으면 'drop_oldest')
+                        시간축 보간 세션(session.resampler가 있음)만 해당하고, timebase='count' 세션은 합친 창이
+                        num_points개로 압축되어 심박수가 틀어지므로 'drop_oldest'와 같이 처리
+        'drop_oldest' - 같은 세션의 가장 오래된 대기 창을 버리고 새 창을 넣음
+                        (같은 세션의 대기 창이 없으면 큐 전체에서 가장 오래된 창)
+        'drop_newest' - 새 창을 버림
+    """
+    def __init__(self, maxsize=8, policy='coalesce', history=1000):
+        """
+        maxsize: 대기 큐에 보관할 최대 처리 창 수
+        policy: 큐가 가득 찼을 때의 정책 (POLICIES)
+        history: 대기/처리 시간 통계에 보관할 최근 작업 수
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy!r}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.queue_wait = deque(maxlen=history)  # 큐 대기 시간 (초)
+        self.processing_time = deque(maxlen=history)  # 처리 시간 (초)
+        self._queue = deque()  # [session, samples, 넣은 시각]
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return self
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="emoconnect-worker", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """대기 중인 창을 모두 처리한 뒤 스레드를 종료합니다."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def __len__(self):
+        return len(self._queue)
+
+    def submit(self, session, samples) -> bool:
+        """
+        처리 창을 큐에 넣습니다. (호출 스레드를 막지 않음)
+        samples: SensorStream.drain() 형식의 복사본
+        반환: 새 창 또는 기존 창에 합쳐져 처리 예정이면 True, 버려졌으면 False
+        """
+        with self._condition:
+            self.submitted += 1
+            if len(self._queue) >= self.maxsize:
+                if self.policy == 'coalesce' and session.resampler is not None:
+                    for job in reversed(self._queue):
+                        if job[0] is session:
+                            job[1] = {name: np.concatenate((job[1][name], values)) for name, values in samples.items()}
+                            self.coalesced += 1
+                            return True
+                if self.policy == 'drop_newest':
+                    self.dropped += 1
+                    return False
+                self._drop_oldest(session)
+            self._queue.append([session, samples, time.perf_counter()])
+            self.max_depth = max(self.max_depth, len(self._queue))
+            self._condition.notify()
+            return True
+
+    def _drop_oldest(self, session):
+        """같은 세션의 가장 오래된 대기 창을 버립니다. (없으면 큐 전체에서 가장 오래된 창)"""
+        for job in self._queue:
+            if job[0] is session:
+                self._queue.remove(job)
+                break
+        else:
+            self._queue.popleft()
+        self.dropped += 1
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue and self._running:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                session, samples, queued_at = self._queue.popleft()
+            started = time.perf_counter()
+            self.queue_wait.append(started - queued_at)
+            try:
+                result = session.process_samples(samples)
+            except Exception as e:
+                self.errors += 1
+                print(f"Error processing {session.address}: {e}")
+                continue
+            self.processing_time.append(time.perf_counter() - started)
+            self.processed += 1
+            session.publish_threadsafe(result)
+
+    def metrics(self) -> dict:
+        """백프레셔 지표 스냅샷"""
+        with self._condition:
+            depth = len(self._queue)
+        wait = list(self.queue_wait)
+        busy = list(self.processing_time)
+        return {
+            'submitted': self.submitted,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+            'queue_depth': depth,
+            'max_queue_depth': self.max_depth,
+            'queue_wait_p50': _percentile(wait, 50),
+            'queue_wait_p95': _percentile(wait, 95),
+            'processing_p50': _percentile(busy, 50),
+            'processing_p95': _percentile(busy, 95),
+        }
@@ -1,29 +1,8 @@
 import numpy as np
 import math
 import random
-from scipy.signal import find_peaks
-import asyncio
-
-class PeakDetector:
-    @staticmethod
-    def find_peaks(data, height=50, distance=1, max_num=10):
-        peak_indices = []
-        candidate_indices = []
-
-        for i in range(1, len(data) - 1):
-            if data[i] > data[i - 1] and data[i] > data[i + 1]:
-                candidate_indices.append(i)
-
-        candidate_indices = [idx for idx in candidate_indices if data[idx] > height]
-        candidate_indices.sort(key=lambda x: data[x], reverse=True)
-
-        for idx in candidate_indices:
-            if all(abs(idx - peak) >= distance for peak in peak_indices):
-                peak_indices.append(idx)
-                if len(peak_indices) == max_num:
-                    break
-
-        return sorted(peak_indices)
+from emoconnect_pro import DetrendEngine, PeakDetector
+from emoconnect_utils import MotionNoiseEstimator
 
 class PolynomialDetrendProcessor:
     def __init__(self, ppg_array, window_size, window_interval, order):
@@ -34,17 +13,8 @@ class PolynomialDetrendProcessor:
         self.ppg_array_without_dc = []
 
     def process(self):
-        x_values = np.arange(1, self.window_size + 1)
-        y_values = self.ppg_array[:self.window_size]
-        vandermonde_matrix = np.vander(x_values, N=self.order + 1, increasing=True)
-        x_transposed = vandermonde_matrix.T
-        x_transposed_x = x_transposed @ vandermonde_matrix
-        x_transposed_y = x_transposed @ y_values
-        coefficients = np.linalg.solve(x_transposed_x, x_transposed_y)
-        for i in range(self.window_size):
-            trend = sum(coefficients[j] * (x_values[i] ** j) for j in range(self.order + 1))
-            detrended_value = y_values[i] - trend
-            self.ppg_array_without_dc.append(round(detrended_value, 4))
+        detrended = DetrendEngine.detrend(self.ppg_array, self.order, self.window_size)
+        self.ppg_array_without_dc = np.round(detrended, 4).tolist()
         return self.ppg_array_without_dc
 
 class HeartRateAnalyzer:
@@ -57,6 +27,7 @@ class HeartRateAnalyzer:
         self.result_hr = 0.0
         self.peak_bpm_values = []
         self.cal_hr_time = cal_hr_time
+        self.motion_estimator = MotionNoiseEstimator(window_size=50)
 
     def calculate_stddev(self, values):
         mean = np.mean(values)
@@ -78,12 +49,11 @@ class HeartRateAnalyzer:
                 self.peak_bpm_values.clear()
 
 
-            x_std = self.calculate_stddev([entry[0] for entry in interpolated_acc])
-            y_std = self.calculate_stddev([entry[1] for entry in interpolated_acc])
-            z_std = self.calculate_stddev([entry[2] for entry in interpolated_acc])
+            self.motion_estimator.update(interpolated_acc)
+            x_std, y_std, z_std = self.motion_estimator.std
 
             print("x_std, y_std, z_std", x_std, y_std, z_std)
-            noise_threshold = x_std + y_std + z_std
+            noise_threshold = self.motion_estimator.noise_threshold
             print("noise_threshold", noise_threshold)
 
             mean = np.mean(detrend_value)
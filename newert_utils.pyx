@@ -1,4 +1,5 @@
 # ble_utils.pyx
+from emoconnect_utils import FLOAT16_VALUES
 
 # UUID 관리 클래스
 cdef class UUIDs:
@@ -72,4 +73,5 @@ cdef class DataParser:
         return parsed_data
 
     cdef float16_to_float32(self, value):
-        return float(value)  # 실제 변환 알고리즘으로 대체 필요
+        # emoconnect_utils와 동일한 IEEE-754 변환 테이블 사용
+        return FLOAT16_VALUES[value]
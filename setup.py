@@ -1,6 +1,18 @@
-from setuptools import setup
+import sys
+
+from setuptools import Extension, setup
 from Cython.Build import cythonize
 
+# 필터 커널이 Python 구현과 같은 결과를 내도록 곱셈-덧셈 융합(FMA) 축약을 끔
+extra_compile_args = ['/O2', '/fp:precise'] if sys.platform == 'win32' else ['-O3', '-ffp-contract=off']
+
+extensions = [
+    Extension("emoconnect_kernels", ["emoconnect_kernels.pyx"], extra_compile_args=extra_compile_args),
+    Extension("emoconnect_utils", ["emoconnect_utils.pyx"]),
+    Extension("newert_utils", ["newert_utils.pyx"]),
+    Extension("license_pro", ["license_pro.pyx"]),
+]
+
 setup(
-    ext_modules=cythonize("license_pro.pyx", compiler_directives={'language_level': "3"}),
+    ext_modules=cythonize(extensions, compiler_directives={'language_level': "3"}),
 )
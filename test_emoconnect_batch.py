@@ -0,0 +1,58 @@
+import csv
+
+import numpy as np
+
+from emoconnect_batch import RESULT_FIELDS, analyze_session, analyze_sessions
+from emoconnect_recorder import SessionRecorder
+from emoconnect_transport import EmulatedTransport, Recording
+
+
+def record(path, heart_rate, seconds=30, recording=None):
+    emulator = EmulatedTransport(heart_rate=heart_rate, battery_interval=5.0, seed=int(heart_rate), recording=recording)
+    with SessionRecorder(str(path)) as recorder:
+        for i, payload in enumerate(emulator.generate(seconds * 10)):
+            recorder.record(payload, timestamp=recorder.start_monotonic + i * 0.1)
+    return str(path)
+
+
+def systolic_recording(heart_rate, seconds=2):
+    """
+    중복맥파 없이 수축기 피크만 있는 맥파 기록 (seconds초 안에 박동이 정수 개면 반복 재생해도 연속)
+    에뮬레이터 기본 맥파는 피크 간격 백엔드가 중복맥파까지 박동으로 세므로 심박수 추종 확인에는 이 기록을 사용
+    """
+    t = np.arange(seconds * 50) / 50
+    phase = (t * heart_rate / 60.0) % 1.0
+    noise = np.random.default_rng(int(heart_rate)).normal(0.0, 20.0, len(t))
+    return Recording(30000 + 1500 * np.exp(-((phase - 0.3) / 0.12) ** 2) + noise)
+
+
+def test_analyze_session_is_deterministic_and_tracks_hr(tmp_path):
+    path = record(tmp_path / "a.emorec", heart_rate=90.0, recording=systolic_recording(90.0))
+    first = analyze_session(path, cal_hr_time=2)
+    second = analyze_session(path, cal_hr_time=2)
+
+    assert first['rows'] == second['rows']
+    assert first['windows'] >= 25
+    assert abs(first['rows'][-1][1] - 90.0) < 5.0
+    assert all(row[3] == 1 for row in first['rows'])  # 착용 상태
+
+
+def test_analyze_sessions_in_process_pool(tmp_path):
+    paths = [record(tmp_path / f"s{i}.emorec", heart_rate=60.0 + 10 * i, seconds=10 + i) for i in range(3)]
+    summaries, sessions_per_minute = analyze_sessions(paths, str(tmp_path / "out"), workers=2, cal_hr_time=2)
+
+    assert [summary['path'] for summary in summaries] == paths
+    assert sessions_per_minute > 0
+    with open(summaries[0]['output'], newline="") as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == RESULT_FIELDS
+    assert len(rows) - 1 == summaries[0]['windows']
+    assert analyze_session(paths[0], cal_hr_time=2)['windows'] == summaries[0]['windows']
+
+
+def test_analyze_session_with_spectral_estimator(tmp_path):
+    path = record(tmp_path / "s.emorec", heart_rate=80.0, seconds=40)
+    summary = analyze_session(path, cal_hr_time=2, estimator='spectral', window_size=400)
+
+    assert summary['analysis_cpu'] > 0
+    assert abs(summary['rows'][-1][1] - 80.0) < 5.0
@@ -0,0 +1,70 @@
+import numpy as np
+
+from emoconnect_pro import (FilterChain, MovingAverageFilter, WeightedMovingAverageFilter,
+                            normalize_to_minus_one_to_one)
+
+
+def legacy_sma(values, window_size):
+    window, out = [], []
+    for value in values:
+        window.append(value)
+        if len(window) > window_size:
+            window.pop(0)
+        out.append(np.mean(window))
+    return out
+
+
+def legacy_wma(values, window_size):
+    weights = np.arange(1, window_size + 1)
+    window, out = [], []
+    for value in values:
+        window.append(value)
+        if len(window) > window_size:
+            window.pop(0)
+        out.append(np.dot(window, weights[:len(window)]) / np.sum(weights[:len(window)]))
+    return out
+
+
+def test_scalar_filters_match_legacy():
+    values = np.random.default_rng(0).normal(0, 1, 500).tolist()
+    for window_size in (1, 5, 7, 9):
+        sma = MovingAverageFilter(window_size)
+        wma = WeightedMovingAverageFilter(window_size)
+        assert np.allclose([sma.filter(v) for v in values], legacy_sma(values, window_size), rtol=0, atol=1e-12)
+        assert np.allclose([wma.filter(v) for v in values], legacy_wma(values, window_size), rtol=0, atol=1e-12)
+
+
+def test_filter_block_is_identical_to_scalar_path():
+    rng = np.random.default_rng(1)
+    for filter_class in (MovingAverageFilter, WeightedMovingAverageFilter):
+        for window_size in (1, 2, 5, 7, 9):
+            scalar = filter_class(window_size)
+            block = filter_class(window_size)
+            for _ in range(30):
+                chunk = rng.normal(0, 1, int(rng.integers(0, 25)))
+                expected = [scalar.filter(v) for v in chunk]
+                # 비트 단위로 동일해야 함 (상태도 동일하게 이어짐)
+                assert block.filter_block(chunk).tolist() == expected
+            scalar.clear()
+            block.clear()
+            chunk = rng.normal(0, 1, 40)
+            assert block.filter_block(chunk).tolist() == [scalar.filter(v) for v in chunk]
+
+
+def test_filter_chain_matches_list_pipeline_across_calls():
+    rng = np.random.default_rng(2)
+    chain = FilterChain.ppg_display()
+    sma9, wma7, sma5 = MovingAverageFilter(9), WeightedMovingAverageFilter(7), MovingAverageFilter(5)
+    for _ in range(10):
+        window = rng.normal(0, 200, 100).tolist()
+        normalized = normalize_to_minus_one_to_one(window)
+        expected = [sma5.filter(c) for c in [wma7.filter(b) for b in [sma9.filter(a) for a in normalized[:50]]]]
+        assert chain.process(window, 50).tolist() == expected
+
+
+def test_filter_chain_without_normalize_and_constant_input():
+    chain = FilterChain(MovingAverageFilter(3), normalize=False, capacity=4)
+    assert chain.process([3.0, 6.0, 9.0, 12.0, 15.0]).tolist() == [3.0, 4.5, 6.0, 9.0, 12.0]
+    chain.clear()
+    assert chain.process(np.array([1.0, 1.0])).tolist() == [1.0, 1.0]
+    assert FilterChain.ppg_display().process([5.0] * 10).tolist() == [0.0] * 10
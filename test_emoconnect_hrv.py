@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+
+from emoconnect_hrv import RRIntervalStream
+from emoconnect_pro import BatchHeartRateAnalyzer, HeartRateAnalyzer
+
+
+def make_beat_stream(seed, seconds=120, mean_rr=0.8, rr_sd=0.04):
+    """
+    박동마다 RR 간격이 달라지는 합성 PPG (수축기 피크는 각 박동 주기의 20% 지점)
+    반환: (실제 피크 시각 배열 (초), [(ppg (50,), acc (50, 3)), ...])
+    """
+    rng = np.random.default_rng(seed)
+    rr = np.clip(rng.normal(mean_rr, rr_sd, int(seconds / mean_rr) + 5), 0.4, 1.4)
+    onsets = np.concatenate(([0.0], np.cumsum(rr)))
+    t = np.arange(seconds * 50) / 50
+    beat = np.searchsorted(onsets, t, side='right') - 1
+    phase = (t - onsets[beat]) / rr[beat]
+    pulse = np.exp(-((phase - 0.2) / 0.1) ** 2) + 0.15 * np.exp(-((phase - 0.55) / 0.1) ** 2)
+    ppg = 30000 + 1500 * pulse + 300 * np.sin(2 * np.pi * 0.25 * t) + rng.normal(0, 20, len(t))
+    acc = rng.normal(0, 0.05, (len(t), 3))
+    peaks = onsets[:-1] + 0.2 * rr
+    return peaks[peaks < seconds], [(ppg[i:i + 50], acc[i:i + 50]) for i in range(0, len(t), 50)]
+
+
+def reference_metrics(rr):
+    diffs = np.diff(rr)
+    return rr.mean(), rr.std(ddof=1), math.sqrt(np.mean(diffs ** 2)), np.mean(np.abs(diffs) > 50)
+
+
+def test_overlapping_windows_do_not_duplicate_beats():
+    stream = RRIntervalStream(edge_guard=0)
+    beats = np.arange(10, 1000, 40)  # 0.8초 간격
+    for start in range(0, 1000, 50):
+        # 2초 창마다 같은 박동이 1샘플씩 어긋나게 다시 검출됨
+        in_window = beats[(beats >= start - 50) & (beats < start + 50)]
+        stream.add_peaks((in_window + (start // 50) % 2).tolist())
+    metrics = stream.collect()
+    assert len(metrics.rr) == len(beats) - 1
+    assert np.all(np.abs(metrics.rr - 800) <= 20)
+    assert len(stream.collect().rr) == 0  # 이미 전달한 간격은 다시 나오지 않음
+
+
+def test_settled_until_defers_peaks_at_window_edge():
+    stream = RRIntervalStream()
+    stream.add_peaks([10, 50, 98], settled_until=95)
+    assert stream.collect().rr.tolist() == [800.0]
+    stream.add_peaks([50, 100, 140])  # 다음 창에서 실제 위치(100)로 다시 검출
+    assert stream.collect().rr.tolist() == [1000.0, 800.0]
+
+
+def test_streaming_metrics_match_reference_over_rolling_window():
+    rng = np.random.default_rng(5)
+    positions = np.cumsum(rng.integers(30, 55, 400))
+    stream = RRIntervalStream(window_seconds=30.0, resync_interval=7)
+    for start in range(0, len(positions), 3):
+        stream.add_peaks(positions[start:start + 3].tolist())
+        times = positions[1:start + 3] / 50
+        rr = np.diff(positions[:start + 3]) * 20.0
+        rr = rr[times > times[-1] - 30.0]
+        metrics = stream.collect()
+        assert metrics.count == len(rr)
+        if len(rr) >= 3:
+            expected = reference_metrics(rr)
+            assert np.allclose((metrics.mean_rr, metrics.sdnn, metrics.rmssd, metrics.pnn50), expected,
+                               rtol=1e-9, atol=1e-9)
+    assert np.array_equal(stream.rr_series()[1], rr)
+
+
+def test_out_of_range_interval_breaks_successive_differences():
+    stream = RRIntervalStream()
+    stream.add_peaks([0, 40, 80, 200, 240, 290])  # 120샘플(2.4초) 간격은 누락 박동
+    metrics = stream.collect()
+    assert metrics.rr.tolist() == [800.0, 800.0, 800.0, 1000.0]
+    # 연속 차이는 (800, 800)과 (800, 1000) 두 쌍만
+    assert metrics.rmssd == math.sqrt((0 + 200 ** 2) / 2)
+    assert metrics.pnn50 == 0.5
+    stream.reset()
+    empty = stream.collect()
+    assert empty.count == 0 and math.isnan(empty.sdnn) and math.isnan(empty.rmssd)
+
+
+def test_analyzer_streams_rr_intervals_without_extra_peak_detection():
+    peaks, chunks = make_beat_stream(1)
+    for hop_size in (50, 10):
+        analyzer = HeartRateAnalyzer(cal_hr_time=2, hop_size=hop_size, hrv=RRIntervalStream())
+        rr, times = [], []
+        for ppg, acc in chunks:
+            for start in range(0, 50, hop_size):
+                result = analyzer.update(ppg[start:start + hop_size], acc[start:start + hop_size])
+                assert (result.hrv is not None) == result.updated
+                if result.hrv is not None:
+                    rr.extend(result.hrv.rr.tolist())
+                    times.extend(result.hrv.rr_time.tolist())
+                    metrics = result.hrv
+        # 안정화 이후의 모든 박동이 한 번씩: 각 간격 끝의 피크가 실제 피크와 샘플 양자화(20ms) 수준으로 일치
+        nearest = np.abs(np.array(times)[:, None] - peaks[None, :]).argmin(axis=1)
+        assert np.all(np.diff(nearest) == 1)
+        assert len(rr) >= len(peaks[peaks > times[0]]) - 1
+        truth = np.diff(peaks[nearest[0] - 1:nearest[-1] + 1]) * 1000
+        assert np.mean(np.abs(np.array(rr) - truth)) < 12.0
+        window = np.diff(peaks[peaks > times[-1] - 60.0]) * 1000
+        expected = reference_metrics(window)
+        assert abs(metrics.mean_rr - expected[0]) < 5.0
+        assert abs(metrics.sdnn - expected[1]) < 5.0
+        assert abs(metrics.rmssd - expected[2]) < 10.0
+
+
+def test_batch_analyzer_streams_same_rr_intervals_and_not_worn_resets():
+    streams = [make_beat_stream(seed, seconds=40)[1] for seed in range(3)]
+    for second in range(20, 23):
+        streams[1][second] = (np.zeros(50), streams[1][second][1])
+    single = [HeartRateAnalyzer(cal_hr_time=2, hrv=RRIntervalStream()) for _ in streams]
+    batched = [HeartRateAnalyzer(cal_hr_time=2, hrv=RRIntervalStream()) for _ in streams]
+    batch = BatchHeartRateAnalyzer()
+    for second in range(40):
+        chunks = [stream[second] for stream in streams]
+        results = batch.update(batched, [c[0] for c in chunks], [c[1] for c in chunks])
+        for analyzer, chunk, result in zip(single, chunks, results):
+            expected = analyzer.update(*chunk)
+            assert np.array_equal(result.hrv.rr, expected.hrv.rr)
+            assert result.hrv[2:] == expected.hrv[2:] or np.isnan(expected.hrv.rmssd)
+        if second == 21:
+            assert results[1].hrv.count == 0 and not results[1].is_wearing
+    assert all(len(analyzer.hrv) > 10 for analyzer in batched)
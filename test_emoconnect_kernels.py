@@ -0,0 +1,136 @@
+import importlib.util
+import os
+import struct
+
+import numpy as np
+import pytest
+
+import emoconnect_kernels
+from emoconnect_pro import DetrendEngine
+from test_emoconnect_pro import legacy_find_peaks
+from test_emoconnect_filters import legacy_sma, legacy_wma
+
+
+def load_python_kernels():
+    """컴파일된 확장 모듈이 있어도 순수 Python 구현(emoconnect_kernels.py)을 직접 로드합니다."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "emoconnect_kernels.py")
+    spec = importlib.util.spec_from_file_location("emoconnect_kernels_python", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+PYTHON = load_python_kernels()
+# 빌드된 확장 모듈이 있으면 두 구현을 모두 검사
+IMPLEMENTATIONS = [PYTHON] + ([emoconnect_kernels] if emoconnect_kernels.COMPILED else [])
+ids = ["compiled" if module.COMPILED else "python" for module in IMPLEMENTATIONS]
+
+
+@pytest.fixture(params=IMPLEMENTATIONS, ids=ids)
+def kernels(request):
+    return request.param
+
+
+def test_float16_decodes_every_bit_pattern(kernels):
+    bits = np.arange(65536, dtype=np.uint16)
+    expected = bits.view(np.float16).astype(np.float32)
+    assert np.array_equal(kernels.decode_float16(bits).view(np.uint32), expected.view(np.uint32))
+    for value in (0x0000, 0x0001, 0x03FF, 0x3C00, 0x7BFF, 0x7C00, 0xC000, 0xFC00):
+        assert struct.pack('<f', kernels.float16_to_float32(value)) == expected[value].tobytes()
+
+
+def test_parse_frames_matches_struct_layout(kernels):
+    rng = np.random.default_rng(0)
+    values = [(int(rng.integers(0, 65536)), *rng.uniform(-100, 100, 9)) for _ in range(7)]
+    data = b"".join(struct.pack('<H9e', *frame) for frame in values) + b"\x01\x02"
+    ppg, imu = kernels.parse_frames(data, 7)
+    assert ppg.dtype == np.uint16 and imu.dtype == np.float32 and imu.shape == (7, 9)
+    assert ppg.tolist() == [frame[0] for frame in values]
+    assert np.array_equal(imu, np.array([frame[1:] for frame in values], dtype=np.float16).astype(np.float32))
+    ppg, imu = kernels.parse_frames(bytearray(data), 0)
+    assert ppg.shape == (0,) and imu.shape == (0, 9)
+
+
+def test_find_peaks_matches_legacy(kernels):
+    rng = np.random.default_rng(4321)
+    for _ in range(1000):
+        size = int(rng.integers(0, 120))
+        if rng.random() < 0.5:
+            data = rng.integers(-5, 6, size).astype(float)
+            height = int(rng.integers(-6, 4))
+        else:
+            data = rng.normal(0, 1, size)
+            height = float(rng.normal(0, 0.5))
+        distance = [0, 1, 2, 3, 5, 12, 2.5][int(rng.integers(0, 7))]
+        max_num = int(rng.integers(0, 20))
+        assert kernels.find_peaks(data, height, distance, max_num) == \
+            legacy_find_peaks(data.tolist(), height, distance, max_num)
+
+
+def test_detrend_kernels_match_operator_product(kernels):
+    matrix = np.random.default_rng(1).normal(30000, 1000, (9, 100))
+    for order in (2, 7, 25):
+        operator = DetrendEngine.operator(100, order)
+        rows = kernels.detrend_rows(operator, matrix)
+        assert np.allclose(rows, matrix @ operator.T, rtol=0, atol=1e-8)
+        assert all(np.array_equal(rows[i], kernels.detrend(operator, matrix[i])) for i in range(len(matrix)))
+
+
+def test_moving_average_kernels_match_legacy(kernels):
+    values = np.random.default_rng(2).normal(0, 1, 80)
+    for window_size in (1, 5, 9):
+        for chunk in (1, 3, 80):
+            ring, state = np.zeros(window_size), (0, 0, 0.0)
+            wring, wstate = np.zeros(window_size), (0, 0, 0.0, 0.0)
+            sma, wma = [], []
+            for start in range(0, len(values), chunk):
+                block = values[start:start + chunk].copy()
+                out = np.empty(len(block))
+                state = kernels.sma_block(ring, *state, block, out)
+                sma.extend(out.tolist())
+                wstate = kernels.wma_block(wring, *wstate, block, block)  # 제자리 갱신
+                wma.extend(block.tolist())
+            assert np.allclose(sma, legacy_sma(values.tolist(), window_size), rtol=0, atol=1e-12)
+            assert np.allclose(wma, legacy_wma(values.tolist(), window_size), rtol=0, atol=1e-12)
+
+
+@pytest.mark.skipif(not emoconnect_kernels.COMPILED, reason="compiled extension not built (python setup.py build_ext)")
+def test_compiled_kernels_match_python_fallback():
+    rng = np.random.default_rng(3)
+    values = rng.normal(0, 1, 500)
+    assert emoconnect_kernels.find_peaks(values, 0.0, 12, 0) == PYTHON.find_peaks(values, 0.0, 12, 0)
+    for name, state in (('sma_block', (0, 0, 0.0)), ('wma_block', (0, 0, 0.0, 0.0))):
+        compiled, python = np.empty(500), np.empty(500)
+        ring_c, ring_p = np.zeros(7), np.zeros(7)
+        state_c = getattr(emoconnect_kernels, name)(ring_c, *state, values, compiled)
+        state_p = getattr(PYTHON, name)(ring_p, *state, values, python)
+        # 순차 누적과 cumsum 구현이 비트 단위로 같음
+        assert np.array_equal(compiled, python) and state_c[2:] == state_p[2:]
+        assert np.array_equal(np.roll(ring_c, -state_c[0]), np.roll(ring_p, -state_p[0]))
+
+
+def test_display_chain_matches_block_kernels(kernels):
+    rng = np.random.default_rng(4)
+    values = 30000 + 1500 * np.sin(np.arange(120) * 0.2) + rng.normal(0, 20, 120)
+    for normalize in (False, True):
+        rings = [np.zeros(5), np.zeros(4), np.zeros(5)]
+        states = [(0, 0, 0.0), (0, 0, 0.0, 0.0), (0, 0, 0.0)]
+        expected_rings = [ring.copy() for ring in rings]
+        expected_states = list(states)
+        for start, total, size in ((0, 60, 50), (50, 70, 20), (70, 120, 50)):
+            window = values[start:total]
+            out = window.copy()
+            states = kernels.display_chain(window, size, normalize, rings[0], states[0],
+                                           rings[1], states[1], rings[2], states[2], out)
+            expected = window[:size].copy()
+            if normalize:
+                expected = (2 * (expected - window.min()) / (window.max() - window.min())) - 1
+            expected_states[0] = kernels.sma_block(expected_rings[0], *expected_states[0], expected, expected)
+            expected_states[1] = kernels.wma_block(expected_rings[1], *expected_states[1], expected, expected)
+            expected_states[2] = kernels.sma_block(expected_rings[2], *expected_states[2], expected, expected)
+            assert np.array_equal(out[:size], expected)
+            assert list(states) == expected_states
+    out = np.full(3, 7.0)
+    kernels.display_chain(np.full(3, 2.0), 3, True, np.zeros(2), (0, 0, 0.0),
+                          np.zeros(2), (0, 0, 0.0, 0.0), np.zeros(2), (0, 0, 0.0), out)
+    assert np.all(out == 0.0)  # 값이 모두 같으면 0으로 정규화
@@ -0,0 +1,77 @@
+import asyncio
+import math
+
+import numpy as np
+
+import emoconnect_pro as ep
+from emoconnect_manager import SessionManager
+from test_emoconnect_session import FakeAnalyzer, FakeTransport, make_frame
+
+
+def test_manager_isolates_devices_and_schedules_earliest_first():
+    async def run():
+        results = []
+        manager = SessionManager(analyzer_factory=FakeAnalyzer, transport_factory=lambda address: FakeTransport(),
+                                 on_result=lambda session, result: results.append((session.address, result)))
+        for address in ("A", "B", "C"):
+            manager.add_device(address)
+        errors = await manager.connect_all()
+        return manager, results, errors
+
+    manager, results, errors = asyncio.run(run())
+    assert errors == {"A": None, "B": None, "C": None}
+    a, b, c = (manager.sessions[address] for address in ("A", "B", "C"))
+    assert a.hr_analyzer is not b.hr_analyzer
+    assert a.stream is not b.stream
+
+    for i in range(20):
+        a.notification_handler(None, make_frame(100))
+        b.notification_handler(None, make_frame(200))
+    # 수동 처리 모드에서는 알림 수신만으로 처리가 일어나지 않음
+    assert results == []
+
+    a.last_timestamp, b.last_timestamp, c.last_timestamp = 10.0, 5.0, 20.0
+    assert manager.due_sessions(11.5) == [b, a]
+
+    for session in manager.due_sessions(11.5):
+        manager.process_session(session)
+    assert [address for address, _ in results] == ["B", "A"]
+    assert results[0][1]['ppg'][0] == 200.0 and results[1][1]['ppg'][0] == 100.0
+    assert manager.stats["A"]['processed'] == 1 and manager.stats["C"]['processed'] == 0
+    assert len(b.hr_analyzer.calls) == 1 and len(c.hr_analyzer.calls) == 0
+
+
+def test_manager_batch_analysis_matches_per_session_processing():
+    async def run(batch_analyzer):
+        results = []
+        manager = SessionManager(analyzer_factory=lambda: ep.HeartRateAnalyzer(cal_hr_time=1),
+                                 transport_factory=lambda address: FakeTransport(), batch_analyzer=batch_analyzer,
+                                 on_result=lambda session, result: results.append((session.address, result)))
+        for address in ("A", "B", "C"):
+            manager.add_device(address).resampler = None  # 수신 시각과 무관하게 비교 (timebase='count')
+        manager.sessions["C"].hr_analyzer = FakeAnalyzer()  # 일괄 처리를 지원하지 않는 분석기
+        await manager.connect_all()
+        sessions = list(manager.sessions.values())
+        for second in range(6):
+            for offset, session in enumerate(sessions):
+                for i in range(50):
+                    value = 30000 + 1500 * math.sin(2 * math.pi * (1.2 + 0.3 * offset) * (second + i / 50))
+                    session.notification_handler(None, make_frame(int(value)))
+                session.last_timestamp = 0.0
+            if batch_analyzer is None:
+                for session in manager.due_sessions(10.0):
+                    manager.process_session(session)
+            else:
+                manager.process_batch(manager.due_sessions(10.0))
+        return manager, results
+
+    _, expected = asyncio.run(run(None))
+    manager, results = asyncio.run(run(ep.BatchHeartRateAnalyzer()))
+    assert [address for address, _ in results] == [address for address, _ in expected]
+    for (_, result), (_, reference) in zip(results, expected):
+        assert result['hr'] == reference['hr']
+        assert np.array_equal(result['ppg'], reference['ppg'])
+        assert np.array_equal(np.asarray(result['filtered_ppg']), np.asarray(reference['filtered_ppg']))
+    assert results[-3][1]['hr'] > 0 and results[-1][1]['hr'] == 72.0
+    assert len(manager.sessions["C"].hr_analyzer.calls) == 6
+    assert all(stats['processed'] == 6 for stats in manager.stats.values())
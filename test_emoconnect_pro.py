@@ -0,0 +1,432 @@
+import numpy as np
+import pytest
+
+from emoconnect_pro import (BatchHeartRateAnalyzer, DetrendEngine, FilterChain, HeartRateAnalyzer, HeartRateEstimator,
+                            HeartRateResult, PeakDetector, PeakIntervalEstimator, PolynomialDetrendProcessor,
+                            SpectralEstimator)
+from emoconnect_utils import MotionNoiseEstimator
+
+
+def legacy_detrend(ppg_array, window_size, order):
+    """기존 PolynomialDetrendProcessor.process 구현 (정규방정식 + 거듭제곱 기저)"""
+    x_values = np.array([i + 1 for i in range(window_size)], dtype=float)
+    y_values = np.array(ppg_array[:window_size], dtype=float)
+    X = np.vander(x_values, N=order + 1, increasing=True)
+    coefficients = np.linalg.solve(np.dot(X.T, X), np.dot(X.T, y_values))
+    detrended = []
+    for i in range(window_size):
+        trend = sum(coefficients[j] * (x_values[i] ** j) for j in range(order + 1))
+        detrended.append(round(y_values[i] - trend, 4))
+    return detrended
+
+
+def legacy_find_peaks(data, height=50, distance=1, max_num=10):
+    """기존 PeakDetector.find_peaks 구현 (후보 루프 + O(k²) 거리 검사)"""
+    candidate_indices = []
+    for i in range(1, len(data) - 1):
+        if data[i] > data[i - 1] and data[i] > data[i + 1]:
+            candidate_indices.append(i)
+    candidate_indices = [idx for idx in candidate_indices if data[idx] > height]
+    candidate_indices.sort(key=lambda idx: data[idx], reverse=True)
+    peak_indices = []
+    for idx in candidate_indices:
+        if all(abs(idx - existing) >= distance for existing in peak_indices):
+            peak_indices.append(idx)
+            if len(peak_indices) == max_num:
+                break
+    return sorted(peak_indices)
+
+
+class LegacyHeartRateAnalyzer:
+    """기존 리스트 기반 HeartRateAnalyzer.update_hr 구현 (ppg_array 리스트 확장 + 앞 100샘플 분석)"""
+    def __init__(self, cal_hr_time=5, threshold1=5.0, threshold2=10.0, threshold3=15.0):
+        self.ppg_array = [0.0] * 50
+        self.check_hr_count = 0
+        self.is_fitting = False
+        self.is_wearing = True
+        self.is_moving_noise = False
+        self.result_hr = 0.0
+        self.peak_bpm_values = []
+        self.cal_hr_time = cal_hr_time
+        self.threshold1, self.threshold2, self.threshold3 = threshold1, threshold2, threshold3
+        self.filter_chain = FilterChain.ppg_display()
+        self.motion_estimator = MotionNoiseEstimator(window_size=50)
+
+    def peak_intervals(self, order, min_interval):
+        detrend_value = PolynomialDetrendProcessor(self.ppg_array, 100, 10, order).process()
+        mean_val = np.mean(detrend_value)
+        threshold_height = mean_val + 0.5 * np.sqrt(np.mean((np.array(detrend_value) - mean_val) ** 2))
+        peak_indices = legacy_find_peaks(detrend_value, height=threshold_height, distance=12, max_num=8)
+        intervals = []
+        for i in range(1, len(peak_indices)):
+            time_diff = (peak_indices[i] - peak_indices[i - 1]) * 0.02
+            if min_interval < time_diff < 1.5:
+                intervals.append(time_diff)
+        return detrend_value, intervals
+
+    def update_hr(self, interpolated_ppg, interpolated_acc):
+        self.ppg_array.extend(interpolated_ppg)
+        if len(self.ppg_array) < 100:
+            return self.result_hr, []
+        if self.check_hr_count < self.cal_hr_time:
+            self.is_fitting = False
+            if not self.is_moving_noise:
+                self.check_hr_count += 1
+        detrend_value = PolynomialDetrendProcessor(self.ppg_array, 100, 10, 2).process()
+        if sum(self.ppg_array) == 0:
+            self.is_wearing = False
+            self.check_hr_count = 0
+            self.result_hr = 0.0
+            self.peak_bpm_values.clear()
+            return self.result_hr, detrend_value
+        self.is_wearing = True
+        noise = self.motion_estimator.update(interpolated_acc) if len(interpolated_acc) > 0 else 0
+        self.is_moving_noise = noise > 5
+        filtered_ppg_data = []
+        if self.check_hr_count >= self.cal_hr_time:
+            self.is_fitting = True
+            detrend_value, intervals = self.peak_intervals(2, 0.20)
+            if self.threshold1 <= noise < self.threshold2:
+                detrend_value, intervals = self.peak_intervals(5, 0.25)
+            elif noise >= self.threshold2:
+                order = 25 if noise >= self.threshold3 and self.result_hr >= 140 else 7
+                detrend_value, intervals = self.peak_intervals(order, 0.25)
+            if len(self.peak_bpm_values) > 15:
+                self.peak_bpm_values.pop(0)
+            if intervals:
+                self.peak_bpm_values.append(60 / np.mean(intervals))
+                self.result_hr = np.mean(self.peak_bpm_values)
+            filtered_ppg_data = self.filter_chain.process(detrend_value, 50).tolist()
+        self.ppg_array = self.ppg_array[-50:]
+        return self.result_hr, filtered_ppg_data
+
+
+def make_stream(seed, seconds=40):
+    """
+    1초(50샘플) 단위 PPG/가속도 스트림: 심박수와 움직임 세기를 구간마다 바꿔 노이즈 분기(차수 2/5/7/25)를 모두 지나게 함
+    반환: [(ppg (50,), acc (50, 3)), ...]
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(seconds * 50) / 50
+    bpm = np.where(t < seconds / 2, 75.0, 160.0)
+    ppg = 30000 + 1500 * np.sin(2 * np.pi * np.cumsum(bpm / 60) / 50) + 200 * np.sin(0.3 * t) + rng.normal(0, 30, len(t))
+    motion = np.repeat(rng.choice([0.5, 3.0, 6.0, 12.0], seconds), 50)
+    acc = rng.normal(0, 1, (len(t), 3)) * motion[:, None]
+    return [(ppg[i:i + 50], acc[i:i + 50]) for i in range(0, len(t), 50)]
+
+
+def make_ppg(seed, size=100):
+    rng = np.random.default_rng(seed)
+    t = np.arange(size) / 50
+    return (30000 + 1500 * np.sin(2 * np.pi * rng.uniform(1, 2) * t) + 300 * t ** 2
+            + rng.normal(0, 30, size)).tolist()
+
+
+def test_detrend_matches_legacy_for_low_orders():
+    for seed in range(20):
+        ppg = make_ppg(seed)
+        for order, tolerance in ((2, 2e-4), (5, 2e-4), (7, 2e-3)):
+            new = PolynomialDetrendProcessor(ppg, 100, 10, order).process()
+            assert np.max(np.abs(np.array(new) - legacy_detrend(ppg, 100, order))) < tolerance
+
+
+def test_detrend_order_25_matches_least_squares():
+    # 기존 구현은 x = 1..100 거듭제곱 기저로 차수 25에서 수치적으로 불안정하므로 lstsq 기준과 비교
+    x = np.arange(1, 101)
+    for seed in range(5):
+        ppg = make_ppg(seed)
+        reference = ppg - np.polynomial.Polynomial.fit(x, ppg, 25)(x)
+        assert np.max(np.abs(DetrendEngine.detrend(ppg, 25) - reference)) < 1e-5
+
+
+def test_detrend_operator_is_cached_and_removes_polynomials():
+    assert DetrendEngine.operator(100, 5) is DetrendEngine.operator(100, 5)
+    x = np.arange(1, 101, dtype=float)
+    polynomial = 3.0 + 0.5 * x - 0.01 * x ** 2 + 1e-5 * x ** 5
+    assert np.max(np.abs(DetrendEngine.detrend(polynomial, 5))) < 1e-6
+    # 앞 window_size개만 사용
+    assert len(DetrendEngine.detrend(make_ppg(0, 150), 2, 100)) == 100
+
+
+def test_find_peaks_matches_legacy_on_random_inputs():
+    rng = np.random.default_rng(1234)
+    for _ in range(2000):
+        size = int(rng.integers(0, 120))
+        if rng.random() < 0.5:
+            # 정수 값: 같은 높이의 피크와 평탄 구간(plateau)이 자주 생김
+            data = rng.integers(-5, 6, size).tolist()
+            height = int(rng.integers(-6, 4))
+        else:
+            data = rng.normal(0, 1, size).tolist()
+            height = float(rng.normal(0, 0.5))
+        distance = [0, 1, 2, 3, 5, 12, 2.5][int(rng.integers(0, 7))]
+        max_num = int(rng.integers(0, 20))
+        expected = legacy_find_peaks(data, height, distance, max_num)
+        assert PeakDetector.find_peaks(data, height, distance, max_num) == expected
+        assert PeakDetector.find_peaks(np.array(data, dtype=float), height, distance, max_num) == expected
+
+
+def test_find_peaks_defaults_and_short_input():
+    data = [0, 60, 0, 70, 0, 40, 0]
+    assert PeakDetector.find_peaks(data) == legacy_find_peaks(data) == [1, 3]
+    assert PeakDetector.find_peaks(data, height=0, distance=3) == [3]
+    assert PeakDetector.find_peaks([1, 2]) == []
+
+
+def test_update_hr_matches_legacy_list_implementation():
+    # 짧은 안정화 시간이면 노이즈 구간별 차수(2/5/7/25) 분기를 모두 지남
+    for seed, cal_hr_time in [(seed, 5) for seed in range(4)] + [(seed, 2) for seed in range(4, 8)]:
+        analyzer, legacy = HeartRateAnalyzer(cal_hr_time), LegacyHeartRateAnalyzer(cal_hr_time)
+        for ppg, acc in make_stream(seed):
+            hr, filtered = analyzer.update_hr(ppg.tolist(), acc.tolist())
+            expected_hr, expected_filtered = legacy.update_hr(ppg.tolist(), acc.tolist())
+            assert hr == expected_hr
+            assert filtered == expected_filtered
+            assert analyzer.check_hr_count == legacy.check_hr_count
+            assert analyzer.is_moving_noise == legacy.is_moving_noise
+        assert analyzer.ppg_array[-50:] == legacy.ppg_array
+
+
+def test_each_analysis_detrends_once_at_noise_selected_order(monkeypatch):
+    import emoconnect_pro
+
+    operators = {id(DetrendEngine.operator(100, order)): order for order in (2, 5, 7, 25)}
+    calls = []
+    detrend = emoconnect_pro.ek.detrend
+
+    def counting_detrend(operator, values):
+        calls.append(operators[id(operator)])
+        return detrend(operator, values)
+
+    monkeypatch.setattr(emoconnect_pro.ek, "detrend", counting_detrend)
+    orders = set()
+    for seed in range(4):
+        analyzer = HeartRateAnalyzer(cal_hr_time=2)
+        for ppg, acc in make_stream(seed):
+            calls.clear()
+            result = analyzer.update(ppg, acc)
+            # 안정화 중이면 추세 제거 없음, 분석하면 노이즈로 정한 차수 하나만
+            assert len(calls) == (1 if result.is_fitting else 0)
+            orders.update(calls)
+    assert orders == {2, 5, 7, 25}
+
+
+def test_update_takes_arrays_and_returns_typed_result():
+    analyzer = HeartRateAnalyzer(cal_hr_time=1)
+    results = [analyzer.update(ppg, acc) for ppg, acc in make_stream(7, seconds=6)]
+    assert all(isinstance(result, HeartRateResult) and result.updated for result in results)
+    assert all(result.is_wearing for result in results)
+    last = results[-1]
+    assert last.is_fitting and last.hr == analyzer.result_hr > 0
+    assert last.filtered_ppg.dtype == np.float64 and last.filtered_ppg.shape == (50,)
+    assert last.noise == analyzer.global_noise_threshold
+    # 결과 배열은 분석기 내부 버퍼와 공유하지 않음
+    analyzer.update(*make_stream(8, seconds=1)[0])
+    assert np.array_equal(last.filtered_ppg, results[-1].filtered_ppg)
+
+
+def test_update_is_independent_of_chunk_size():
+    whole, halves = HeartRateAnalyzer(), HeartRateAnalyzer()
+    for ppg, acc in make_stream(3, seconds=12):
+        expected = whole.update(ppg, acc)
+        assert halves.update(ppg[:25], acc[:25]).updated is False
+        result = halves.update(ppg[25:], acc[25:])
+        assert result.hr == expected.hr and result.noise == expected.noise
+        assert np.array_equal(result.filtered_ppg, expected.filtered_ppg)
+
+
+def test_update_not_worn_resets_and_returns_detrended_window():
+    analyzer = HeartRateAnalyzer(cal_hr_time=1)
+    for ppg, acc in make_stream(5, seconds=4):
+        analyzer.update(ppg, acc)
+    assert analyzer.result_hr > 0
+    zeros = np.zeros(50)
+    analyzer.update(zeros, np.zeros((50, 3)))
+    result = analyzer.update(zeros, np.zeros((50, 3)))
+    assert not result.is_wearing and result.hr == 0.0 and analyzer.check_hr_count == 0
+    assert result.filtered_ppg.shape == (100,) and not result.filtered_ppg.any()
+    # 다시 착용하면 최신 100샘플로 분석 재개
+    result = analyzer.update(*make_stream(6, seconds=1)[0])
+    assert result.is_wearing and result.updated
+
+
+def test_detrend_rows_matches_detrend_bitwise():
+    matrix = np.array([make_ppg(seed) for seed in range(37)])
+    for order in (2, 5, 7, 25):
+        rows = DetrendEngine.detrend_rows(matrix, order)
+        assert all(np.array_equal(rows[i], DetrendEngine.detrend(matrix[i], order)) for i in range(len(matrix)))
+
+
+def test_batch_analyzer_matches_per_device_analyzers():
+    devices = 24
+    streams = [make_stream(seed, seconds=30) for seed in range(devices)]
+    # 일부 장치는 중간에 미착용(0), 일부는 가속도 없음
+    for second in range(8, 11):
+        ppg, acc = streams[3][second]
+        streams[3][second] = (np.zeros_like(ppg), acc)
+    for second in range(30):
+        ppg, _ = streams[5][second]
+        streams[5][second] = (ppg, np.empty((0, 3)))
+    single = [HeartRateAnalyzer(cal_hr_time=1 + seed % 5) for seed in range(devices)]
+    batched = [HeartRateAnalyzer(cal_hr_time=1 + seed % 5) for seed in range(devices)]
+    batch = BatchHeartRateAnalyzer(capacity=4)
+    for second in range(30):
+        # 홀수 번째 장치는 반 초씩 나누어 전달 (분석 시점이 장치마다 다름)
+        for part in (slice(0, 25), slice(25, 50)):
+            indices = [i for i in range(devices) if i % 2 or part.start == 25]
+            chunks = [streams[i][second] if i % 2 == 0 else (streams[i][second][0][part], streams[i][second][1][part])
+                      for i in indices]
+            results = batch.update([batched[i] for i in indices], [c[0] for c in chunks], [c[1] for c in chunks])
+            for i, chunk, result in zip(indices, chunks, results):
+                expected = single[i].update(*chunk)
+                assert result.hr == expected.hr
+                assert np.array_equal(result.filtered_ppg, expected.filtered_ppg)
+                assert result[2:] == expected[2:]
+    assert all(a.peak_bpm_values == b.peak_bpm_values for a, b in zip(single, batched))
+    assert any(a.result_hr >= 140 for a in batched)
+
+
+def test_batch_analyzer_accepts_only_heart_rate_analyzers():
+    assert BatchHeartRateAnalyzer.accepts(HeartRateAnalyzer())
+    assert not BatchHeartRateAnalyzer.accepts(object())
+    assert BatchHeartRateAnalyzer().update([], [], []) == []
+
+
+def test_batch_analyzer_runs_rejected_analyzers_alone_and_keeps_peak_indices():
+    streams = [make_stream(seed, seconds=12) for seed in range(3)]
+    kwargs = [dict(), dict(estimator=SpectralEstimator()), dict()]
+    single = [HeartRateAnalyzer(cal_hr_time=2, **kw) for kw in kwargs]
+    batched = [HeartRateAnalyzer(cal_hr_time=2, **kw) for kw in kwargs]
+    batch = BatchHeartRateAnalyzer()
+    for second in range(12):
+        chunks = [stream[second] for stream in streams]
+        results = batch.update(batched, [c[0] for c in chunks], [c[1] for c in chunks])
+        for analyzer, batched_analyzer, chunk, result in zip(single, batched, chunks, results):
+            expected = analyzer.update(*chunk)
+            # 스펙트럼 백엔드 분석기도 피크 경로가 아닌 자신의 update()로 처리되어 결과가 같음
+            assert result.hr == expected.hr and np.array_equal(result.filtered_ppg, expected.filtered_ppg)
+            assert np.array_equal(batched_analyzer.estimator.peak_indices, analyzer.estimator.peak_indices)
+    assert all(result.hr > 0 for result in results)
+    assert len(batched[0].estimator.peak_indices) > 0
+
+
+def test_sliding_window_updates_every_hop():
+    stream = [(ppg, acc * 0.05) for ppg, acc in make_stream(7, seconds=20)]  # 움직임 없는 상태
+    analyzer = HeartRateAnalyzer(cal_hr_time=2, hop_size=10)
+    assert analyzer.calibration_cycles == 10
+    updates = []
+    for ppg, acc in stream:
+        for start in range(0, 50, 5):
+            result = analyzer.update(ppg[start:start + 5], acc[start:start + 5])
+            updates.append(result.updated)
+            if result.updated and result.is_fitting:
+                assert len(result.filtered_ppg) == 10
+    # 첫 분석은 창의 절반(50샘플)이 들어온 뒤, 이후 10샘플마다
+    assert updates.index(True) == 9
+    assert all(updates[i] == ((i + 1) % 2 == 0) for i in range(9, len(updates)))
+    assert analyzer.peak_bpm_values and 60 <= analyzer.result_hr <= 180
+
+
+def test_bpm_history_covers_the_same_time_for_every_hop():
+    stream = [(ppg, acc * 0.05) for ppg, acc in make_stream(9, seconds=30)]
+    analyzer = HeartRateAnalyzer(cal_hr_time=2, hop_size=10)
+    assert HeartRateAnalyzer().bpm_history == 16 and analyzer.bpm_history == 80  # 약 16초
+    for ppg, acc in stream:
+        for start in range(0, 50, 10):
+            analyzer.update(ppg[start:start + 10], acc[start:start + 10])
+    assert 16 < len(analyzer.peak_bpm_values) <= 80
+    assert 60 <= analyzer.result_hr <= 180
+
+def test_default_window_and_hop_match_explicit_parameters():
+    stream = make_stream(8, seconds=12)
+    default, explicit = HeartRateAnalyzer(cal_hr_time=2), HeartRateAnalyzer(cal_hr_time=2, window_size=100, hop_size=50)
+    for ppg, acc in stream:
+        a, b = default.update(ppg, acc), explicit.update(ppg, acc)
+        assert a.hr == b.hr and np.array_equal(a.filtered_ppg, b.filtered_ppg)
+
+
+def test_batch_analyzer_groups_mixed_window_sizes():
+    configs = [dict(window_size=100, hop_size=50), dict(window_size=150, hop_size=25), dict(window_size=100, hop_size=10)]
+    streams = [make_stream(seed, seconds=16) for seed in range(6)]
+    single = [HeartRateAnalyzer(cal_hr_time=2, **configs[i % 3]) for i in range(6)]
+    batched = [HeartRateAnalyzer(cal_hr_time=2, **configs[i % 3]) for i in range(6)]
+    batch = BatchHeartRateAnalyzer(capacity=1)
+    for second in range(16):
+        for start in range(0, 50, 10):
+            chunks = [(stream[second][0][start:start + 10], stream[second][1][start:start + 10]) for stream in streams]
+            results = batch.update(batched, [c[0] for c in chunks], [c[1] for c in chunks])
+            for analyzer, chunk, result in zip(single, chunks, results):
+                expected = analyzer.update(*chunk)
+                assert result.hr == expected.hr
+                assert np.array_equal(result.filtered_ppg, expected.filtered_ppg)
+                assert result[2:] == expected[2:]
+    assert all(a.peak_bpm_values == b.peak_bpm_values for a, b in zip(single, batched))
+
+
+def test_invalid_window_and_hop_are_rejected():
+    for kwargs in (dict(window_size=20), dict(hop_size=0), dict(window_size=100, hop_size=101)):
+        with pytest.raises(ValueError):
+            HeartRateAnalyzer(**kwargs)
+
+
+def make_motion_stream(seed, heart_rate=130.0, cadence=1.8, artifact=2500.0, seconds=50, motion_start=15):
+    """motion_start초부터 cadence(Hz) 주기의 움직임 잡음이 PPG와 가속도에 함께 들어가는 1초 단위 스트림"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(seconds * 50) / 50
+    moving = t >= motion_start
+    swing = np.sin(2 * np.pi * cadence * t) * moving
+    ppg = 30000 + 1500 * np.sin(2 * np.pi * heart_rate / 60 * t) + artifact * swing + rng.normal(0, 30, len(t))
+    acc = rng.normal(0, 1, (len(t), 3)) * np.where(moving, 1.0, 0.05)[:, None]
+    acc[:, 0] += 6.0 * swing
+    return [(ppg[i:i + 50], acc[i:i + 50]) for i in range(0, len(t), 50)]
+
+
+def test_default_estimator_is_peak_interval():
+    analyzer = HeartRateAnalyzer()
+    assert type(analyzer.estimator) is PeakIntervalEstimator
+    assert BatchHeartRateAnalyzer.accepts(analyzer)
+    assert not BatchHeartRateAnalyzer.accepts(HeartRateAnalyzer(estimator=SpectralEstimator()))
+
+
+def test_estimator_without_estimate_fails_at_construction():
+    class NoEstimate(HeartRateEstimator):
+        def observe(self, acc):
+            pass
+
+    with pytest.raises(TypeError):
+        NoEstimate()
+
+
+def test_spectral_estimator_caches_windows_and_bands():
+    assert SpectralEstimator.hann(200) is SpectralEstimator.hann(200)
+    assert not SpectralEstimator.hann(200).flags.writeable
+    band = SpectralEstimator.band(1024, 50, 40.0, 220.0)
+    assert band is SpectralEstimator.band(1024, 50, 40.0, 220.0)
+    resolution = 50 / 1024
+    assert (band.start - 1) * resolution * 60 < 40 <= band.start * resolution * 60
+    assert (band.stop - 1) * resolution * 60 <= 220 < band.stop * resolution * 60
+    with pytest.raises(ValueError):
+        HeartRateAnalyzer(estimator=SpectralEstimator(segment_size=500))
+
+
+def test_spectral_estimator_tracks_heart_rate():
+    for heart_rate in (55.0, 90.0, 150.0):
+        analyzer = HeartRateAnalyzer(cal_hr_time=2, window_size=400, estimator=SpectralEstimator())
+        for ppg, acc in make_motion_stream(int(heart_rate), heart_rate=heart_rate, artifact=0.0, motion_start=60,
+                                           seconds=30):
+            result = analyzer.update(ppg, acc)
+        assert abs(result.hr - heart_rate) < 1.0
+        assert len(result.filtered_ppg) == 50
+
+
+def test_motion_subtraction_removes_periodic_artifact():
+    plain = HeartRateAnalyzer(cal_hr_time=2, window_size=400, estimator=SpectralEstimator())
+    subtracted = HeartRateAnalyzer(cal_hr_time=2, window_size=400,
+                                   estimator=SpectralEstimator(motion_subtraction=True))
+    for ppg, acc in make_motion_stream(3):
+        plain_hr = plain.update(ppg, acc).hr
+        subtracted_hr = subtracted.update(ppg, acc).hr
+    assert subtracted.global_noise_threshold >= subtracted.threshold1
+    # 최근 16개 창이 모두 움직임 구간: 차감하지 않으면 움직임 주기(108 bpm) 쪽으로 끌려감
+    assert abs(subtracted_hr - 130.0) < 2.0
+    assert abs(plain_hr - 130.0) > 10.0
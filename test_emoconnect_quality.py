@@ -0,0 +1,186 @@
+import math
+
+import numpy as np
+import pytest
+
+from emoconnect_pro import BatchHeartRateAnalyzer, DetrendEngine, HeartRateAnalyzer
+from emoconnect_quality import SignalQualityEstimator
+from test_emoconnect_hrv import make_beat_stream
+
+
+def reference_stats(window, clip_low=0.0, clip_high=65535.0):
+    centered = window - window.mean()
+    smoothness = (centered[1:] @ centered[:-1] / (len(window) - 1)) / centered.var()
+    return (window.mean(), window.std(), np.count_nonzero(window == 0),
+            np.count_nonzero((window <= clip_low) | (window >= clip_high)), smoothness)
+
+
+def test_incremental_statistics_match_window_recompute():
+    rng = np.random.default_rng(0)
+    values = 30000 + 1500 * np.sin(np.arange(3000) * 0.16) + rng.normal(0, 20, 3000)
+    values[rng.random(3000) < 0.05] = 0
+    values[rng.random(3000) < 0.05] = 65535
+    estimator = SignalQualityEstimator(window_size=100)
+    position = 0
+    for size in rng.integers(1, 60, 200):
+        chunk = values[position:position + size]
+        position += len(chunk)
+        estimator.update(chunk)
+        window = values[max(position - 100, 0):position]
+        mean, std, zeros, clipped, smoothness = reference_stats(window)
+        assert len(estimator) == len(window)
+        assert math.isclose(estimator.mean, mean, rel_tol=1e-9)
+        assert math.isclose(estimator.std, std, rel_tol=1e-7)
+        assert (estimator.zeros, estimator.clipped) == (zeros, clipped)
+        if len(window) >= 2:
+            assert math.isclose(estimator.smoothness, smoothness, rel_tol=1e-9, abs_tol=1e-12)
+    estimator.update(values[:250])  # 창보다 긴 입력은 마지막 창만 남김
+    assert math.isclose(estimator.mean, values[150:250].mean(), rel_tol=1e-12)
+
+
+def test_wear_detection_rejects_empty_saturated_and_ambient_signals():
+    rng = np.random.default_rng(1)
+    t = np.arange(100) / 50
+    pulse = 30000 + 1500 * np.sin(2 * np.pi * 1.2 * t) + rng.normal(0, 20, 100)
+    cases = {
+        'worn': (pulse, True),
+        'zeros': (np.zeros(100), False),
+        'saturated': (np.full(100, 65535.0), False),
+        'ambient': (200 + rng.normal(0, 2, 100), False),  # 맥동 없이 센서 잡음만
+        'flat': (np.full(100, 30000.0), False),  # 관류 지수 0
+    }
+    for name, (ppg, expected) in cases.items():
+        estimator = SignalQualityEstimator()
+        estimator.update(ppg, rng.normal(0, 0.05, (100, 3)))
+        quality = estimator.assess()
+        assert quality.is_wearing == expected, name
+        assert (quality.sqi > 0.5) == expected, name
+    assert estimator.assess().clipping_ratio == 0.0
+    estimator.update(np.full(60, 65535.0))
+    assert estimator.assess().clipping_ratio == 0.6
+
+
+def test_template_correlation_scores_beat_shape_consistency():
+    peaks, chunks = make_beat_stream(2, seconds=4)
+    window = np.concatenate([ppg for ppg, _ in chunks[:2]])
+    detrended = DetrendEngine.detrend(window, 2)
+    beats = np.round(peaks[peaks < 2] * 50).astype(int)
+    assert SignalQualityEstimator.template_correlation(detrended, beats) > 0.9
+    noise = np.random.default_rng(2).normal(0, 1, 100)
+    assert SignalQualityEstimator.template_correlation(noise, beats) < 0.5
+    assert math.isnan(SignalQualityEstimator.template_correlation(detrended, beats[:1]))
+    estimator = SignalQualityEstimator()
+    estimator.update(window)
+    quality = estimator.assess()
+    assert estimator.refine(quality, detrended, beats) == estimator.assess(detrended, beats)
+    estimator.beat_template = False
+    assert estimator.refine(quality, detrended, beats) == quality
+
+
+def test_analyzer_skips_detrend_for_not_worn_windows(monkeypatch):
+    import emoconnect_pro
+
+    calls = []
+    detrend = emoconnect_pro.ek.detrend
+
+    def counting_detrend(operator, values):
+        calls.append(len(values))
+        return detrend(operator, values)
+
+    monkeypatch.setattr(emoconnect_pro.ek, "detrend", counting_detrend)
+    rng = np.random.default_rng(3)
+    _, chunks = make_beat_stream(3, seconds=30)
+    for second in range(10, 20):
+        chunks[second] = (200 + rng.normal(0, 2, 50), chunks[second][1])  # 손목에서 뗌
+    legacy = HeartRateAnalyzer(cal_hr_time=2)
+    gated = HeartRateAnalyzer(cal_hr_time=2, quality=SignalQualityEstimator())
+    correlations = []
+    for second, (ppg, acc) in enumerate(chunks):
+        calls.clear()
+        expected = legacy.update(ppg, acc)
+        legacy_calls = len(calls)
+        calls.clear()
+        result = gated.update(ppg, acc)
+        if 12 <= second < 20:
+            # 기존 판단(합이 0)은 주변광 신호를 착용으로 보고 분석하지만 품질 추정기는 건너뜀
+            assert expected.is_wearing and legacy_calls == 1
+            assert not result.is_wearing and result.hr == 0 and len(calls) == 0
+            assert result.quality.sqi == 0 and len(result.filtered_ppg) == 0
+        elif second < 10 and expected.is_fitting:
+            assert result.hr == expected.hr and len(calls) == 1
+            assert result.quality.is_wearing
+            correlations.append(result.quality.template_correlation)
+    assert result.is_wearing and result.hr > 0
+    # 박동 구간이 2개 미만인 창은 nan, 나머지는 같은 모양의 박동
+    correlations = np.array(correlations)
+    assert np.count_nonzero(~np.isnan(correlations)) >= len(correlations) // 2
+    assert np.all(correlations[~np.isnan(correlations)] > 0.5)
+
+
+def test_min_sqi_skips_estimation_and_window_size_must_match():
+    _, chunks = make_beat_stream(4, seconds=10)
+    analyzer = HeartRateAnalyzer(cal_hr_time=2, quality=SignalQualityEstimator(min_sqi=1.01))
+    results = [analyzer.update(ppg, acc) for ppg, acc in chunks]
+    assert all(result.is_wearing and result.quality.sqi < 1.01 for result in results)
+    assert results[-1].is_fitting and results[-1].hr == 0.0 and len(results[-1].filtered_ppg) == 0
+    with pytest.raises(ValueError):
+        HeartRateAnalyzer(window_size=200, quality=SignalQualityEstimator(window_size=100))
+
+
+def test_batch_analyzer_matches_single_with_quality():
+    streams = [make_beat_stream(seed, seconds=30)[1] for seed in range(3)]
+    rng = np.random.default_rng(5)
+    for second in range(10, 15):
+        streams[1][second] = (200 + rng.normal(0, 2, 50), streams[1][second][1])
+        streams[2][second] = (np.zeros(50), streams[2][second][1])
+    single = [HeartRateAnalyzer(cal_hr_time=2, quality=SignalQualityEstimator()) for _ in streams]
+    batched = [HeartRateAnalyzer(cal_hr_time=2, quality=SignalQualityEstimator()) for _ in streams]
+    batch = BatchHeartRateAnalyzer()
+    for second in range(30):
+        chunks = [stream[second] for stream in streams]
+        results = batch.update(batched, [c[0] for c in chunks], [c[1] for c in chunks])
+        for analyzer, chunk, result in zip(single, chunks, results):
+            expected = analyzer.update(*chunk)
+            assert result.hr == expected.hr and result.is_wearing == expected.is_wearing
+            assert np.array_equal(result.filtered_ppg, expected.filtered_ppg)
+            assert result.quality[:5] == expected.quality[:5]
+            assert (math.isnan(expected.quality.template_correlation)
+                    or result.quality.template_correlation == expected.quality.template_correlation)
+        if second == 13:
+            assert not results[1].is_wearing and not results[2].is_wearing
+
+
+def test_batch_analyzer_follows_quality_wear_decision_for_zero_sum_window():
+    class AlwaysWorn(SignalQualityEstimator):
+        """창의 합이 0이어도 착용으로 판단하는 품질 추정기 (단일 분석기는 창의 합을 보지 않음)"""
+        def assess(self, detrended=None, peak_indices=()):
+            return super().assess(detrended, peak_indices)._replace(is_wearing=True, sqi=1.0)
+
+    _, chunks = make_beat_stream(6, seconds=20)
+    for second in range(10, 13):
+        chunks[second] = (np.zeros(50), chunks[second][1])
+    single = HeartRateAnalyzer(cal_hr_time=2, quality=AlwaysWorn())
+    batched = HeartRateAnalyzer(cal_hr_time=2, quality=AlwaysWorn())
+    batch = BatchHeartRateAnalyzer()
+    for second, (ppg, acc) in enumerate(chunks):
+        expected = single.update(ppg, acc)
+        result, = batch.update([batched], [ppg], [acc])
+        assert result.hr == expected.hr and result.is_wearing == expected.is_wearing
+        assert np.array_equal(result.filtered_ppg, expected.filtered_ppg)
+        if second == 12:
+            assert result.is_wearing and len(result.filtered_ppg) == 50  # 합이 0인 창도 분석
+    assert single.peak_bpm_values == batched.peak_bpm_values
+
+
+def test_clear_keeps_shared_motion_estimator():
+    rng = np.random.default_rng(7)
+    analyzer = HeartRateAnalyzer(quality=SignalQualityEstimator())
+    analyzer.update(30000 + rng.normal(0, 20, 50), rng.normal(0, 1, (50, 3)))
+    noise = analyzer.motion_estimator.noise_threshold
+    analyzer.quality.clear()
+    assert len(analyzer.quality) == 0
+    assert len(analyzer.motion_estimator) == 50 and analyzer.motion_estimator.noise_threshold == noise
+    standalone = SignalQualityEstimator()
+    standalone.update(30000 + rng.normal(0, 20, 50), rng.normal(0, 1, (50, 3)))
+    standalone.clear()
+    assert len(standalone) == 0 and len(standalone.motion) == 0  # 자신의 움직임 추정기는 비움
@@ -0,0 +1,59 @@
+import numpy as np
+
+from emoconnect_recorder import HEADER_SIZE, RECORD_DTYPE, SessionReader, SessionRecorder
+from emoconnect_transport import EmulatedTransport
+from emoconnect_utils import DataParser
+
+
+def record_session(path, count=200):
+    emulator = EmulatedTransport(battery_interval=1.0, seed=7)
+    notifications = emulator.generate(count)
+    with SessionRecorder(str(path)) as recorder:
+        for i, payload in enumerate(notifications):
+            recorder.record(bytearray(payload), timestamp=100.0 + i * 0.1)
+    return notifications
+
+
+def test_recorder_round_trip(tmp_path):
+    path = tmp_path / "session.emorec"
+    notifications = record_session(path)
+
+    reader = SessionReader(str(path))
+    assert [payload for _, payload in reader.notifications()] == notifications
+    assert len(reader.battery()) == 19
+    assert reader.battery()[0][1:] == (87, 1)
+
+    sensor = [n for n in notifications if n[0:4] != b"BATT"]
+    expected = DataParser().parse_frames(b"".join(sensor))
+    channels = reader.channels()
+    assert np.array_equal(channels['ppg'], expected['ppg'])
+    assert np.array_equal(channels['acc'].astype(np.float32), expected['acc'])
+
+
+def test_reader_chunks_are_zero_copy_views(tmp_path):
+    path = tmp_path / "session.emorec"
+    record_session(path)
+    reader = SessionReader(str(path))
+
+    chunks = list(reader.iter_chunks(max_samples=16))
+    assert sum(len(chunk['ppg']) for chunk in chunks) == len(reader) - len(reader.battery())
+    assert all(len(chunk['ppg']) <= 16 for chunk in chunks)
+    assert all(np.shares_memory(chunk['ppg'], reader.records) for chunk in chunks)
+    assert np.all(np.diff(chunks[0]['timestamp']) >= 0)
+
+
+def test_recorder_appends_after_truncated_record(tmp_path):
+    path = tmp_path / "session.emorec"
+    record_session(path, count=10)
+    size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")  # 비정상 종료로 잘린 레코드
+
+    with SessionRecorder(str(path)) as recorder:
+        recorder.record(EmulatedTransport().next_notification(), timestamp=500.0)
+
+    assert path.stat().st_size == size + 5 * RECORD_DTYPE.itemsize
+    reader = SessionReader(str(path))
+    notifications = list(reader.notifications())
+    assert notifications[-1][0] == 500.0
+    assert (size - HEADER_SIZE) % RECORD_DTYPE.itemsize == 0
@@ -0,0 +1,160 @@
+import asyncio
+import struct
+
+import numpy as np
+import pytest
+
+from emoconnect_session import SensorSession, START_COMMANDS, parse_device_id
+
+
+class FakeTransport:
+    """알림 핸들러를 테스트에서 직접 호출하기 위한 Transport 대역"""
+    def __init__(self):
+        self.is_connected = False
+        self.handlers = {}
+        self.written = []
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def disconnect(self):
+        self.is_connected = False
+
+    async def start_notify(self, char, handler):
+        self.handlers[char] = handler
+
+    async def write_gatt_char(self, char, data):
+        self.written.append(data)
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.calls = []
+
+    def update_hr(self, ppg, acc):
+        self.calls.append((ppg, acc))
+        return 72.0, [0.0] * 50
+
+
+def make_frame(ppg):
+    return struct.pack('<H9e', ppg, *([1.0] * 9))
+
+
+def test_parse_device_id():
+    assert parse_device_id("EmoConnect v1.0(A107)") == "A107"
+    assert parse_device_id("VitalTrack") == "VitalTrack"
+
+
+def test_session_processes_notifications():
+    async def run():
+        transport = FakeTransport()
+        analyzer = FakeAnalyzer()
+        received = []
+        session = SensorSession("AA:BB", hr_analyzer=analyzer, on_result=received.append, transport=transport,
+                                timebase='count')
+        await session.connect()
+        await session.start_measure()
+
+        handler = transport.handlers[session.uuids.get_READ_PPG_CHAR()]
+        for i in range(20):
+            handler(None, bytearray(make_frame(i)))
+
+        iterator = session.results()
+        pending = asyncio.ensure_future(iterator.__anext__())
+        await asyncio.sleep(0)
+        result = session.process()
+        assert await pending is result
+
+        await session.disconnect()
+        return transport, analyzer, received, result
+
+    transport, analyzer, received, result = asyncio.run(run())
+    assert transport.written == list(START_COMMANDS)
+    assert received == [result]
+    assert result['hr'] == 72.0
+    assert len(result['ppg']) == 50
+    assert result['ppg'][0] == 0.0 and result['ppg'][-1] == 19.0
+    assert result['acc'][0].tolist() == [1.0, 1.0, 1.0]
+    assert analyzer.calls == [(result['ppg'], result['acc'])]
+
+
+def test_session_without_enough_samples_returns_defaults():
+    session = SensorSession("AA:BB", transport=FakeTransport(), timebase='count')
+    session.notification_handler(None, make_frame(5))
+    result = session.process()
+    assert result['ppg'].tolist() == [0.0] * 50
+    assert result['acc'].shape == (50, 3)
+    assert result['hr'] is None
+
+
+def test_session_updates_motion_noise_per_notification():
+    session = SensorSession("AA:BB", transport=FakeTransport(), auto_process=False)
+    session.notification_handler(None, make_frame(5) * 5)
+    assert session.noise_threshold == 0.0
+    moving = struct.pack('<H9e', 5, 3.0, -3.0, 0.0, *([0.0] * 6))
+    session.notification_handler(None, moving * 5)
+    # acc 창: [1, 1, 1] x5 + [3, -3, 0] x5 → 축별 표준편차 1, 2, 0.5
+    assert abs(session.noise_threshold - 3.5) < 1e-9
+
+
+def test_session_resamples_on_arrival_timeline(monkeypatch):
+    clock = iter(0.1 * n for n in range(1, 1000))
+    monkeypatch.setattr("emoconnect_session.time.monotonic", lambda: next(clock))
+    session = SensorSession("AA:BB", transport=FakeTransport(), auto_process=False)
+    results = []
+    for second in range(3):
+        for n in range(10):
+            sample = second * 50 + n * 5
+            session.notification_handler(None, b"".join(make_frame(sample + i) for i in range(5)))
+        results.append(session.process())
+    times = np.concatenate([result['time'] for result in results])
+    ppg = np.concatenate([result['ppg'] for result in results])
+    # 주기 경계를 넘어 50Hz 격자와 값이 연속적으로 이어짐 (샘플 값 = 샘플 번호)
+    assert np.allclose(np.diff(times), 0.02)
+    assert np.allclose(np.diff(ppg), 1.0)
+    assert len(ppg) == 150
+
+
+def test_session_handler_survives_processing_error():
+    class FailingAnalyzer:
+        def update_hr(self, ppg, acc):
+            raise ValueError("bad window")
+
+    session = SensorSession("AA:BB", hr_analyzer=FailingAnalyzer(), transport=FakeTransport(), interval=0.0,
+                            timebase='count')
+    session.notification_handler(None, make_frame(5) * 5)  # 처리 오류가 콜백 밖으로 나가지 않음
+    session.notification_handler(None, make_frame(6) * 5)
+    assert len(session.handler_latency) == 2
+
+
+def test_recorder_errors_stay_in_handler_and_main_closes_recorder(monkeypatch):
+    import emoconnect_recorder
+    import emoconnect_session
+
+    class BrokenRecorder:
+        closed = False
+
+        def __init__(self, path=None):
+            BrokenRecorder.instance = self
+
+        def record(self, data, arrival):
+            raise OSError("disk full")
+
+        def close(self):
+            self.closed = True
+
+    session = SensorSession("AA:BB", transport=FakeTransport(), auto_process=False, recorder=BrokenRecorder())
+    session.notification_handler(None, make_frame(5))  # 기록 오류가 BLE 콜백 밖으로 나가지 않음
+    session.notification_handler(None, make_frame(6))
+    # 기록이 실패해도 샘플은 계속 받고, 첫 실패 후 기록을 끔
+    assert session.recorder is None
+    assert session.stream.drain()['ppg'].tolist() == [5, 6]
+
+    class FailingTransport(FakeTransport):
+        async def connect(self):
+            raise ConnectionError("device lost")
+
+    monkeypatch.setattr(emoconnect_recorder, "SessionRecorder", BrokenRecorder)
+    with pytest.raises(ConnectionError):
+        asyncio.run(emoconnect_session.main("AA:BB", transport=FailingTransport(), record_path="unused.emorec"))
+    assert BrokenRecorder.instance.closed
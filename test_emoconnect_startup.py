@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+# 헤드리스 분석 경로의 import 시간 예산 (emoconnect_* 모듈 자체 시간 합계, 밀리초)
+IMPORT_BUDGET_MS = float(os.environ.get("EMOCONNECT_IMPORT_BUDGET_MS", "150"))
+# 분석 경로에서 즉시 import되면 안 되는 무거운 패키지 (필요 시 처음 사용할 때 import)
+HEAVY_PACKAGES = ('scipy', 'PySide6', 'qasync', 'bleak', 'matplotlib', 'pandas')
+
+
+def import_times(statement):
+    """
+    새 인터프리터에서 python -X importtime으로 statement를 실행하고
+    {모듈 이름: (self 시간 us, 누적 시간 us)}를 반환합니다.
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True, check=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def own_time_ms(times):
+    return sum(self_us for name, (self_us, _) in times.items() if name.startswith("emoconnect")) / 1000
+
+
+def test_analysis_import_path_is_numpy_only():
+    times = import_times("import emoconnect_pro, newert_pro")
+    heavy = [name for name in times if name.split(".")[0] in HEAVY_PACKAGES + ('asyncio',)]
+    assert heavy == []
+    assert own_time_ms(times) < IMPORT_BUDGET_MS
+
+
+def test_headless_batch_import_path_budget():
+    times = import_times("import emoconnect_batch, emoconnect_session, emoconnect_manager")
+    heavy = [name for name in times if name.split(".")[0] in HEAVY_PACKAGES]
+    assert heavy == []
+    assert own_time_ms(times) < IMPORT_BUDGET_MS
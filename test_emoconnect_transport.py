@@ -0,0 +1,127 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+import emoconnect_pro as ep
+from emoconnect_session import SensorSession
+from emoconnect_transport import EmulatedTransport, Recording, Transport
+from emoconnect_utils import DataParser
+
+
+def test_emulator_frames_are_valid():
+    emulator = EmulatedTransport(samples_per_notification=5, seed=1)
+    payload = emulator.next_notification()
+    assert len(payload) == 100
+
+    columns = DataParser().parse_frames(payload)
+    assert len(columns['ppg']) == 5
+    assert np.all((columns['ppg'] > 25000) & (columns['ppg'] < 35000))
+    assert np.allclose(columns['acc'][:, 2], 9.81, atol=0.2)
+
+
+def test_emulator_battery_and_packet_loss():
+    emulator = EmulatedTransport(battery_interval=1.0, packet_loss=0.2, seed=3)
+    notifications = emulator.generate(1000)  # 100초 분량
+
+    parser = DataParser()
+    battery = [parser.parse_data(n)[0] for n in notifications if n[0:4] == b"BATT"]
+    assert len(battery) == 99
+    assert battery[0] == {'battery': 87, 'count': 1}
+    assert emulator.sent_notifications + emulator.dropped_notifications == 1000
+    assert 150 < emulator.dropped_notifications < 250
+
+
+def test_emulator_does_not_burst_battery_packets_after_delayed_start():
+    async def run():
+        emulator = EmulatedTransport(battery_interval=0.4)
+        packets = []
+        await emulator.connect()
+        await emulator.start_notify(None, lambda sender, data: packets.append(bytes(data)))
+        await asyncio.sleep(1.5)  # 측정 시작 전 대기
+        emulator.streaming = True
+        await asyncio.sleep(0.45)
+        await emulator.disconnect()
+        return packets
+
+    packets = asyncio.run(run())
+    battery = [packet for packet in packets if packet[0:4] == b"BATT"]
+    assert 1 <= len(battery) <= 2  # 시작 이후 0.4초마다 (대기한 1.5초 분량을 알림마다 몰아 보내지 않음)
+
+
+def test_emulator_replays_csv_recording():
+    recording = Recording.from_csv("hr_values.csv", "acc_interp.csv", imu_raw_bits=True)
+    assert recording.ppg.shape == (43,)
+    assert recording.imu.shape == (100, 9)
+
+    emulator = EmulatedTransport(recording=recording, samples_per_notification=50)
+    columns = DataParser().parse_frames(emulator.next_notification())
+    assert columns['ppg'].tolist() == np.round(recording.ppg[np.arange(50) % 43]).tolist()
+    assert np.array_equal(columns['acc'], recording.imu[:50, 0:3].astype(np.float32))
+    # 3열(acc만 있는) 행은 gyro/mag가 0
+    assert np.all(recording.imu[50:, 3:] == 0)
+    assert np.all(recording.imu[50:, 0:3] != 0)
+
+
+def test_session_streams_from_emulator():
+    async def run():
+        emulator = EmulatedTransport(sample_rate=500.0, samples_per_notification=10, seed=5)
+        # 10배 빠르게 재생하므로 도착 시각 기준이 아닌 샘플 수 기준(timebase='count')으로 보간
+        session = SensorSession("EMULATOR", hr_analyzer=ep.HeartRateAnalyzer(cal_hr_time=1),
+                                interval=0.1, transport=emulator, timebase='count')
+        results = []
+        async with session:
+            await asyncio.sleep(0.15)
+            assert results == [] and not emulator.streaming  # 시작 명령 전에는 전송하지 않음
+            session.add_callback(results.append)
+            emulator.streaming = True
+            await asyncio.sleep(0.5)
+        return emulator, results
+
+    emulator, results = asyncio.run(run())
+    assert not emulator.is_connected
+    assert len(results) >= 3
+    assert all(len(result['ppg']) == 50 for result in results)
+    assert results[-1]['ppg'][0] > 25000
+
+
+def test_update_hr_analyzer_gets_fixed_windows_after_delayed_start():
+    import newert_pro
+
+    async def run():
+        emulator = EmulatedTransport(seed=6)
+        session = SensorSession("EMULATOR", hr_analyzer=newert_pro.HeartRateAnalyzer(cal_hr_time=1),
+                                interval=0.2, transport=emulator)
+        results = []
+        session.add_callback(results.append)
+        async with session:
+            await asyncio.sleep(0.3)  # 처리 주기가 지난 뒤 측정 시작 → 첫 창은 샘플 몇 개뿐
+            await session.start_measure()
+            await asyncio.sleep(0.6)
+        return session, results
+
+    session, results = asyncio.run(run())
+    # update_hr()만 제공하는 분석기는 기본 timebase가 'count' (가변 길이 창이면 update_hr()가 실패함)
+    assert session.resampler is None
+    assert len(results) >= 2
+    assert all(len(result['ppg']) == 50 and result['hr'] is not None for result in results)
+
+
+def test_incomplete_transport_fails_at_construction():
+    class NoStopNotify(Transport):
+        is_connected = False
+
+        async def connect(self):
+            pass
+
+        async def disconnect(self):
+            pass
+
+        async def start_notify(self, char, handler):
+            pass
+
+        async def write_gatt_char(self, char, data):
+            pass
+
+    with pytest.raises(TypeError):
+        NoStopNotify()
@@ -0,0 +1,223 @@
+import struct
+
+import numpy as np
+import pytest
+
+from emoconnect_utils import (DataParser, FRAME_SIZE, FLOAT16_TABLE, MotionNoiseEstimator, Resampler, SensorStream,
+                              TimelineResampler, float16_to_float32)
+
+
+def reference_float16_bits(value):
+    """IEEE-754 binary16 → binary32 비트 변환 (비교 기준용 정수 연산 구현)"""
+    sign = (value >> 15) & 0x1
+    exponent = (value >> 10) & 0x1F
+    fraction = value & 0x3FF
+    if exponent == 0:
+        if fraction == 0:
+            return sign << 31
+        # 서브노멀: 가수를 정규화하면서 지수를 낮춤
+        exponent = 127 - 15 + 1
+        while not fraction & 0x400:
+            fraction <<= 1
+            exponent -= 1
+        fraction &= 0x3FF
+    elif exponent == 0x1F:
+        exponent = 0xFF
+    else:
+        exponent += 127 - 15
+    return (sign << 31) | (exponent << 23) | (fraction << 13)
+
+
+def make_frame(ppg, acc, gyro, mag):
+    return struct.pack('<H9e', ppg, *acc, *gyro, *mag)
+
+
+def test_parse_frames_decodes_columns():
+    frames = [make_frame(i * 100, [0.5, -1.0, 2.0], [i, 0.25, -0.125], [3.0, 4.0, -8.0])
+              for i in range(5)]
+    data = b"".join(frames) + b"\x01\x02\x03"  # 20바이트 미만 잔여분은 무시
+
+    columns = DataParser().parse_frames(data)
+
+    assert columns['ppg'].tolist() == [0, 100, 200, 300, 400]
+    assert columns['acc'].shape == (5, 3)
+    assert columns['acc'].dtype == np.float32
+    assert columns['acc'][0].tolist() == [0.5, -1.0, 2.0]
+    assert columns['gyro'][:, 0].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert columns['mag'][4].tolist() == [3.0, 4.0, -8.0]
+
+
+def test_parse_frames_accepts_bytearray_and_battery():
+    data = bytearray(make_frame(7, [1, 2, 3], [4, 5, 6], [7, 8, 9]))
+    assert DataParser().parse_frames(data)['ppg'].tolist() == [7]
+
+    battery = b"BATT" + bytes(FRAME_SIZE - 4)
+    assert len(DataParser().parse_frames(battery)['ppg']) == 0
+
+
+def test_parse_data_matches_legacy_layout():
+    data = make_frame(1234, [0.5, 1.5, -2.5], [0.0, 1.0, 2.0], [10.0, 20.0, 30.0]) * 2
+    parsed = DataParser().parse_data(data)
+
+    assert parsed == [{
+        'ppg': 1234,
+        'acc': [0.5, 1.5, -2.5],
+        'gyro': [0.0, 1.0, 2.0],
+        'mag': [10.0, 20.0, 30.0]
+    }] * 2
+
+
+def test_parse_data_battery():
+    data = b"BATT" + bytes([0, 0, 87, 0, 0x34, 0x12]) + bytes(10)
+    assert DataParser().parse_data(data) == [{'battery': 87, 'count': 0x1234}]
+
+
+def test_float16_table_is_bit_exact_for_all_inputs():
+    expected = np.array([reference_float16_bits(v) for v in range(65536)], dtype=np.uint32)
+    assert np.array_equal(FLOAT16_TABLE.view(np.uint32), expected)
+
+    # parse_frames(네이티브 half 변환)도 같은 결과를 내야 함
+    patterns = np.arange(65536, dtype='<u2').reshape(-1, 8)
+    data = np.concatenate([np.zeros((len(patterns), 1), dtype='<u2'), patterns,
+                           np.zeros((len(patterns), 1), dtype='<u2')], axis=1).tobytes()
+    columns = DataParser().parse_frames(data)
+    decoded = np.concatenate([columns['acc'], columns['gyro'], columns['mag']], axis=1)[:, :8]
+    assert np.array_equal(decoded.reshape(-1).view(np.uint32), expected)
+
+
+def test_float16_scalar_conversion():
+    assert float16_to_float32(0x3C00) == 1.0
+    assert float16_to_float32(0xC000) == -2.0
+    assert float16_to_float32(0x0001) == 2.0 ** -24  # 최소 서브노멀
+    assert float16_to_float32(0x03FF) == 1023 * 2.0 ** -24
+    assert float16_to_float32(0x7C00) == float('inf')
+    assert DataParser().float16_to_float32(0x7BFF) == 65504.0
+
+
+def test_sensor_stream_wraps_and_drains_in_order():
+    stream = SensorStream(capacity=8)
+    for i in range(5):
+        stream.ingest(make_frame(i, [i, 0, 0], [0, i, 0], [0, 0, i]) * 2)
+
+    assert stream.total_samples == 10
+    assert len(stream) == 8
+    samples = stream.drain()
+    # 용량(8)을 넘은 가장 오래된 2개 샘플은 덮어쓰여짐
+    assert samples['ppg'].tolist() == [1, 1, 2, 2, 3, 3, 4, 4]
+    assert samples['acc'][:, 0].tolist() == [1, 1, 2, 2, 3, 3, 4, 4]
+    assert samples['mag'][-1].tolist() == [0, 0, 4]
+
+    stream.ingest(make_frame(9, [9, 9, 9], [9, 9, 9], [9, 9, 9]))
+    assert stream.drain()['ppg'].tolist() == [9]
+    assert len(stream.drain()['ppg']) == 0
+    assert stream.latest(3)['ppg'].tolist() == [4, 4, 9]
+
+
+def test_sensor_stream_battery_and_oversized_notification():
+    stream = SensorStream(capacity=4)
+    assert stream.ingest(b"BATT" + bytes([0, 0, 120, 0, 2, 0]) + bytes(10)) == 0
+    assert stream.battery == 100
+    assert stream.battery_count == 2
+
+    data = b"".join(make_frame(i, [0, 0, 0], [0, 0, 0], [0, 0, 0]) for i in range(6))
+    assert stream.ingest(data) == 6
+    assert stream.drain()['ppg'].tolist() == [2, 3, 4, 5]
+
+
+def test_motion_noise_estimator_tracks_sliding_window():
+    rng = np.random.default_rng(3)
+    samples = rng.normal(0, [1.0, 2.0, 5.0], (1000, 3)) + np.linspace(0, 50, 1000)[:, None]
+    estimator = MotionNoiseEstimator(window_size=50)
+    position = 0
+    while position < len(samples):
+        size = int(rng.integers(1, 8))
+        noise = estimator.update(samples[position:position + size].tolist())
+        position += size
+        window = samples[max(position - 50, 0):position]
+        assert len(estimator) == len(window)
+        assert np.allclose(estimator.std, window.std(axis=0), rtol=1e-9, atol=1e-9)
+        assert abs(noise - window.std(axis=0).sum()) < 1e-8
+
+
+def test_motion_noise_estimator_full_window_and_empty():
+    estimator = MotionNoiseEstimator(window_size=50)
+    assert estimator.noise_threshold == 0.0
+    acc = [[i % 3, 0.5 * i, 1.0] for i in range(60)]
+    expected = np.std(np.array(acc)[-50:], axis=0).sum()
+    assert abs(estimator.update(acc) - expected) < 1e-12
+    assert estimator.update([]) == estimator.noise_threshold
+    estimator.clear()
+    assert len(estimator) == 0
+
+
+def test_resampler_matches_interp1d_linear():
+    interp1d = pytest.importorskip("scipy.interpolate").interp1d
+    rng = np.random.default_rng(4)
+    resampler = Resampler(num_points=50, decimals=None)
+    for length in (2, 3, 10, 37, 49, 50, 51, 64, 100, 250):
+        values = rng.normal(30000, 500, (length, 10))
+        x = np.linspace(0, length - 1, num=length)
+        expected = interp1d(x, values, kind='linear', axis=0, fill_value="extrapolate")(
+            np.linspace(0, length - 1, num=50))
+        assert np.array_equal(resampler.interpolate(values), expected)
+        assert np.array_equal(resampler.interpolate(values[:, 0]), expected[:, 0])
+    assert resampler.grid(37) is resampler.grid(37)
+
+
+def test_resampler_resamples_all_channels_at_once():
+    stream = SensorStream()
+    stream.ingest(b"".join(make_frame(i, (i, 0.5, 1.0), (0.0, 0.0, -i), (2.0, 2.0, 2.0)) for i in range(25)))
+    result = Resampler(num_points=50).resample(stream.drain())
+    assert result['ppg'].shape == (50,) and result['mag'].shape == (50, 3)
+    assert result['ppg'][0] == 0.0 and result['ppg'][-1] == 24.0
+    assert np.array_equal(result['acc'][:, 0], result['ppg'])
+    assert np.array_equal(result['gyro'][:, 2], -result['ppg'])
+    assert np.all(result['mag'] == 2.0)
+    assert Resampler(num_points=4).interpolate([[1.0, 2.0, 3.0]]).tolist() == [[1.0, 2.0, 3.0]] * 4
+    assert Resampler(num_points=4).interpolate([]).tolist() == [0.0] * 4
+
+
+def test_sensor_stream_timeline_is_monotonic_under_bursty_arrivals():
+    stream = SensorStream(sample_rate=50.0)
+    frames = b"".join(make_frame(i, (0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)) for i in range(5))
+    # 두 알림이 한꺼번에 도착하고, 이후 지연되어 도착하는 경우
+    for arrival in (0.1, 0.2, 0.2, 0.45, 0.5, 0.6):
+        stream.ingest(frames, arrival)
+    times = stream.drain()['time']
+    assert len(times) == 30
+    assert np.all(np.diff(times) > 0)
+    assert np.all(np.abs(np.diff(times) - 0.02) < 0.01)
+    assert times[-1] <= 0.6
+    # 큰 공백(패킷 손실) 뒤에는 도착 시각으로 재동기화
+    stream.ingest(frames, 5.0)
+    assert stream.drain()['time'].tolist() == pytest.approx([4.92, 4.94, 4.96, 4.98, 5.0])
+
+
+def test_timeline_resampler_is_continuous_across_windows():
+    stream = SensorStream()
+    resampler = TimelineResampler(rate=50.0, decimals=None)
+    outputs = []
+    for window in range(4):
+        for n in range(10):
+            start = window * 50 + n * 5
+            stream.ingest(b"".join(make_frame(start + i, (0.0, 0.0, 1.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+                                   for i in range(5)), 0.1 * (window * 10 + n + 1))
+        outputs.append(resampler.resample(stream.drain()))
+    times = np.concatenate([output['time'] for output in outputs])
+    ppg = np.concatenate([output['ppg'] for output in outputs])
+    assert np.allclose(np.diff(times), 0.02)
+    assert np.allclose(ppg, (times - 0.02) * 50)
+    assert np.all(np.concatenate([output['acc'] for output in outputs])[:, 2] == 1.0)
+
+
+def test_timeline_resampler_anti_alias_policy():
+    times = np.arange(400) / 100.0  # 100Hz 입력
+    tone = np.sin(2 * np.pi * 40.0 * times)  # 50Hz 출력의 나이퀴스트(25Hz)를 넘는 성분
+    samples = {'time': times, 'ppg': tone, 'acc': np.zeros((400, 3)), 'gyro': np.zeros((400, 3)),
+               'mag': np.zeros((400, 3))}
+    filtered = TimelineResampler(anti_alias='auto', decimals=None).resample(samples)
+    raw = TimelineResampler(anti_alias='none', decimals=None).resample(samples)
+    assert np.allclose(np.diff(filtered['time']), 0.02) and np.allclose(np.diff(raw['time']), 0.02)
+    assert np.abs(filtered['ppg']).max() < 0.5 * np.abs(raw['ppg']).max()
+    with pytest.raises(ValueError):
+        TimelineResampler(anti_alias='sinc')
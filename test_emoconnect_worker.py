@@ -0,0 +1,131 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from emoconnect_session import SensorSession
+from emoconnect_worker import ProcessingWorker
+from test_emoconnect_session import FakeAnalyzer, FakeTransport, make_frame
+
+
+class BlockingSession:
+    """첫 처리 창에서 release될 때까지 작업 스레드를 붙잡아 두는 세션 대역"""
+    def __init__(self, address="AA:BB", timebase='arrival'):
+        self.address = address
+        self.resampler = object() if timebase == 'arrival' else None
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.processed = []
+        self.published = []
+
+    def process_samples(self, samples):
+        self.started.set()
+        self.release.wait(5)
+        self.processed.append(samples['ppg'].tolist())
+        return {'ppg': samples['ppg']}
+
+    def publish_threadsafe(self, result):
+        self.published.append(result)
+
+
+def window(*values):
+    return {'ppg': np.array(values, dtype=float), 'acc': np.zeros((len(values), 3))}
+
+
+def run_policy(policy, timebase='arrival'):
+    session = BlockingSession(timebase=timebase)
+    worker = ProcessingWorker(maxsize=2, policy=policy).start()
+    worker.submit(session, window(0))
+    assert session.started.wait(5)  # 첫 창 처리 중 (큐는 비어 있음)
+    accepted = [worker.submit(session, window(value)) for value in (1, 2, 3, 4)]
+    metrics = worker.metrics()
+    session.release.set()
+    worker.stop(timeout=5)
+    return session, accepted, metrics, worker
+
+
+def test_worker_drop_policies():
+    session, accepted, metrics, worker = run_policy('drop_newest')
+    assert accepted == [True, True, False, False]
+    assert session.processed == [[0], [1], [2]]
+    assert metrics['dropped'] == 2 and metrics['queue_depth'] == 2 and metrics['max_queue_depth'] == 2
+
+    session, accepted, metrics, worker = run_policy('drop_oldest')
+    assert accepted == [True] * 4
+    assert session.processed == [[0], [3], [4]]
+    assert worker.metrics()['processed'] == 3 and worker.metrics()['dropped'] == 2
+
+
+def test_worker_coalesces_windows_of_the_same_session():
+    session, accepted, metrics, worker = run_policy('coalesce')
+    assert accepted == [True] * 4
+    assert session.processed == [[0], [1], [2, 3, 4]]
+    assert metrics['coalesced'] == 2 and metrics['dropped'] == 0
+    assert len(session.published) == 3
+    with pytest.raises(ValueError):
+        ProcessingWorker(policy='block')
+
+
+def test_worker_does_not_coalesce_count_timebase_windows():
+    # 샘플 수 기준 보간 세션은 합친 창이 num_points개로 압축되므로 가장 오래된 창을 버림
+    session, accepted, metrics, worker = run_policy('coalesce', timebase='count')
+    assert accepted == [True] * 4
+    assert session.processed == [[0], [3], [4]]
+    assert metrics['coalesced'] == 0 and metrics['dropped'] == 2
+
+
+def test_session_hands_windows_to_worker_and_publishes_on_loop_thread():
+    async def run():
+        worker = ProcessingWorker().start()
+        analyzer = FakeAnalyzer()
+        threads = []
+        session = SensorSession("AA:BB", hr_analyzer=analyzer, transport=FakeTransport(), worker=worker,
+                                timebase='count', on_result=lambda result: threads.append(threading.get_ident()))
+        await session.connect()
+        for i in range(20):
+            session.notification_handler(None, make_frame(i))
+        iterator = session.results()
+        pending = asyncio.ensure_future(iterator.__anext__())
+        await asyncio.sleep(0)
+        assert session.process() is None
+        result = await asyncio.wait_for(pending, 5)
+        worker.stop(timeout=5)
+        await session.disconnect()
+        return result, threads, worker, session
+
+    result, threads, worker, session = asyncio.run(run())
+    assert result['hr'] == 72.0 and result['ppg'][-1] == 19.0
+    assert threads == [threading.get_ident()]  # 콜백은 이벤트 루프 스레드에서 실행
+    assert worker.metrics()['processed'] == 1
+    assert len(session.handler_latency) == 20
+
+
+def test_worker_drops_oldest_window_of_the_same_session():
+    first, second = BlockingSession("AA:BB", timebase='count'), BlockingSession("CC:DD", timebase='count')
+    second.release.set()
+    worker = ProcessingWorker(maxsize=2, policy='coalesce').start()
+    worker.submit(first, window(0))
+    assert first.started.wait(5)
+    worker.submit(first, window(1))
+    worker.submit(second, window(10))
+    worker.submit(second, window(11))  # 다른 장치의 창(1)이 아닌 같은 장치의 창(10)을 버림
+    worker.submit(first, window(2))
+    worker.submit(first, window(3))
+    metrics = worker.metrics()
+    first.release.set()
+    worker.stop(timeout=5)
+    assert first.processed == [[0], [3]] and second.processed == [[11]]
+    assert metrics['dropped'] == 3 and metrics['coalesced'] == 0
+
+    # 같은 세션의 대기 창이 없으면 큐 전체에서 가장 오래된 창을 버림
+    first, second = BlockingSession("AA:BB"), BlockingSession("CC:DD")
+    second.release.set()
+    worker = ProcessingWorker(maxsize=1, policy='drop_oldest').start()
+    worker.submit(first, window(0))
+    assert first.started.wait(5)
+    worker.submit(first, window(1))
+    worker.submit(second, window(10))
+    first.release.set()
+    worker.stop(timeout=5)
+    assert first.processed == [[0]] and second.processed == [[10]]
@@ -1,15 +1,14 @@
 import asyncio
 from PySide6.QtCore import QTimer
-from bleak import BleakScanner, BleakClient
 from PySide6.QtWidgets import QApplication, QMainWindow, QPushButton, QLabel, QListWidget, QVBoxLayout, QHBoxLayout, \
     QWidget, QMessageBox
 from qasync import QEventLoop, asyncSlot
-from scipy.interpolate import interp1d
-import numpy as np
-import time
 from newert_pro import HeartRateAnalyzer
 from license_manager import LicenseManager
-from emoconnect_utils import UUIDs, DataParser
+from emoconnect_session import SensorSession, scan_devices
+from emoconnect_transport import EmulatedTransport
+from emoconnect_worker import ProcessingWorker
+from emoconnect_qt import SessionSignals
 
 class BleController(QMainWindow):
     def __init__(self):
@@ -24,18 +23,18 @@ class BleController(QMainWindow):
         self.data_queue = []
         self.address = ''
         self.device_id = ''
-        self.client = None
-
-        # Buffers for data and timing
-        self.ppg_buffer = []
-        self.acc_buffer = []
-        self.gyro_buffer = []
-        self.mag_buffer = []
-        self.last_timestamp = time.time()
+        # BLE connection, buffering and the 1-second processing cycle live in SensorSession
+        self.session = None
+        # Signal processing runs on a worker thread; results come back to the UI thread as Qt signals
+        self.worker = ProcessingWorker(maxsize=4, policy='coalesce').start()
+        self.signals = SessionSignals(self.worker)
+        self.signals.result_ready.connect(self.on_session_result)
+        self.signals.metrics_updated.connect(self.on_worker_metrics)
 
         # Timer 설정
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.generate_test_data)
+        self.test_emulator = EmulatedTransport()
 
         # UI 구성
         self.device_list = QListWidget()
@@ -108,10 +107,8 @@ class BleController(QMainWindow):
             QMessageBox.critical(self, "스캔 오류", "장치 스캔 중 오류가 발생했습니다.")
 
     async def scan_devices(self):
-        devices = await BleakScanner.discover()
-        for device in devices:
-            if device.name and (device.name.startswith("VitalTrack") or device.name.startswith("EmoConnect")):
-                self.device_list.addItem(f"{device.name} - {device.address}")
+        for name, address in await scan_devices():
+            self.device_list.addItem(f"{name} - {address}")
 
     @asyncSlot()
     async def connect_to_device(self):
@@ -128,19 +125,21 @@ class BleController(QMainWindow):
 
     async def connect_and_receive_data(self, address):
         try:
-            self.client = BleakClient(address)
-            await self.client.connect()
+            # newert_pro.HeartRateAnalyzer.update_hr()는 1초에 50포인트 입력을 가정하므로 샘플 수 기준으로 보간
+            self.session = SensorSession(address, device_id=self.device_id, hr_analyzer=self.hr_analyzer,
+                                         timebase='count', worker=self.worker)
+            self.signals.attach(self.session)
+            await self.session.connect()
             QMessageBox.information(self, "연결 성공", f"{address}에 성공적으로 연결되었습니다.")
             self.disable_button_state(False)
             self.device_label.setText(f'연결된 장비: {self.device_id} {self.address}')
-            await self.client.start_notify(UUIDs().get_READ_PPG_CHAR(), self.notification_handler)
         except Exception as e:
             print(f"Error connecting to {address}: {e}")
 
     @asyncSlot()
     async def disconnect_from_device(self):
-        if self.client and self.client.is_connected:
-            await self.client.disconnect()
+        if self.session and self.session.is_connected:
+            await self.session.disconnect()
             self.device_label.setText('연결된 장비: 없음')
             self.disable_button_state(True)
             self.result_list.clear()
@@ -149,103 +148,19 @@ class BleController(QMainWindow):
         else:
             QMessageBox.warning(self, "연결 해제 오류", "현재 연결된 장치가 없습니다.")
 
-    def notification_handler(self, sender, data):
-        parser = DataParser()
-        try:
-            parsed_data = parser.parse_data(bytes(data))  # Parse the incoming data
-        except Exception as e:
-            print(f"Error parsing data: {e}")
-            return
-
-        # Log parsed data to inspect its structure if 'ppg' key is missing
-        for item in parsed_data:
-            if not all(key in item for key in ['ppg', 'acc', 'gyro', 'mag']):
-                # print(f"Unexpected data format: {item}")
-                continue  # Skip items that don't have all required keys
-
-            # Buffer data if all keys are present
-            self.ppg_buffer.append(item['ppg'])
-            self.acc_buffer.append(item['acc'])
-            self.gyro_buffer.append(item['gyro'])
-            self.mag_buffer.append(item['mag'])
-            # self.update_data_display(str(item))
-
-        # Check if one second has passed
-        current_timestamp = time.time()
-        if current_timestamp - self.last_timestamp >= 1.0:
-            # self.process_and_print_data()
-            self.process_and_print_data()
-            self.last_timestamp = current_timestamp
-
-    import numpy as np
-    from scipy.interpolate import interp1d
-
-    def process_and_print_data(self):
-        # Interpolate each buffer to 50 points, with support for 3D data
-        def interpolate_data(buffer, num_points=50):
-            buffer = np.array(buffer)  # Ensure buffer is a NumPy array
-            if len(buffer) < 2:
-                # Handle 1D and 3D data by matching the shape of buffer
-                shape = (num_points,) + buffer.shape[1:] if buffer.ndim > 1 else (num_points,)
-                result = np.tile(buffer[0], shape) if len(buffer) > 0 else np.zeros(shape)
-                return np.round(result, decimals=3)  # Round to 3 decimal places
-
-            # Interpolation
-            x = np.linspace(0, len(buffer) - 1, num=len(buffer))
-            f = interp1d(x, buffer, kind='linear', axis=0, fill_value="extrapolate")
-            x_new = np.linspace(0, len(buffer) - 1, num=num_points)
-            result = f(x_new)
-            return np.round(result, decimals=3)  # Round to 3 decimal places
-
-        # Interpolate each sensor data to 50 points, or use a default value if it fails
-        try:
-            ppg_interp = interpolate_data(self.ppg_buffer, 50).tolist()
-        except Exception as e:
-            print(f"PPG interpolation error: {e}")
-            ppg_interp = [0] * 50  # Default to zeros if interpolation fails
-
-        try:
-            acc_interp = interpolate_data(self.acc_buffer, 50).tolist()
-        except Exception as e:
-            print(f"ACC interpolation error: {e}")
-            acc_interp = [[0, 0, 0]] * 50
-
-        try:
-            gyro_interp = interpolate_data(self.gyro_buffer, 50).tolist()
-        except Exception as e:
-            print(f"Gyro interpolation error: {e}")
-            gyro_interp = [[0, 0, 0]] * 50
-
-        try:
-            mag_interp = interpolate_data(self.mag_buffer, 50).tolist()
-        except Exception as e:
-            print(f"Mag interpolation error: {e}")
-            mag_interp = [[0, 0, 0]] * 50
-
-        # Structure the result
-        result = {
-            "ppg": ppg_interp,
-            "acc": acc_interp,
-            "gyro": gyro_interp,
-            "mag": mag_interp
-        }
-
-        # Print the structured result
-        # print("Result:", result)
-
-
-        hr_value, filter_list = self.hr_analyzer.update_hr(ppg_interp, acc_interp)
-        print(f"Heart Rate: {hr_value}")
-        print(f"Filter List: {filter_list}")
-
+    def on_session_result(self, result):
+        """Print the result of one SensorSession processing cycle."""
+        print(f"Heart Rate: {result['hr']}")
+        print(f"Filter List: {result['filtered_ppg']}")
 
         self.update_data_display("1 second data has been collected. Check your terminal.")
 
-        # Clear buffers after processing
-        self.ppg_buffer.clear()
-        self.acc_buffer.clear()
-        self.gyro_buffer.clear()
-        self.mag_buffer.clear()
+    def on_worker_metrics(self, metrics):
+        """Print the worker's backpressure metrics."""
+        print(f"[Worker] processed={metrics['processed']} dropped={metrics['dropped']} "
+              f"coalesced={metrics['coalesced']} queue={metrics['queue_depth']}/{self.worker.maxsize} "
+              f"wait_p95={metrics['queue_wait_p95'] * 1000:.1f}ms "
+              f"handler_p95={metrics.get('handler_p95', 0.0) * 1000:.2f}ms")
 
     def disable_button_state(self, trigger):
         self.start_button.setDisabled(trigger)
@@ -257,22 +172,15 @@ class BleController(QMainWindow):
             self.result_list.takeItem(0)
 
     def generate_test_data(self):
-        import struct
-        import random
-        random_float = random.uniform(0.0, 100.0)
-        packed_data = struct.pack('f', random_float)
-        self.notification_handler(None, packed_data)
+        # Test data: valid 20-byte frames from the in-process emulator
+        if self.session:
+            self.session.notification_handler(None, self.test_emulator.next_notification())
 
     @asyncSlot()
     async def start_measure(self):
-        if self.client and self.client.is_connected:
+        if self.session and self.session.is_connected:
             try:
-                await self.client.write_gatt_char(UUIDs().get_WRITE_UART_CHAR(), b"\nset POWER_1V8 1\n")
-                await asyncio.sleep(0.1)
-                await self.client.write_gatt_char(UUIDs().get_WRITE_UART_CHAR(), b"\nset ppg_enable 1\n")
-                await asyncio.sleep(0.1)
-                await self.client.write_gatt_char(UUIDs().get_WRITE_UART_CHAR(), b"\nsetup ppg\n")
-                await asyncio.sleep(0.1)
+                await self.session.start_measure()
                 print("Message sent to device.")
             except Exception as e:
                 print(f"Failed to send message: {e}")
@@ -281,17 +189,16 @@ class BleController(QMainWindow):
 
     @asyncSlot()
     async def stop_measure(self):
-        if self.client and self.client.is_connected:
-            await self.client.write_gatt_char(UUIDs().get_WRITE_UART_CHAR(), b"\nset ppg_enable 0\n")
-            await asyncio.sleep(0.1)
-            await self.client.write_gatt_char(UUIDs().get_WRITE_UART_CHAR(), b"\nsetup ppg\n")
+        if self.session and self.session.is_connected:
+            await self.session.stop_measure()
             self.timer.stop()
         else:
             print('Connect device first.')
 
     def closeEvent(self, event):
-        if self.client and self.client.is_connected:
-            asyncio.run(self.client.disconnect())
+        if self.session and self.session.is_connected:
+            asyncio.run(self.session.disconnect())
+        self.worker.stop(timeout=1.0)
         event.accept()
 
 